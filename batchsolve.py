@@ -0,0 +1,103 @@
+import numpy as np
+
+from solution import UNIQUE_SOLUTION, NO_SOLUTION, INFINITE_SOLUTIONS
+
+ALL_SYSTEMS_MUST_HAVE_SAME_SHAPE_MSG = 'All systems in the batch should have the same number of equations and variables'
+
+
+# reduces a (K, m, n + 1) stack of augmented matrices to RREF in place and returns the rank of each
+def reduce_batch(augmented, tolerance=1e-10):
+    num_systems, num_eqs, width = augmented.shape
+    num_vars = width - 1
+
+    pivot_rows = np.zeros(num_systems, dtype=np.intp)
+    rows = np.arange(num_eqs)
+
+    for j in range(num_vars):
+        active = np.flatnonzero(pivot_rows < num_eqs)
+        if len(active) == 0:
+            break
+
+        r = pivot_rows[active]
+        column = np.abs(augmented[active, :, j])
+        column[rows[np.newaxis, :] < r[:, np.newaxis]] = -1.0
+        p = np.argmax(column, axis=1)
+
+        has_pivot = column[np.arange(len(active)), p] >= tolerance
+        ks, r, p = active[has_pivot], r[has_pivot], p[has_pivot]
+        if len(ks) == 0:
+            continue
+
+        # partial pivoting: move the largest remaining coefficient into the pivot row
+        pivot_row = augmented[ks, p].copy()
+        augmented[ks, p] = augmented[ks, r]
+        augmented[ks, r] = pivot_row / pivot_row[:, j][:, np.newaxis]
+
+        factors = augmented[ks, :, j].copy()
+        factors[np.arange(len(ks)), r] = 0.0
+        augmented[ks] -= factors[:, :, np.newaxis] * augmented[ks, r][:, np.newaxis, :]
+
+        pivot_rows[ks] += 1
+
+    return pivot_rows
+
+
+# coefficients is (K, m, n), constants is (K, m); returns the kind of each system as one of
+# UNIQUE_SOLUTION / NO_SOLUTION / INFINITE_SOLUTIONS and a (K, n) array of solutions,
+# NaN for every system without a unique one
+def solve_batch(coefficients, constants, tolerance=1e-10):
+    coefficients = np.asarray(coefficients, dtype=np.float64)
+    constants = np.asarray(constants, dtype=np.float64)
+
+    if coefficients.ndim != 3 or constants.shape != coefficients.shape[:2]:
+        raise Exception(ALL_SYSTEMS_MUST_HAVE_SAME_SHAPE_MSG)
+
+    num_systems, num_eqs, num_vars = coefficients.shape
+
+    augmented = np.concatenate([coefficients, constants[:, :, np.newaxis]], axis=2)
+    ranks = reduce_batch(augmented, tolerance)
+
+    zero_rows = np.arange(num_eqs)[np.newaxis, :] >= ranks[:, np.newaxis]
+    inconsistent = (zero_rows & (np.abs(augmented[:, :, -1]) >= tolerance)).any(axis=1)
+
+    kinds = np.full(num_systems, UNIQUE_SOLUTION, dtype=np.int8)
+    kinds[ranks < num_vars] = INFINITE_SOLUTIONS
+    kinds[inconsistent] = NO_SOLUTION
+
+    # a unique solution needs num_vars pivot rows, so with fewer equations than variables there
+    # is none to copy; only the min(num_eqs, num_vars) rows that can hold pivots are read
+    solutions = np.full((num_systems, num_vars), np.nan)
+    unique = kinds == UNIQUE_SOLUTION
+    k = min(num_eqs, num_vars)
+    solutions[unique, :k] = augmented[unique, :k, -1]
+
+    return kinds, solutions
+
+
+# takes a list of systems, each a list of Plane objects, and solves them with solve_batch
+def solve_planes(systems, tolerance=1e-10):
+    try:
+        num_eqs = len(systems[0])
+        for s in systems:
+            assert len(s) == num_eqs
+
+    except AssertionError:
+        raise Exception(ALL_SYSTEMS_MUST_HAVE_SAME_SHAPE_MSG)
+
+    coefficients = [[list(p.normal_vector) for p in s] for s in systems]
+    constants = [[p.constant_term for p in s] for s in systems]
+
+    return solve_batch(coefficients, constants, tolerance)
+
+
+# from plane import Plane
+# from solution import KIND_NAMES
+# p1 = Plane(normal_vector=[8.631,5.112,-1.816], constant_term=-5.113)
+# p2 = Plane(normal_vector=[4.315,11.132,-5.27], constant_term=-6.775)
+# p3 = Plane(normal_vector=[-2.158,3.01,-1.727], constant_term=-0.831)
+# p4 = Plane(normal_vector=[5.262,2.739,-9.878], constant_term=-3.441)
+# p5 = Plane(normal_vector=[5.111,6.358,7.638], constant_term=-2.152)
+# p6 = Plane(normal_vector=[2.016,-9.924,-1.367], constant_term=-9.278)
+# kinds, solutions = solve_planes([[p1,p2,p3], [p4,p5,p6]])
+# print([KIND_NAMES[k] for k in kinds])
+# print(solutions)
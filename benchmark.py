@@ -0,0 +1,486 @@
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import timeit
+import tracemalloc
+from decimal import Decimal
+
+from exactsys import ExactLinearSystem
+from hyperplane import Hyperplane
+from line import Line
+from linsys import LinearSystem
+from plane import Plane
+from vector import Vector, FLOAT, DECIMAL
+
+
+# the string/Decimal round-trips Vector used before it had numeric modes, kept as a baseline
+def legacy_plus(v, w):
+    return Vector([float("%.3f" % (Decimal(x) + Decimal(y))) for x, y in zip(v.coordinates, w.coordinates)])
+
+def legacy_minus(v, w):
+    return Vector([float("%.3f" % (x - y)) for x, y in zip(v.coordinates, w.coordinates)])
+
+def legacy_multiply(v, scalar):
+    return Vector([round(Decimal(x) * scalar, 3) for x in v.coordinates])
+
+def legacy_direction(v):
+    return legacy_multiply(v, Decimal(1.0 / v.magnitude()))
+
+def legacy_cross_product(v, w):
+    x_1, y_1, z_1 = v.coordinates
+    x_2, y_2, z_2 = w.coordinates
+    return Vector([float("%.3f" % (y_1*z_2 - y_2*z_1)),
+                   float("%.3f" % -(x_1*z_2 - x_2*z_1)),
+                   float("%.3f" % (x_1*y_2 - x_2*y_1))])
+
+
+LEGACY_OPS = {
+    'plus': lambda v, w: legacy_plus(v, w),
+    'minus': lambda v, w: legacy_minus(v, w),
+    'multiply': lambda v, w: legacy_multiply(v, Decimal('7.41')),
+    'direction': lambda v, w: legacy_direction(v),
+    'cross_product': lambda v, w: legacy_cross_product(v, w),
+}
+
+VECTOR_OPS = {
+    'plus': lambda v, w: v.plus(w),
+    'minus': lambda v, w: v.minus(w),
+    'multiply': lambda v, w: v.multiply(7.41),
+    'direction': lambda v, w: v.direction(),
+    'cross_product': lambda v, w: v.cross_product(w),
+}
+
+
+# the dict-backed layout Vector had before __slots__, for the memory comparison
+class DictVector(object):
+    def __init__(self, coordinates):
+        self.coordinates = tuple(map(float, coordinates))
+        self.dimension = len(coordinates)
+        self.mode = FLOAT
+
+
+# recomputes magnitude and direction on every call, like Vector before caching
+class UncachedVector(Vector):
+    __slots__ = ()
+
+    def magnitude(self):
+        result = sum([x * x for x in self.coordinates])
+        return result.sqrt() if self.mode == DECIMAL else math.sqrt(result)
+
+    def direction(self):
+        magnitude_result = self.magnitude()
+        return self.multiply(1 / magnitude_result)
+
+
+# returns the best time per call in microseconds
+def time_op(op, v, w, number=20000, repeat=5):
+    timings = timeit.repeat(lambda: op(v, w), number=number, repeat=repeat)
+    return min(timings) / number * 1e6
+
+
+def benchmark_vector_modes():
+    coordinates = [8.462, 7.893, -8.187]
+    coordinates_1 = [6.984, -5.975, 4.778]
+
+    rows = []
+    for name in VECTOR_OPS:
+        legacy = time_op(LEGACY_OPS[name], Vector(coordinates), Vector(coordinates_1))
+        fast = time_op(VECTOR_OPS[name], UncachedVector(coordinates, FLOAT), UncachedVector(coordinates_1, FLOAT))
+        exact = time_op(VECTOR_OPS[name], UncachedVector(coordinates, DECIMAL), UncachedVector(coordinates_1, DECIMAL))
+        rows.append((name, legacy, fast, exact))
+
+    return rows
+
+
+def print_vector_modes(rows):
+    print('{:<15}{:>12}{:>12}{:>12}{:>10}'.format('op', 'legacy us', 'float us', 'decimal us', 'speedup'))
+    for name, legacy, fast, exact in rows:
+        print('{:<15}{:>12.3f}{:>12.3f}{:>12.3f}{:>9.1f}x'.format(name, legacy, fast, exact, legacy / fast))
+
+
+# returns the bytes allocated per instance when building count vectors of dimension 3
+def bytes_per_vector(cls, count=100000):
+    coordinates = [[float(i), 1.0, 2.0] for i in range(count)]
+
+    tracemalloc.start()
+    vectors = [cls(c) for c in coordinates]
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return size / len(vectors)
+
+
+CACHED_OPS = {
+    'direction': lambda v, w: v.direction(),
+    'angle': lambda v, w: v.angle(w),
+    'projection': lambda v, w: v.projection(w),
+    'is_parallel': lambda v, w: v.is_parallel(w),
+}
+
+
+def benchmark_vector_layout():
+    coordinates = [8.462, 7.893, -8.187]
+    coordinates_1 = [6.984, -5.975, 4.778]
+
+    memory = (bytes_per_vector(DictVector), bytes_per_vector(Vector))
+
+    rows = []
+    for name, op in CACHED_OPS.items():
+        uncached = time_op(op, UncachedVector(coordinates), UncachedVector(coordinates_1))
+        cached = time_op(op, Vector(coordinates), Vector(coordinates_1))
+        rows.append((name, uncached, cached))
+
+    return memory, rows
+
+
+def print_vector_layout(memory, rows):
+    print('{:<15}{:>12}{:>12}'.format('bytes/vector', 'dict', 'slots'))
+    print('{:<15}{:>12.1f}{:>12.1f}'.format('', memory[0], memory[1]))
+    print('{:<15}{:>12}{:>12}{:>10}'.format('op', 'uncached us', 'cached us', 'speedup'))
+    for name, uncached, cached in rows:
+        print('{:<15}{:>12.3f}{:>12.3f}{:>9.1f}x'.format(name, uncached, cached, uncached / cached))
+
+
+INTEGER_SYSTEM = [([0, 1, 1], 1), ([1, -1, 1], 2), ([1, 2, -5], 3)]
+DECIMAL_SYSTEM = [([5.262, 2.739, -9.878], -3.441), ([5.111, 6.358, 7.638], -2.152),
+                  ([2.016, -9.924, -1.367], -9.278), ([2.167, -13.543, -18.883], -10.567)]
+
+
+def time_solve(cls, equations, number=500, repeat=5):
+    planes = [Plane(normal_vector=list(n), constant_term=k) for n, k in equations]
+    timings = timeit.repeat(lambda: cls(planes).characterise_results(), number=number, repeat=repeat)
+    return min(timings) / number * 1e6
+
+
+def benchmark_exact_solve():
+    rows = []
+    for name, equations in (('integer', INTEGER_SYSTEM), ('short decimal', DECIMAL_SYSTEM)):
+        rows.append((name, time_solve(LinearSystem, equations), time_solve(ExactLinearSystem, equations)))
+    return rows
+
+
+def print_exact_solve(rows):
+    print('{:<15}{:>12}{:>12}{:>10}'.format('system', 'float us', 'exact us', 'speedup'))
+    for name, inexact, exact in rows:
+        print('{:<15}{:>12.1f}{:>12.1f}{:>9.1f}x'.format(name, inexact, exact, inexact / exact))
+
+
+# the constructors Plane and Line had before the basepoint became lazy, for the construction comparison
+class EagerPlane(Plane):
+    def __init__(self, normal_vector=None, constant_term=None):
+        Plane.__init__(self, normal_vector, constant_term)
+        self.set_basepoint()
+
+
+class EagerLine(Line):
+    def __init__(self, normal_vector=None, constant_term=None):
+        Line.__init__(self, normal_vector, constant_term)
+        self.set_basepoint()
+
+
+CONSTRUCTION_COUNT = 1000000
+
+CONSTRUCTION_CASES = (
+    ('Plane, eager basepoint', EagerPlane, 3, False),
+    ('Plane', Plane, 3, False),
+    ('Plane, basepoint read', Plane, 3, True),
+    ('Line, eager basepoint', EagerLine, 2, False),
+    ('Line', Line, 2, False),
+    ('Line, basepoint read', Line, 2, True),
+)
+
+
+# returns the number of objects of cls built per second, cycling through a pool of seeded
+# random coefficients so that count can run into the millions without holding them all
+def construction_rate(cls, dimension, count=CONSTRUCTION_COUNT, read_basepoint=False, pool_size=10000):
+    rng = random.Random(SUITE_SEED)
+    pool = [(random_coordinates(rng, dimension), round(rng.uniform(-10, 10), 3)) for _ in range(pool_size)]
+
+    start = time.perf_counter()
+    for i in range(count):
+        n, k = pool[i % pool_size]
+        p = cls(n, k)
+        if read_basepoint:
+            p.basepoint
+    return count / (time.perf_counter() - start)
+
+
+def benchmark_construction(count=CONSTRUCTION_COUNT):
+    return [(name, construction_rate(cls, dimension, count, read_basepoint))
+            for name, cls, dimension, read_basepoint in CONSTRUCTION_CASES]
+
+
+def print_construction(rows, count=CONSTRUCTION_COUNT):
+    print('{:<30}{:>16}   ({} objects each)'.format('construction', 'objects/s', count))
+    for name, rate in rows:
+        print('{:<30}{:>16,.0f}'.format(name, rate))
+
+
+IMPORT_MODULES = ('vector', 'hyperplane', 'line', 'plane', 'linsys', 'solution')
+IMPORT_TIME_BUDGET = 0.05
+
+# run in a fresh interpreter, so that nothing is already in sys.modules; reports the import time
+# along with anything the imports printed, whether they loaded numpy and the Decimal precision after
+IMPORT_SCRIPT = """
+import contextlib, decimal, io, json, sys, time
+precision = decimal.getcontext().prec
+output = io.StringIO()
+start = time.perf_counter()
+with contextlib.redirect_stdout(output):
+    for name in {modules!r}:
+        __import__(name)
+seconds = time.perf_counter() - start
+print(json.dumps({{'seconds': seconds, 'output': output.getvalue(), 'numpy': 'numpy' in sys.modules,
+                  'precision_changed': decimal.getcontext().prec != precision}}))
+"""
+
+
+# returns the best import time in seconds over repeat fresh interpreters and the list of side
+# effects found: printed output, numpy loaded eagerly, or the global Decimal context changed
+def check_imports(modules=IMPORT_MODULES, repeat=5):
+    script = IMPORT_SCRIPT.format(modules=tuple(modules))
+    directory = os.path.dirname(os.path.abspath(__file__))
+
+    best = None
+    problems = []
+    for _ in range(repeat):
+        report = json.loads(subprocess.check_output([sys.executable, '-c', script], cwd=directory))
+        best = report['seconds'] if best is None else min(best, report['seconds'])
+
+        # every run is checked, since a side effect may only show up in some of them
+        found = []
+        if report['output']:
+            found.append('importing prints {!r}'.format(report['output']))
+        if report['numpy']:
+            found.append('importing loads numpy')
+        if report['precision_changed']:
+            found.append('importing changes the global Decimal precision')
+        problems += [problem for problem in found if problem not in problems]
+
+    return best, problems
+
+
+def print_imports(seconds, problems, budget=IMPORT_TIME_BUDGET):
+    print('{:<45}{:>14.3f} ms (budget {:.0f} ms)'.format('import ' + ', '.join(IMPORT_MODULES),
+                                                        seconds * 1e3, budget * 1e3))
+    if seconds > budget:
+        print('  OVER BUDGET')
+    for problem in problems:
+        print('  ' + problem)
+
+
+SUITE_DIMENSIONS = (2, 3, 10, 100, 1000)
+SUITE_SIZES = (3, 10, 25, 50, 100, 250, 500)
+SUITE_SEED = 2017
+REGRESSION_THRESHOLD = 0.25
+
+
+# returns the best time per call in microseconds; the calls per round grow until a round takes
+# min_time, and no new round starts once max_time is spent, so a 500 equation system is timed
+# a handful of times while a vector op is timed thousands of times
+def measure(func, min_time=0.05, repeat=5, max_time=2.0):
+    timer = timeit.Timer(func)
+
+    number = 1
+    elapsed = timer.timeit(number)
+    while elapsed < min_time:
+        number = max(number * 2, int(number * min_time / max(elapsed, 1e-9)))
+        elapsed = timer.timeit(number)
+
+    best = elapsed / number
+    spent = elapsed
+    for _ in range(repeat - 1):
+        if spent >= max_time:
+            break
+        elapsed = timer.timeit(number)
+        best = min(best, elapsed / number)
+        spent += elapsed
+
+    return best * 1e6
+
+
+# coefficients with 3 decimal places, like the examples in the modules, from a seeded generator
+# so that every run times the same inputs
+def random_coordinates(rng, count):
+    return [round(rng.uniform(-10, 10), 3) for _ in range(count)]
+
+
+def random_system(size, seed=SUITE_SEED):
+    rng = random.Random(seed + size)
+    return LinearSystem([Hyperplane(random_coordinates(rng, size), round(rng.uniform(-10, 10), 3))
+                         for _ in range(size)])
+
+
+# magnitude and direction are cached on the instance, so the ops that use them build a fresh
+# vector inside the timed call; the construct op gives the cost to subtract
+SUITE_VECTOR_OPS = {
+    'construct': lambda c, c_1, v, w: Vector._from_coordinates(c, FLOAT),
+    'plus': lambda c, c_1, v, w: v.plus(w),
+    'minus': lambda c, c_1, v, w: v.minus(w),
+    'multiply': lambda c, c_1, v, w: v.multiply(7.41),
+    'dot_product': lambda c, c_1, v, w: v.dot_product(w),
+    'magnitude': lambda c, c_1, v, w: Vector._from_coordinates(c, FLOAT).magnitude(),
+    'direction': lambda c, c_1, v, w: Vector._from_coordinates(c, FLOAT).direction(),
+    'angle': lambda c, c_1, v, w: Vector._from_coordinates(c, FLOAT).angle(Vector._from_coordinates(c_1, FLOAT)),
+    'projection': lambda c, c_1, v, w: v.projection(Vector._from_coordinates(c_1, FLOAT)),
+    'is_parallel': lambda c, c_1, v, w: Vector._from_coordinates(c, FLOAT).is_parallel(Vector._from_coordinates(c_1, FLOAT)),
+    'is_orthogonal': lambda c, c_1, v, w: v.is_orthogonal(w),
+}
+
+SUITE_LINE_CASES = {
+    'unique': ([7.204, 3.182], 8.68, [8.172, 4.114], 9.883),
+    'parallel': ([4.046, 2.836], 1.21, [8.092, 5.672], 3.025),
+    'coincident': ([4.046, 2.836], 1.21, [10.115, 7.09], 3.025),
+}
+
+SUITE_PLANE_CASES = {
+    'equal': ([-7.926, 8.625, -7.212], -7.952, [-15.852, 17.25, -14.424], -15.904),
+    'parallel': ([-0.412, 3.806, 0.728], -3.46, [1.03, -9.515, -1.82], 8.65),
+    'crossing': ([2.611, 5.528, 0.283], 4.6, [7.715, 8.306, 5.342], 3.76),
+}
+
+SUITE_SYSTEM_OPS = ('compute_triangular_form', 'compute_rref', 'characterise_results')
+
+
+# yields (name, function) for every case of the suite
+def suite_cases(dimensions=SUITE_DIMENSIONS, sizes=SUITE_SIZES):
+    rng = random.Random(SUITE_SEED)
+
+    for d in dimensions:
+        c = tuple(float(x) for x in random_coordinates(rng, d))
+        c_1 = tuple(float(x) for x in random_coordinates(rng, d))
+        v, w = Vector(c), Vector(c_1)
+        ops = dict(SUITE_VECTOR_OPS)
+        if d == 3:
+            ops['cross_product'] = lambda c, c_1, v, w: v.cross_product(w)
+        for name, op in ops.items():
+            yield 'vector.{}.d{}'.format(name, d), (lambda op=op, c=c, c_1=c_1, v=v, w=w: op(c, c_1, v, w))
+
+    for name, (n, k, n_1, k_1) in SUITE_LINE_CASES.items():
+        line, line_1 = Line(n, k), Line(n_1, k_1)
+        yield 'line.find_intersection.{}'.format(name), (lambda line=line, line_1=line_1: line.find_intersection(line_1))
+
+    yield 'line.construct', lambda: Line([7.204, 3.182], 8.68)
+    yield 'plane.construct', lambda: Plane([-0.412, 3.806, 0.728], -3.46)
+
+    for name, (n, k, n_1, k_1) in SUITE_PLANE_CASES.items():
+        plane, plane_1 = Plane(n, k), Plane(n_1, k_1)
+        yield 'plane.are_equal.{}'.format(name), (lambda plane=plane, plane_1=plane_1: plane.are_equal(plane_1))
+
+    for size in sizes:
+        system = random_system(size)
+        for op in SUITE_SYSTEM_OPS:
+            yield 'linsys.{}.n{}'.format(op, size), getattr(system, op)
+
+
+def run_suite(dimensions=SUITE_DIMENSIONS, sizes=SUITE_SIZES, pattern=None, verbose=False):
+    results = {}
+    for name, func in suite_cases(dimensions, sizes):
+        if pattern and pattern not in name:
+            continue
+        results[name] = measure(func)
+        if verbose:
+            print('{:<45}{:>14.3f} us'.format(name, results[name]))
+
+    return {
+        'metadata': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'platform': platform.platform(),
+            'seed': SUITE_SEED,
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+    }
+
+
+# returns (name, baseline us, current us, ratio, is_regression) for every case found in both runs
+def compare(current, baseline, threshold=REGRESSION_THRESHOLD):
+    rows = []
+    for name, timing in sorted(current['results'].items()):
+        if name not in baseline['results']:
+            continue
+        previous = baseline['results'][name]
+        ratio = timing / previous
+        rows.append((name, previous, timing, ratio, ratio > 1 + threshold))
+    return rows
+
+
+def print_comparison(rows):
+    print('{:<45}{:>14}{:>14}{:>9}'.format('case', 'baseline us', 'current us', 'ratio'))
+    for name, previous, timing, ratio, regressed in rows:
+        print('{:<45}{:>14.3f}{:>14.3f}{:>8.2f}x{}'.format(name, previous, timing, ratio,
+                                                          '  REGRESSION' if regressed else ''))
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description='Times the Vector, Line, Plane and LinearSystem hot paths.')
+    parser.add_argument('--suite', action='store_true',
+                        help='run the benchmark suite instead of printing the comparison tables')
+    parser.add_argument('--check-imports', action='store_true',
+                        help='time importing the core modules and check that it has no side effects')
+    parser.add_argument('--construction', type=int, nargs='?', const=CONSTRUCTION_COUNT,
+                        help='measure how many Line and Plane objects are built per second, out of this many')
+    parser.add_argument('--import-budget', type=float, default=IMPORT_TIME_BUDGET,
+                        help='import time budget in seconds for --check-imports')
+    parser.add_argument('--dimensions', type=int, nargs='+', default=list(SUITE_DIMENSIONS),
+                        help='vector dimensions to time')
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(SUITE_SIZES),
+                        help='numbers of equations (and variables) of the linear systems to time')
+    parser.add_argument('--filter', dest='pattern', help='only run the cases whose name contains this')
+    parser.add_argument('--output', help='write the results to this JSON file')
+    parser.add_argument('--baseline', help='compare against the results in this JSON file')
+    parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD,
+                        help='slowdown ratio above 1 that counts as a regression')
+    return parser.parse_args(argv)
+
+
+# exits with status 1 when a case is slower than the baseline by more than the threshold, or when
+# importing the core modules is over budget or has side effects
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.check_imports:
+        seconds, problems = check_imports()
+        print_imports(seconds, problems, args.import_budget)
+        return 1 if problems or seconds > args.import_budget else 0
+
+    if args.construction:
+        print_construction(benchmark_construction(args.construction), args.construction)
+        return 0
+
+    if not args.suite:
+        print_vector_modes(benchmark_vector_modes())
+        print('')
+        print_vector_layout(*benchmark_vector_layout())
+        print('')
+        print_exact_solve(benchmark_exact_solve())
+        return 0
+
+    current = run_suite(args.dimensions, args.sizes, args.pattern, verbose=True)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(current, f, indent=2, sort_keys=True)
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+
+    rows = compare(current, baseline, args.threshold)
+    print('')
+    print_comparison(rows)
+    return 1 if any(regressed for name, previous, timing, ratio, regressed in rows) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,240 @@
+from decimal import Decimal
+
+import numpy as np
+
+from hyperplane import Hyperplane
+from solution import UniqueSolution, NoSolution, ParametricSolution
+from vector import Vector
+
+
+class DenseLinearSystem(object):
+
+    ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG = 'All planes in the system should live in the same dimension'
+    NO_SOLUTIONS_MSG = 'No solutions'
+    INF_SOLUTIONS_MSG = 'Infinitely many solutions'
+
+    # stores the system as one (num_eqs, dimension + 1) augmented matrix, constants in the last column
+    def __init__(self, planes, tolerance=1e-10):
+        try:
+            d = planes[0].dimension
+            for p in planes:
+                assert p.dimension == d
+
+            rows = [list(p.normal_vector) + [p.constant_term] for p in planes]
+            self.matrix = np.array(rows, dtype=np.float64)
+            self.dimension = d
+            self.tolerance = tolerance
+
+        except AssertionError:
+            raise Exception(self.ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG)
+
+    @classmethod
+    def from_matrix(cls, coefficients, constants, tolerance=1e-10):
+        coefficients = np.asarray(coefficients, dtype=np.float64)
+        constants = np.asarray(constants, dtype=np.float64)
+
+        system = cls.__new__(cls)
+        system.matrix = np.column_stack([coefficients, constants])
+        system.dimension = coefficients.shape[1]
+        system.tolerance = tolerance
+        return system
+
+    # wraps an (num_eqs, dimension + 1) augmented matrix, constants in the last column; with
+    # copy=False a float64 array is used as it is, so a freshly loaded matrix is not duplicated
+    @classmethod
+    def from_augmented(cls, matrix, tolerance=1e-10, copy=True):
+        system = cls.__new__(cls)
+        system.matrix = np.array(matrix, dtype=np.float64, copy=True if copy else None)
+        system.dimension = system.matrix.shape[1] - 1
+        system.tolerance = tolerance
+        return system
+
+    def copy(self):
+        return DenseLinearSystem.from_matrix(self.coefficients, self.constants, self.tolerance)
+
+    @property
+    def coefficients(self):
+        return self.matrix[:, :-1]
+
+    @property
+    def constants(self):
+        return self.matrix[:, -1]
+
+    @property
+    def planes(self):
+        return [self[i] for i in range(len(self))]
+
+
+    def swap_rows(self, row1, row2):
+        self.matrix[[row1, row2]] = self.matrix[[row2, row1]]
+
+
+    def multiply_coefficient_and_row(self, coefficient, row):
+        self.matrix[row] *= float(coefficient)
+
+
+    def add_multiple_times_row_to_row(self, coefficient, row_to_add, row_to_be_added_to):
+        self.matrix[row_to_be_added_to] += float(coefficient) * self.matrix[row_to_add]
+
+    # with pivoting the largest remaining coefficient in each column is used as pivot,
+    # without it the first nonzero one is, which reproduces LinearSystem.compute_triangular_form
+    def compute_triangular_form(self, pivoting=True):
+        system = self.copy()
+        a = system.matrix
+
+        num_eqs = len(system)
+        num_vars = system.dimension
+
+        j = 0
+
+        for i in range(num_eqs):
+
+            while j < num_vars:
+                column = np.abs(a[i:, j])
+                if pivoting:
+                    k = i + int(np.argmax(column))
+                else:
+                    nonzero = np.flatnonzero(column >= self.tolerance)
+                    k = i + int(nonzero[0]) if len(nonzero) else i
+
+                if abs(a[k, j]) < self.tolerance:
+                    j += 1
+                    continue
+
+                if k != i:
+                    system.swap_rows(i, k)
+
+                system.clear_coefficients_below(i, j)
+                j += 1
+                break
+
+        return system
+
+    def compute_rref(self, pivoting=True):
+        tf = self.compute_triangular_form(pivoting)
+        num_eqs = len(tf)
+        leading_term_indices = tf.indices_of_first_nonzero_terms_in_each_row()
+
+        for i in range(num_eqs)[::-1]:
+            j = leading_term_indices[i]
+            if j < 0:
+                continue
+
+            tf.scale_leading_term_coeff_to_1(i, j)
+            tf.clear_coefficients_above(i, j)
+
+        return tf
+
+    # same strings as LinearSystem.characterise_results, but a row only counts as 0 = k
+    # when all of its coefficients vanish, not when they happen to sum to zero
+    def characterise_results(self):
+        rref = self.compute_rref()
+        leading_term_indices = rref.indices_of_first_nonzero_terms_in_each_row()
+
+        zero_rows = leading_term_indices < 0
+        if (np.abs(rref.constants[zero_rows]) >= self.tolerance).any():
+            return 'No Solution'
+
+        pivot_rows = np.flatnonzero(~zero_rows)
+        if len(pivot_rows) < self.dimension:
+            return 'Infinite solutions'
+
+        values = rref.constants[pivot_rows]
+        values[np.abs(values) < self.tolerance] = 0.0
+        solution = [round(Decimal(x), 3) for x in values.tolist()]
+        return str(solution)
+
+    # returns a UniqueSolution, NoSolution or ParametricSolution from one elimination; for
+    # infinite solutions the basepoint is the particular solution with every free variable at 0 and
+    # each free variable gets a null space direction with a 1 in its own column
+    def solve(self):
+        rref = self.compute_rref()
+        leading_term_indices = rref.indices_of_first_nonzero_terms_in_each_row()
+
+        zero_rows = leading_term_indices < 0
+        if (np.abs(rref.constants[zero_rows]) >= self.tolerance).any():
+            return NoSolution()
+
+        pivot_rows = np.flatnonzero(~zero_rows)
+        pivot_columns = leading_term_indices[pivot_rows]
+
+        basepoint = np.zeros(self.dimension)
+        basepoint[pivot_columns] = rref.constants[pivot_rows]
+        if len(pivot_rows) == self.dimension:
+            return UniqueSolution(Vector(basepoint.tolist()))
+
+        free_variables = np.setdiff1d(np.arange(self.dimension), pivot_columns)
+        basis = np.zeros((len(free_variables), self.dimension))
+        basis[np.arange(len(free_variables)), free_variables] = 1.0
+        basis[:, pivot_columns] = -rref.coefficients[pivot_rows][:, free_variables].T
+
+        return ParametricSolution(Vector(basepoint.tolist()), [Vector(row) for row in basis.tolist()],
+                                  free_variables.tolist())
+
+    def scale_leading_term_coeff_to_1(self, row, col):
+        self.matrix[row] /= self.matrix[row, col]
+
+    # eliminates column col from every row above row in one vectorized update
+    def clear_coefficients_above(self, row, col):
+        a = self.matrix
+        a[:row] -= np.outer(a[:row, col], a[row])
+        a[:row, col] = 0.0
+
+
+    def swap_for_nonzero_coefficient_eq(self, row, col):
+        nonzero = np.flatnonzero(np.abs(self.matrix[row + 1:, col]) >= self.tolerance)
+        if len(nonzero) == 0:
+            return False
+
+        self.swap_rows(row, row + 1 + int(nonzero[0]))
+        return True
+
+    # eliminates column col from every row below row in one vectorized update
+    def clear_coefficients_below(self, row, col):
+        a = self.matrix
+        alphas = a[row + 1:, col] / a[row, col]
+        a[row + 1:] -= np.outer(alphas, a[row])
+        a[row + 1:, col] = 0.0
+
+
+    def indices_of_first_nonzero_terms_in_each_row(self):
+        nonzero = np.abs(self.coefficients) >= self.tolerance
+        indices = np.argmax(nonzero, axis=1)
+        indices[~nonzero.any(axis=1)] = -1
+
+        return indices
+
+
+    def __len__(self):
+        return self.matrix.shape[0]
+
+
+    def __getitem__(self, i):
+        row = self.matrix[i].tolist()
+        return Hyperplane(normal_vector=row[:-1], constant_term=Decimal(row[-1]))
+
+
+    def __setitem__(self, i, x):
+        try:
+            assert x.dimension == self.dimension
+            self.matrix[i, :-1] = list(x.normal_vector)
+            self.matrix[i, -1] = x.constant_term
+
+        except AssertionError:
+            raise Exception(self.ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG)
+
+
+    def __str__(self):
+        ret = 'Linear System:\n'
+        temp = ['Equation {}: {}'.format(i+1,p) for i,p in enumerate(self.planes)]
+        ret += '\n'.join(temp)
+        return ret
+
+
+# p1 = Plane(normal_vector=[5.262,2.739,-9.878], constant_term=-3.441)
+# p2 = Plane(normal_vector=[5.111,6.358,7.638], constant_term=-2.152)
+# p3 = Plane(normal_vector=[2.016,-9.924,-1.367], constant_term=-9.278)
+# p4 = Plane(normal_vector=[2.167,-13.543,-18.883], constant_term=-10.567)
+# s = DenseLinearSystem([p1,p2,p3,p4])
+# print(s.compute_rref())
+# print(s.characterise_results())
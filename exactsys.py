@@ -0,0 +1,155 @@
+import math
+from decimal import Decimal
+from fractions import Fraction
+
+from hyperplane import Hyperplane
+
+
+# converts a coefficient to an exact Fraction; floats are read by their shortest repr,
+# so 0.1 becomes 1/10 rather than the nearest binary fraction; going through the integer ratio
+# skips the slow generic path of the Fraction constructor
+def to_fraction(x):
+    if isinstance(x, float):
+        return Fraction(*Decimal(repr(x)).as_integer_ratio())
+    if isinstance(x, Decimal):
+        return Fraction(*x.as_integer_ratio())
+    return Fraction(x)
+
+
+class ExactLinearSystem(object):
+
+    ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG = 'All planes in the system should live in the same dimension'
+    NO_SOLUTIONS_MSG = 'No solutions'
+    INF_SOLUTIONS_MSG = 'Infinitely many solutions'
+
+    # stores every equation as a row of Fractions, constant term last
+    def __init__(self, planes):
+        try:
+            d = planes[0].dimension
+            for p in planes:
+                assert p.dimension == d
+
+            self.rows = [[to_fraction(x) for x in p.normal_vector] + [to_fraction(p.constant_term)] for p in planes]
+            self.dimension = d
+
+        except AssertionError:
+            raise Exception(self.ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG)
+
+    @classmethod
+    def from_rows(cls, rows, dimension):
+        system = cls.__new__(cls)
+        system.rows = rows
+        system.dimension = dimension
+        return system
+
+    # scales every row by the lcm of its denominators so the augmented matrix is all integers
+    def integer_rows(self):
+        result = []
+        for row in self.rows:
+            scale = math.lcm(*[x.denominator for x in row])
+            result.append([x.numerator * (scale // x.denominator) for x in row])
+        return result
+
+    # fraction-free (Bareiss) Gauss-Jordan elimination on the integer rows: every division is
+    # exact, so entries stay integers of bounded size; returns the reduced rows, the pivot
+    # column of each pivot row and the common value all pivots end up with
+    def bareiss_reduce(self):
+        a = self.integer_rows()
+        num_eqs = len(a)
+        num_vars = self.dimension
+
+        previous_pivot = 1
+        pivot_columns = []
+        r = 0
+
+        for j in range(num_vars):
+            if r == num_eqs:
+                break
+
+            p = next((k for k in range(r, num_eqs) if a[k][j] != 0), None)
+            if p is None:
+                continue
+            a[r], a[p] = a[p], a[r]
+
+            pivot_row = a[r]
+            pivot = pivot_row[j]
+            for i in range(num_eqs):
+                if i == r:
+                    continue
+                row = a[i]
+                factor = row[j]
+                if factor == 0:
+                    a[i] = [pivot * x // previous_pivot for x in row]
+                else:
+                    a[i] = [(pivot * x - factor * y) // previous_pivot for x, y in zip(row, pivot_row)]
+
+            previous_pivot = pivot
+            pivot_columns.append(j)
+            r += 1
+
+        return a, pivot_columns, previous_pivot
+
+    def compute_rref(self):
+        a, pivot_columns, pivot = self.bareiss_reduce()
+        rows = [[Fraction(x, pivot) for x in row] for row in a]
+        return ExactLinearSystem.from_rows(rows, self.dimension)
+
+    def rank(self):
+        a, pivot_columns, pivot = self.bareiss_reduce()
+        return len(pivot_columns)
+
+    # returns the exact solution as a list of Fractions, or a message when it is not unique
+    def exact_solution(self):
+        a, pivot_columns, pivot = self.bareiss_reduce()
+        rank = len(pivot_columns)
+
+        if any(row[-1] != 0 for row in a[rank:]):
+            return self.NO_SOLUTIONS_MSG
+        if rank < self.dimension:
+            return self.INF_SOLUTIONS_MSG
+
+        return [Fraction(row[-1], pivot) for row in a[:rank]]
+
+    # same strings as LinearSystem.characterise_results, decided with exact arithmetic
+    def characterise_results(self):
+        solution = self.exact_solution()
+
+        if solution == self.NO_SOLUTIONS_MSG:
+            return 'No Solution'
+        if solution == self.INF_SOLUTIONS_MSG:
+            return 'Infinite solutions'
+
+        return str([round(Decimal(x.numerator) / Decimal(x.denominator), 3) for x in solution])
+
+
+    def __len__(self):
+        return len(self.rows)
+
+
+    def __getitem__(self, i):
+        row = self.rows[i]
+        return Hyperplane(normal_vector=[float(x) for x in row[:-1]], constant_term=Decimal(row[-1].numerator) / Decimal(row[-1].denominator))
+
+
+    def __setitem__(self, i, x):
+        try:
+            assert x.dimension == self.dimension
+            self.rows[i] = [to_fraction(c) for c in x.normal_vector] + [to_fraction(x.constant_term)]
+
+        except AssertionError:
+            raise Exception(self.ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG)
+
+
+    def __str__(self):
+        ret = 'Linear System:\n'
+        temp = ['Equation {}: {}'.format(i+1, self[i]) for i in range(len(self))]
+        ret += '\n'.join(temp)
+        return ret
+
+
+# p1 = Plane(normal_vector=[0,1,1], constant_term=1)
+# p2 = Plane(normal_vector=[1,-1,1], constant_term=2)
+# p3 = Plane(normal_vector=[1,2,-5], constant_term=3)
+# s = ExactLinearSystem([p1,p2,p3])
+# print(s.exact_solution())
+# print(s.characterise_results())
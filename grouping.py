@@ -0,0 +1,169 @@
+import math
+from bisect import bisect_left, insort
+
+from vector import Vector
+
+CANNOT_CANONICALIZE_ZERO_NORMAL_MSG = 'Cannot canonicalize a line or plane with a zero normal vector'
+
+# cluster hashes values on a grid this many tolerances wide, so few values lie near a cell boundary
+CELL_TOLERANCES = 64
+
+# beyond this many components near a cell boundary, probing every combination of neighbouring
+# cells costs more than scanning the groups instead
+MAX_BOUNDARY_COMPONENTS = 8
+
+
+# returns the unit normal and offset of a line or plane, signed so the first component of
+# the normal that is not near zero is positive; parallel hyperplanes share the same unit
+# normal and equal ones also share the offset
+def canonical_form(hyperplane, tolerance=1e-10):
+    # hyperplanes keep their canonical form for their own tolerance once it is worked out
+    if getattr(hyperplane, 'tolerance', None) == tolerance and hasattr(hyperplane, 'canonical_form'):
+        return hyperplane.canonical_form()
+    return canonical_coefficients(hyperplane.normal_vector, hyperplane.constant_term, tolerance)
+
+
+def canonical_coefficients(n, constant_term, tolerance=1e-10):
+    if isinstance(n, Vector):
+        n = n.coordinates
+    n = [float(x) for x in n]
+
+    magnitude = math.sqrt(sum([x * x for x in n]))
+    if magnitude < tolerance:
+        raise Exception(CANNOT_CANONICALIZE_ZERO_NORMAL_MSG)
+
+    sign = 1.0
+    for x in n:
+        if abs(x) / magnitude >= tolerance:
+            sign = 1.0 if x > 0 else -1.0
+            break
+
+    unit = tuple([sign * x / magnitude for x in n])
+    offset = sign * float(constant_term) / magnitude
+    return unit, offset
+
+
+# cells are centred on the multiples of cell_size, so values such as 0 and 1 sit in the middle of one
+def cell_key(values, cell_size):
+    return tuple([int(math.floor(v / cell_size + 0.5)) for v in values])
+
+
+# returns the cells that values within tolerance of values can lie in: the cell of values and, for
+# every component within tolerance of a boundary of it, the cell across that boundary, so the
+# count only grows with the components that are actually near one; returns None when more than
+# max_boundary_components are; cell_size must be at least twice the tolerance
+def neighbour_cells(values, cell_size, tolerance, max_boundary_components=MAX_BOUNDARY_COMPONENTS):
+    key = cell_key(values, cell_size)
+    margin = tolerance / cell_size
+
+    steps = []
+    for i, (v, k) in enumerate(zip(values, key)):
+        position = v / cell_size - k
+        if position - margin <= -0.5:
+            steps.append((i, -1))
+        elif position + margin >= 0.5:
+            steps.append((i, 1))
+
+    if len(steps) > max_boundary_components:
+        return None
+
+    cells = [key]
+    for i, step in steps:
+        cells += [c[:i] + (c[i] + step,) + c[i + 1:] for c in cells]
+    return cells
+
+
+def _near(values, values_1, tolerance):
+    return all(abs(v - v_1) < tolerance for v, v_1 in zip(values, values_1))
+
+
+# the groups whose first value is within tolerance of the first of values, in sorted order
+def _scan(order, groups, values, tolerance):
+    for first, g in order[bisect_left(order, (values[0] - tolerance, -1)):]:
+        if first >= values[0] + tolerance:
+            return None
+        if _near(values, groups[g][0], tolerance):
+            return g
+    return None
+
+
+# clusters (values, item) entries whose values agree within tolerance in every component,
+# in the same sense as MyDecimal.is_near_zero: abs(a - b) < tolerance;
+# values are hashed on a grid and only the cells across the boundaries they are near are searched,
+# so the cost is linear in the number of entries; values near too many boundaries at once are
+# matched by a scan of the groups sorted by their first value instead
+def cluster(entries, tolerance=1e-10):
+    cell_size = CELL_TOLERANCES * tolerance
+    cells = {}
+    order = []
+    groups = []
+
+    for values, item in entries:
+        probes = neighbour_cells(values, cell_size, tolerance) if values else [()]
+
+        group = None
+        if probes is None:
+            group = _scan(order, groups, values, tolerance)
+        else:
+            for cell in probes:
+                for g in cells.get(cell, []):
+                    if _near(values, groups[g][0], tolerance):
+                        group = g
+                        break
+                if group is not None:
+                    break
+
+        if group is None:
+            group = len(groups)
+            groups.append((values, []))
+            cells.setdefault(cell_key(values, cell_size), []).append(group)
+            if values:
+                insort(order, (values[0], group))
+
+        groups[group][1].append(item)
+
+    return [members for values, members in groups]
+
+
+def _canonical_entries(hyperplanes, tolerance):
+    zero = []
+    entries = []
+    for h in hyperplanes:
+        try:
+            entries.append((canonical_form(h, tolerance), h))
+
+        except Exception as e:
+            if str(e) == CANNOT_CANONICALIZE_ZERO_NORMAL_MSG:
+                zero.append(h)
+            else:
+                raise e
+
+    return entries, zero
+
+
+# returns the lines or planes grouped so that every group holds mutually parallel members;
+# members with a zero normal vector form one group of their own
+def group_parallel(hyperplanes, tolerance=1e-10):
+    entries, zero = _canonical_entries(hyperplanes, tolerance)
+    groups = cluster([(unit, h) for (unit, offset), h in entries], tolerance)
+
+    if zero:
+        groups.append(zero)
+    return groups
+
+
+# returns the lines or planes grouped so that every group holds members describing the same set
+def group_equal(hyperplanes, tolerance=1e-10):
+    entries, zero = _canonical_entries(hyperplanes, tolerance)
+    groups = cluster([(unit + (offset,), h) for (unit, offset), h in entries], tolerance)
+
+    for same_constant in cluster([((float(h.constant_term),), h) for h in zero], tolerance):
+        groups.append(same_constant)
+    return groups
+
+
+# from plane import Plane
+# planes = [Plane([-0.412, 3.806, 0.728], -3.46), Plane([1.03, -9.515, -1.82], 8.65),
+#           Plane([-7.926, 8.625, -7.212], -7.952), Plane([-2.642, 2.875, -2.404], -2.443)]
+# print([[str(p) for p in g] for g in group_parallel(planes)])
+# print([[str(p) for p in g] for g in group_equal(planes)])
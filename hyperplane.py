@@ -0,0 +1,272 @@
+from decimal import Decimal, getcontext, localcontext
+
+from grouping import canonical_coefficients
+from vector import Vector
+
+DECIMAL_PRECISION = 30
+
+# the coefficients are floats whatever the Decimal precision, so no more digits than this are trusted
+FLOAT_DIGITS = 12
+
+
+# the context the Decimal arithmetic of hyperplanes and systems runs in; it is entered per call
+# instead of being set on the global context, so importing a module leaves the caller's settings
+# alone, and since Decimal contexts are per thread, solves on different threads can each use
+# their own precision
+def decimal_context(precision=DECIMAL_PRECISION):
+    context = getcontext().copy()
+    context.prec = precision
+    return localcontext(context)
+
+
+# how close to 0 a value worked out with precision Decimal digits must be to count as 0: two digits
+# short of the precision, and 1e-10 from FLOAT_DIGITS digits up
+def default_tolerance(precision=DECIMAL_PRECISION):
+    return 10.0 ** -(min(precision, FLOAT_DIGITS) - 2)
+
+
+class Hyperplane(object):
+
+    NO_NONZERO_ELTS_FOUND_MSG = 'No nonzero elements found'
+    EITHER_DIM_OR_NORMAL_VEC_MUST_BE_PROVIDED_MSG = 'Either the dimension of the hyperplane or the normal vector must be provided'
+    NORMAL_VEC_MUST_MATCH_DIM_MSG = 'The normal vector must have as many coordinates as the dimension of the hyperplane'
+
+    # the values worked out from the coefficients on first use and kept until they change
+    CACHED_ATTRIBUTES = ('_basepoint', '_normal', '_unit_normal', '_canonical_form')
+
+    # the equation normal_vector . x = constant_term in any number of dimensions;
+    # the dimension is taken from the normal vector when it is not given; precision is the number
+    # of Decimal digits its arithmetic runs with and tolerance is how close to 0 counts as 0
+    def __init__(self, normal_vector=None, constant_term=None, dimension=None,
+                 precision=DECIMAL_PRECISION, tolerance=1e-10):
+        if isinstance(normal_vector, Vector):
+            normal_vector = list(normal_vector.coordinates)
+
+        if not normal_vector:
+            if not dimension:
+                raise Exception(self.EITHER_DIM_OR_NORMAL_VEC_MUST_BE_PROVIDED_MSG)
+            normal_vector = [0]*dimension
+
+        if dimension and len(normal_vector) != dimension:
+            raise Exception(self.NORMAL_VEC_MUST_MATCH_DIM_MSG)
+
+        self.dimension = len(normal_vector)
+        self.normal_vector = normal_vector
+        self.precision = precision
+        self.tolerance = tolerance
+
+        if not constant_term:
+            constant_term = Decimal(0)
+        self.constant_term = Decimal(constant_term)
+
+    # the basepoint is only worked out when it is first read, since most hyperplanes built by
+    # row operations never need it
+    @property
+    def basepoint(self):
+        try:
+            return self._basepoint
+
+        except AttributeError:
+            self.set_basepoint()
+            return self._basepoint
+
+    @basepoint.setter
+    def basepoint(self, value):
+        self._basepoint = value
+
+    # the normal vector as a Vector, which in turn caches its magnitude and direction
+    @property
+    def normal(self):
+        try:
+            return self._normal
+
+        except AttributeError:
+            self._normal = Vector(self.normal_vector)
+            return self._normal
+
+    # the normal scaled to unit length, None when the normal is the zero vector
+    @property
+    def unit_normal(self):
+        try:
+            return self._unit_normal
+
+        except AttributeError:
+            normal = self.normal
+            self._unit_normal = None if normal.is_zero(self.tolerance) else normal.direction()
+            return self._unit_normal
+
+    # returns (unit normal, offset) signed so the first nonzero component of the normal is
+    # positive, as grouping.canonical_form does, worked out once for this hyperplane's tolerance
+    def canonical_form(self):
+        try:
+            return self._canonical_form
+
+        except AttributeError:
+            self._canonical_form = canonical_coefficients(self.normal_vector, self.constant_term, self.tolerance)
+            return self._canonical_form
+
+    # must be called after changing normal_vector or constant_term in place, so that the
+    # values worked out from them are recomputed on their next use
+    def coefficients_changed(self):
+        for name in self.CACHED_ATTRIBUTES:
+            self.__dict__.pop(name, None)
+
+    # a hyperplane with its own list of coefficients, sharing only the immutable numbers in it,
+    # so that in place row operations on the copy leave this one alone
+    def copy(self):
+        result = object.__new__(type(self))
+        result.__dict__.update(self.__dict__)
+        result.normal_vector = list(self.normal_vector)
+        return result
+
+
+    def set_basepoint(self):
+        try:
+            n = self.normal_vector
+            c = self.constant_term
+            basepoint_coords = [0]*self.dimension
+
+            initial_index = Hyperplane.first_nonzero_index(n, self.tolerance)
+            initial_coefficient = n[initial_index]
+
+            with decimal_context(self.precision):
+                basepoint_coords[initial_index] = c/Decimal(initial_coefficient)
+            self.basepoint = Vector(basepoint_coords)
+
+        except Exception as e:
+            if str(e) == Hyperplane.NO_NONZERO_ELTS_FOUND_MSG:
+                self.basepoint = None
+            else:
+                raise e
+
+
+    def __str__(self):
+
+        num_decimal_places = 3
+
+        def write_coefficient(coefficient, is_initial_term=False):
+            coefficient = round(coefficient, num_decimal_places)
+            if coefficient % 1 == 0:
+                coefficient = int(coefficient)
+
+            output = ''
+
+            if coefficient < 0:
+                output += '-'
+            if coefficient > 0 and not is_initial_term:
+                output += '+'
+
+            if not is_initial_term:
+                output += ' '
+
+            if abs(coefficient) != 1:
+                output += '{}'.format(abs(coefficient))
+
+            return output
+
+        n = self.normal_vector
+
+        try:
+            initial_index = Hyperplane.first_nonzero_index(n, self.tolerance)
+            terms = [write_coefficient(n[i], is_initial_term=(i==initial_index)) + 'x_{}'.format(i+1)
+                     for i in range(self.dimension) if round(n[i], num_decimal_places) != 0]
+            output = ' '.join(terms)
+
+        except Exception as e:
+            if str(e) == self.NO_NONZERO_ELTS_FOUND_MSG:
+                output = '0'
+            else:
+                raise e
+
+        constant = round(self.constant_term, num_decimal_places)
+        if constant % 1 == 0:
+            constant = int(constant)
+        output += ' = {}'.format(constant)
+
+        return output
+
+
+    @staticmethod
+    def first_nonzero_index(iterable, tolerance=1e-10):
+        for k, item in enumerate(iterable):
+            if not MyDecimal(item).is_near_zero(tolerance):
+                return k
+        raise Exception(Hyperplane.NO_NONZERO_ELTS_FOUND_MSG)
+
+    # returns if two hyperplanes are parallel
+    def is_parallel(self, hyperplane):
+        return self.normal.is_parallel(hyperplane.normal, self.tolerance)
+
+    # returns if two hyperplanes are equal by checking if normal vector is orthogonal to vector between basepoints
+    def are_equal(self, hyperplane):
+        if not self.is_parallel(hyperplane):
+            return False
+
+        x0 = self.basepoint
+        y0 = hyperplane.basepoint
+
+        basepoint_diff = x0.minus(y0)
+
+        return basepoint_diff.is_orthogonal(self.normal, self.tolerance)
+
+
+class MyDecimal(Decimal):
+    def is_near_zero(self, eps=1e-10):
+        return abs(self) < eps
+
+
+# returns the (N, d) normal vectors and (N,) constant terms of a list of hyperplanes
+def hyperplanes_to_arrays(hyperplanes):
+    import numpy as np
+
+    normals = np.array([list(h.normal_vector) for h in hyperplanes], dtype=np.float64)
+    constants = np.array([h.constant_term for h in hyperplanes], dtype=np.float64)
+    return normals, constants
+
+
+# scales every hyperplane so that its normal has unit length
+def unit_hyperplanes(normals, constants):
+    import numpy as np
+
+    norms = np.sqrt((normals * normals).sum(axis=-1))
+    norms[norms == 0] = 1.0
+    return normals / norms[..., np.newaxis], constants / norms
+
+
+# vectorized Hyperplane.is_parallel: compares hyperplane i of the first set with
+# hyperplane i of the second (arrays broadcast, so (N, 1, d) against (1, M, d) compares all pairs)
+def are_parallel(normals, normals_1, tolerance=1e-10):
+    import numpy as np
+
+    normals = np.asarray(normals, dtype=np.float64)
+    normals_1 = np.asarray(normals_1, dtype=np.float64)
+    n, _ = unit_hyperplanes(normals, np.zeros(normals.shape[:-1]))
+    n_1, _ = unit_hyperplanes(normals_1, np.zeros(normals_1.shape[:-1]))
+
+    same_direction = (np.abs(n - n_1) < tolerance).all(axis=-1)
+    opposite_direction = (np.abs(n + n_1) < tolerance).all(axis=-1)
+    # like Vector.is_zero, a normal shorter than tolerance counts as zero
+    zero = np.sqrt((normals_1 * normals_1).sum(axis=-1)) < tolerance
+
+    return same_direction | opposite_direction | zero
+
+
+# vectorized Hyperplane.are_equal, broadcasting like are_parallel
+def are_equal(normals, constants, normals_1, constants_1, tolerance=1e-10):
+    import numpy as np
+
+    normals = np.asarray(normals, dtype=np.float64)
+    normals_1 = np.asarray(normals_1, dtype=np.float64)
+    n, k = unit_hyperplanes(normals, np.asarray(constants, dtype=np.float64))
+    n_1, k_1 = unit_hyperplanes(normals_1, np.asarray(constants_1, dtype=np.float64))
+
+    same_direction = (np.abs(n - n_1) < tolerance).all(axis=-1) & (np.abs(k - k_1) < tolerance)
+    opposite_direction = (np.abs(n + n_1) < tolerance).all(axis=-1) & (np.abs(k + k_1) < tolerance)
+
+    return same_direction | opposite_direction
+
+
+# hyperplane = Hyperplane([1, 2, 3, 4], 5)
+# hyperplane_1 = Hyperplane([2, 4, 6, 8], 10)
+# print(hyperplane, hyperplane.is_parallel(hyperplane_1), hyperplane.are_equal(hyperplane_1))
+# print(are_equal(*hyperplanes_to_arrays([hyperplane]), *hyperplanes_to_arrays([hyperplane_1])))
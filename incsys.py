@@ -0,0 +1,162 @@
+from decimal import Decimal
+
+import numpy as np
+
+PIVOT = 'pivot'
+REDUNDANT = 'redundant'
+INCONSISTENT = 'inconsistent'
+
+
+class IncrementalLinearSystem(object):
+
+    ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG = 'All planes in the system should live in the same dimension'
+    NO_SOLUTIONS_MSG = 'No solutions'
+    INF_SOLUTIONS_MSG = 'Infinitely many solutions'
+
+    # keeps the reduced row echelon form of the equations added so far: each basis row has a 1 in
+    # its pivot column and 0 in every other pivot column, so a new equation is reduced against the
+    # basis with one matrix product and adding a pivot clears one column, O(rank * dimension) each
+    def __init__(self, dimension, planes=None, tolerance=1e-10):
+        self.dimension = dimension
+        self.tolerance = tolerance
+
+        self.planes = []
+        self.statuses = []
+        self._reset_basis()
+
+        for p in planes or []:
+            self.append(p)
+
+    def _reset_basis(self):
+        self.basis = np.empty((0, self.dimension + 1))
+        self.pivot_columns = []
+        self.num_inconsistent = 0
+        self.dirty = False
+
+    # reduces one equation against the basis and returns its status
+    def _add_to_basis(self, plane):
+        row = np.array(list(plane.normal_vector) + [plane.constant_term], dtype=np.float64)
+        if self.pivot_columns:
+            row -= row[self.pivot_columns].dot(self.basis)
+            row[self.pivot_columns] = 0.0
+
+        coefficients = np.abs(row[:-1])
+        j = int(np.argmax(coefficients))
+
+        if coefficients[j] < self.tolerance:
+            if abs(row[-1]) >= self.tolerance:
+                self.num_inconsistent += 1
+                return INCONSISTENT
+            return REDUNDANT
+
+        row /= row[j]
+        self.basis -= np.outer(self.basis[:, j], row)
+        self.basis[:, j] = 0.0
+        self.basis = np.vstack([self.basis, row])
+        self.pivot_columns.append(j)
+
+        return PIVOT
+
+    # removing an equation that supplied a pivot changes the basis, so it is rebuilt on the next
+    # query; removing a redundant or inconsistent one leaves the basis as it is
+    def _rebuild(self):
+        self._reset_basis()
+        self.statuses = [self._add_to_basis(p) for p in self.planes]
+
+    def _check_dimension(self, plane):
+        if plane.dimension != self.dimension:
+            raise Exception(self.ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG)
+
+    def append(self, plane):
+        self._check_dimension(plane)
+        self.planes.append(plane)
+        if self.dirty:
+            self.statuses.append(None)
+        else:
+            self.statuses.append(self._add_to_basis(plane))
+
+    def _forget(self, i):
+        status = self.statuses[i]
+        if status == PIVOT or status is None:
+            self.dirty = True
+        elif status == INCONSISTENT:
+            self.num_inconsistent -= 1
+
+    def __delitem__(self, i):
+        self._forget(i)
+        del self.planes[i]
+        del self.statuses[i]
+
+
+    def __len__(self):
+        return len(self.planes)
+
+
+    def __getitem__(self, i):
+        return self.planes[i]
+
+
+    def __setitem__(self, i, x):
+        self._check_dimension(x)
+        self._forget(i)
+        self.planes[i] = x
+        if self.dirty:
+            self.statuses[i] = None
+        else:
+            self.statuses[i] = self._add_to_basis(x)
+
+    def _current(self):
+        if self.dirty:
+            self._rebuild()
+
+    def rank(self):
+        self._current()
+        return len(self.pivot_columns)
+
+    def is_consistent(self):
+        self._current()
+        return self.num_inconsistent == 0
+
+    def has_unique_solution(self):
+        return self.is_consistent() and self.rank() == self.dimension
+
+    # returns the solution as a list of floats, or a message when it is not unique
+    def solution(self):
+        if not self.is_consistent():
+            return self.NO_SOLUTIONS_MSG
+        if self.rank() < self.dimension:
+            return self.INF_SOLUTIONS_MSG
+
+        x = [0.0] * self.dimension
+        for j, value in zip(self.pivot_columns, self.basis[:, -1].tolist()):
+            x[j] = value if abs(value) >= self.tolerance else 0.0
+        return x
+
+    # same strings as LinearSystem.characterise_results, without re-eliminating the system
+    def characterise_results(self):
+        solution = self.solution()
+
+        if solution == self.NO_SOLUTIONS_MSG:
+            return 'No Solution'
+        if solution == self.INF_SOLUTIONS_MSG:
+            return 'Infinite solutions'
+
+        return str([round(Decimal(x), 3) for x in solution])
+
+
+    def __str__(self):
+        ret = 'Linear System:\n'
+        temp = ['Equation {}: {}'.format(i+1,p) for i,p in enumerate(self.planes)]
+        ret += '\n'.join(temp)
+        return ret
+
+
+# from plane import Plane
+# s = IncrementalLinearSystem(3)
+# s.append(Plane(normal_vector=[5.262,2.739,-9.878], constant_term=-3.441))
+# s.append(Plane(normal_vector=[5.111,6.358,7.638], constant_term=-2.152))
+# print(s.characterise_results())
+# s.append(Plane(normal_vector=[2.016,-9.924,-1.367], constant_term=-9.278))
+# print(s.characterise_results())
+# del s[0]
+# print(s.rank(), s.is_consistent())
@@ -0,0 +1,89 @@
+import numpy as np
+
+from hyperplane import unit_hyperplanes
+from solution import UNIQUE_SOLUTION, NO_SOLUTION, INFINITE_SOLUTIONS
+
+ALL_LINES_MUST_BE_2D_MSG = 'Intersections are only computed for lines in 2 dimensions'
+
+
+# returns the (N, 2) normal vectors and (N,) constant terms of a list of Line objects
+def lines_to_arrays(lines):
+    normals = np.array([list(l.normal_vector) for l in lines], dtype=np.float64)
+    constants = np.array([l.constant_term for l in lines], dtype=np.float64)
+
+    if normals.ndim != 2 or normals.shape[1] != 2:
+        raise Exception(ALL_LINES_MUST_BE_2D_MSG)
+
+    return normals, constants
+
+
+# intersects line i of the first set with line i of the second set; returns the kind of each pair
+# (UNIQUE_SOLUTION, NO_SOLUTION for parallel lines, INFINITE_SOLUTIONS for coincident ones) and
+# an (N, 2) array of intersection points that is NaN wherever the kind is not UNIQUE_SOLUTION
+def intersect_pairs(normals, constants, normals_1, constants_1, tolerance=1e-10):
+    normals = np.asarray(normals, dtype=np.float64)
+    constants = np.asarray(constants, dtype=np.float64)
+    normals_1 = np.asarray(normals_1, dtype=np.float64)
+    constants_1 = np.asarray(constants_1, dtype=np.float64)
+
+    n, k = unit_hyperplanes(normals, constants)
+    n_1, k_1 = unit_hyperplanes(normals_1, constants_1)
+
+    a, b = n[..., 0], n[..., 1]
+    c, d = n_1[..., 0], n_1[..., 1]
+
+    # on unit normals the determinant is the sine of the angle between the lines
+    det = a*d - b*c
+    parallel = np.abs(det) < tolerance
+
+    # parallel unit normals are equal or opposite, so compare constants with the matching sign
+    same_sign = np.where(a*c + b*d < 0, -1.0, 1.0)
+    coincident = parallel & (np.abs(k - same_sign*k_1) < tolerance)
+
+    kinds = np.full(det.shape, UNIQUE_SOLUTION, dtype=np.int8)
+    kinds[parallel] = NO_SOLUTION
+    kinds[coincident] = INFINITE_SOLUTIONS
+
+    safe_det = np.where(parallel, 1.0, det)
+    points = np.stack([(d*k - b*k_1) / safe_det, (-c*k + a*k_1) / safe_det], axis=-1)
+    points[parallel] = np.nan
+
+    return kinds, points
+
+
+# yields (i, j, kinds, points) for every pair i < j, one block of rows at a time,
+# so that the full N x N result never has to be held in memory
+def iter_all_pairs(normals, constants, tolerance=1e-10, block_size=1024):
+    normals = np.asarray(normals, dtype=np.float64)
+    constants = np.asarray(constants, dtype=np.float64)
+    num_lines = len(normals)
+
+    for start in range(0, num_lines, block_size):
+        stop = min(start + block_size, num_lines)
+
+        # broadcast the block of rows against every later line, then keep the upper triangle
+        kinds, points = intersect_pairs(normals[start:stop, np.newaxis], constants[start:stop, np.newaxis],
+                                        normals[np.newaxis, start + 1:], constants[np.newaxis, start + 1:],
+                                        tolerance)
+        upper = np.arange(stop - start)[:, np.newaxis] <= np.arange(num_lines - start - 1)[np.newaxis, :]
+        i, j = np.nonzero(upper)
+
+        yield i + start, j + start + 1, kinds[upper], points[upper]
+
+
+# intersects every pair i < j of lines and returns flat (i, j, kinds, points) arrays
+def intersect_all_pairs(normals, constants, tolerance=1e-10, block_size=1024):
+    blocks = list(iter_all_pairs(normals, constants, tolerance, block_size))
+    if not blocks:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty, np.empty(0, dtype=np.int8), np.empty((0, 2))
+
+    i, j, kinds, points = zip(*blocks)
+    return np.concatenate(i), np.concatenate(j), np.concatenate(kinds), np.concatenate(points)
+
+
+# from line import Line
+# lines = [Line([4.046, 2.836], 1.21), Line([10.115, 7.09], 3.025),
+#          Line([7.204, 3.182], 8.68), Line([8.172, 4.114], 9.883)]
+# normals, constants = lines_to_arrays(lines)
+# print(intersect_all_pairs(normals, constants))
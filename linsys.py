@@ -1,10 +1,8 @@
-from decimal import Decimal, getcontext
-from copy import deepcopy
+from decimal import Decimal
 
 from vector import Vector
-from plane import Plane
-
-getcontext().prec = 30
+from hyperplane import Hyperplane, MyDecimal, decimal_context, default_tolerance, DECIMAL_PRECISION
+from solution import solution_from_rref
 
 
 class LinearSystem(object):
@@ -13,7 +11,16 @@ class LinearSystem(object):
     NO_SOLUTIONS_MSG = 'No solutions'
     INF_SOLUTIONS_MSG = 'Infinitely many solutions'
 
-    def __init__(self, planes):
+    # precision is the number of Decimal digits the row multipliers and constant terms are rounded
+    # to, set per system rather than on the global context; the coefficients are always updated in
+    # float, so a lower precision saves no time and only makes the results less accurate;
+    # tolerance is how close to 0 a coefficient must be to count as 0, by default
+    # default_tolerance(precision), so the rounding error of a lower precision is not taken for a
+    # coefficient and changes no solution from parametric to unique; with in_place the row operations change the coefficients of the planes in the system instead
+    # of replacing them with new planes, so they must not be shared with anything else; by default
+    # only the elimination, which works on its own copy, runs in place, and with in_place=False
+    # it replaces planes too
+    def __init__(self, planes, precision=DECIMAL_PRECISION, tolerance=None, in_place=None):
         try:
             d = planes[0].dimension
             for p in planes:
@@ -21,6 +28,9 @@ class LinearSystem(object):
 
             self.planes = planes
             self.dimension = d
+            self.precision = precision
+            self.tolerance = default_tolerance(precision) if tolerance is None else tolerance
+            self.in_place = in_place
 
         except AssertionError:
             raise Exception(self.ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG)
@@ -34,15 +44,33 @@ class LinearSystem(object):
         self.__setitem__(row2, item1)
 
 
+    # a copy of the system owning copies of its planes, which the elimination works on in place;
+    # only the coefficient lists are copied, the numbers in them are shared
+    def copy(self, in_place=True):
+        planes = [p.copy() for p in self.planes]
+        for p in planes:
+            p.precision = self.precision
+            p.tolerance = self.tolerance
+        return LinearSystem(planes, self.precision, self.tolerance, in_place)
+
+
     def multiply_coefficient_and_row(self, coefficient, row):
         # add your code here
         p = self.__getitem__(row)
+        if self.in_place:
+            scalar = float(coefficient)
+            p.normal_vector[:] = [float(x) * scalar for x in p.normal_vector]
+            p.constant_term = Decimal(p.constant_term*coefficient or 0)
+            p.coefficients_changed()
+            return
+
         n = Vector(p.normal_vector)
         c = p.constant_term
         
         n_result = n.multiply(coefficient)
         c_result = c*coefficient
-        p_result = Plane(normal_vector=list(n_result.coordinates), constant_term=c_result)
+        p_result = type(p)(normal_vector=list(n_result.coordinates), constant_term=c_result,
+                           precision=self.precision, tolerance=self.tolerance)
         
         self.__setitem__(row, p_result)
 
@@ -50,6 +78,14 @@ class LinearSystem(object):
     def add_multiple_times_row_to_row(self, coefficient, row_to_add, row_to_be_added_to):
         # add your code here
         p = self.__getitem__(row_to_add)
+        if self.in_place:
+            scalar = float(coefficient)
+            p1 = self.__getitem__(row_to_be_added_to)
+            p1.normal_vector[:] = [float(y) + float(x) * scalar for x, y in zip(p.normal_vector, p1.normal_vector)]
+            p1.constant_term = Decimal(p.constant_term*coefficient + p1.constant_term or 0)
+            p1.coefficients_changed()
+            return
+
         n = Vector(p.normal_vector)
         c = p.constant_term
         n = n.multiply(coefficient)
@@ -62,82 +98,107 @@ class LinearSystem(object):
         n_result = n1.plus(n)
         c_result = c+c1
         
-        p_result = Plane(normal_vector=list(n_result.coordinates), constant_term=c_result)
+        p_result = type(p1)(normal_vector=list(n_result.coordinates), constant_term=c_result,
+                            precision=self.precision, tolerance=self.tolerance)
         
         self.__setitem__(row_to_be_added_to, p_result)
         
     def compute_triangular_form(self):
-        system = deepcopy(self)
+        with decimal_context(self.precision):
+            system = self.copy(self.in_place is not False)
         
-        num_eqs = len(system)
-        num_vars = system.dimension
+            num_eqs = len(system)
+            num_vars = system.dimension
         
-        j = 0 
+            j = 0 
         
-        for i in range(num_eqs):
+            for i in range(num_eqs):
             
-            while j < num_vars:
-                c = MyDecimal(system[i].normal_vector[j])
-                if c.is_near_zero():
-                    swap_succeeded = system.swap_for_nonzero_coefficient_eq(i, j)
-                    if not swap_succeeded:
-                        j += 1
-                        continue
+                while j < num_vars:
+                    c = MyDecimal(system[i].normal_vector[j])
+                    if c.is_near_zero(self.tolerance):
+                        swap_succeeded = system.swap_for_nonzero_coefficient_eq(i, j)
+                        if not swap_succeeded:
+                            j += 1
+                            continue
                 
-                system.clear_coefficients_below(i, j)
-                j += 1
-                break
+                    system.clear_coefficients_below(i, j)
+                    j += 1
+                    break
         
-        return system
+            return system
         
     def compute_rref(self):
-        tf = self.compute_triangular_form()
-        num_eqs = len(tf)
-        leading_term_indices = tf.indices_of_first_nonzero_terms_in_each_row()
-        j = len(leading_term_indices) - 1
+        with decimal_context(self.precision):
+            tf = self.compute_triangular_form()
+            num_eqs = len(tf)
+            leading_term_indices = tf.indices_of_first_nonzero_terms_in_each_row()
+            j = len(leading_term_indices) - 1
         
-        for i in range(num_eqs)[::-1]:
-            j = leading_term_indices[i]
-            if j < 0:
-                continue
+            for i in range(num_eqs)[::-1]:
+                j = leading_term_indices[i]
+                if j < 0:
+                    continue
             
-            tf.scale_leading_term_coeff_to_1(i, j)
-            tf.clear_coefficients_above(i, j)
+                tf.scale_leading_term_coeff_to_1(i, j)
+                tf.clear_coefficients_above(i, j)
         
-        return tf
+            return tf
         
     def characterise_results(self):
-        rref = self.compute_rref()
-        num_eqs = len(rref)
-        solution = self[0].normal_vector
+        with decimal_context(self.precision):
+            rref = self.compute_rref()
+            num_eqs = len(rref)
+            solution = list(self[0].normal_vector)
         
-        for i in range(num_eqs)[::-1]:
-            coeffs = rref[i].normal_vector
-            ct = MyDecimal(rref[i].constant_term)
-            left_side_of_eq = MyDecimal(sum(coeffs))
+            for i in range(num_eqs)[::-1]:
+                coeffs = rref[i].normal_vector
+                ct = MyDecimal(rref[i].constant_term)
+                left_side_of_eq = MyDecimal(sum(coeffs))
             
-            if left_side_of_eq.is_near_zero() and not ct.is_near_zero():
-                return 'No Solution'
+                if left_side_of_eq.is_near_zero(self.tolerance) and not ct.is_near_zero(self.tolerance):
+                    return 'No Solution'
         
-            if coeffs.count(0) < len(coeffs) - 1:
-                return 'Infinite solutions'
+                num_nonzero_coeffs = len([x for x in coeffs if not MyDecimal(x).is_near_zero(self.tolerance)])
+                if num_nonzero_coeffs > 1:
+                    return 'Infinite solutions'
             
-            if not left_side_of_eq.is_near_zero():
-                solution[i] = round(rref[i].constant_term, 3)
+                if not left_side_of_eq.is_near_zero(self.tolerance):
+                    solution[i] = round(rref[i].constant_term, 3)
+        
+            return str(solution)
         
-        return str(solution)
+    # returns a UniqueSolution, NoSolution or ParametricSolution instead of a string
+    def solve(self):
+        rref = self.compute_rref()
+        pivot_columns = rref.indices_of_first_nonzero_terms_in_each_row()
+        coefficients = [p.normal_vector for p in rref.planes]
+        constants = [p.constant_term for p in rref.planes]
+
+        return solution_from_rref(coefficients, constants, pivot_columns, self.dimension, self.tolerance)
         
+    # the multipliers are rounded to the system's precision while the rows are updated in float,
+    # so the entry a row operation is meant to scale to 1 or cancel is set to exactly that value;
+    # otherwise, with less than about 16 digits the rounding error left in it can be larger than
+    # the tolerance and be taken for a coefficient
+    def _set_coefficient(self, row, col, value):
+        p = self[row]
+        p.normal_vector[col] = value
+        p.coefficients_changed()
+
     def scale_leading_term_coeff_to_1(self, row, col):
         coeffs = self[row].normal_vector
         scalar = Decimal('1.0') / Decimal(coeffs[col])
         
         self.multiply_coefficient_and_row(scalar, row)
+        self._set_coefficient(row, col, 1.0)
         
     def clear_coefficients_above(self, row, col):
         for k in range(row)[::1]:
             coeffs = self[k].normal_vector
             alpha = Decimal(-(coeffs[col]))
             self.add_multiple_times_row_to_row(alpha, row, k)
+            self._set_coefficient(k, col, 0.0)
             
                 
     def swap_for_nonzero_coefficient_eq(self, row, col):
@@ -145,7 +206,7 @@ class LinearSystem(object):
          
         for k in range(row + 1, num_eqs):
             coefficient = MyDecimal(self[k].normal_vector[col])
-            if not coefficient.is_near_zero():
+            if not coefficient.is_near_zero(self.tolerance):
                 self.swap_rows(row, k)
                 return True
         
@@ -160,6 +221,7 @@ class LinearSystem(object):
             gamma = MyDecimal(n[col])
             alpha = -gamma/beta
             self.add_multiple_times_row_to_row(alpha, row, k)
+            self._set_coefficient(k, col, 0.0)
 
 
     def indices_of_first_nonzero_terms_in_each_row(self):
@@ -170,9 +232,9 @@ class LinearSystem(object):
 
         for i,p in enumerate(self.planes):
             try:
-                indices[i] = p.first_nonzero_index(p.normal_vector)
+                indices[i] = p.first_nonzero_index(p.normal_vector, self.tolerance)
             except Exception as e:
-                if str(e) == Plane.NO_NONZERO_ELTS_FOUND_MSG:
+                if str(e) == Hyperplane.NO_NONZERO_ELTS_FOUND_MSG:
                     continue
                 else:
                     raise e
@@ -205,11 +267,7 @@ class LinearSystem(object):
         return ret
 
 
-class MyDecimal(Decimal):
-    def is_near_zero(self, eps=1e-10):
-        return abs(self) < eps
-
-
+# from plane import Plane
 # p0 = Plane(normal_vector=[1,2,1], constant_term=5)
 # p1 = Plane(normal_vector=[0,1,0], constant_term=2)
 # p2 = Plane(normal_vector=[1,1,-1], constant_term=3)
@@ -378,10 +436,10 @@ class MyDecimal(Decimal):
 # result = s.characterise_results()
 # print(result)
 
-p1 = Plane(normal_vector=[5.262,2.739,-9.878], constant_term=-3.441)
-p2 = Plane(normal_vector=[5.111,6.358,7.638], constant_term=-2.152)
-p3 = Plane(normal_vector=[2.016,-9.924,-1.367], constant_term=-9.278)
-p4 = Plane(normal_vector=[2.167,-13.543,-18.883], constant_term=-10.567)
-s = LinearSystem([p1,p2,p3,p4])
-result = s.characterise_results()
-print(result)
\ No newline at end of file
+# p1 = Plane(normal_vector=[5.262,2.739,-9.878], constant_term=-3.441)
+# p2 = Plane(normal_vector=[5.111,6.358,7.638], constant_term=-2.152)
+# p3 = Plane(normal_vector=[2.016,-9.924,-1.367], constant_term=-9.278)
+# p4 = Plane(normal_vector=[2.167,-13.543,-18.883], constant_term=-10.567)
+# s = LinearSystem([p1,p2,p3,p4])
+# result = s.characterise_results()
+# print(result)
@@ -0,0 +1,212 @@
+import itertools
+import os
+
+import numpy as np
+
+from densesys import DenseLinearSystem
+from vectorbatch import VectorBatch
+
+NPY = 'npy'
+TEXT = 'text'
+BINARY = 'binary'
+
+# delimiter of each text extension; None splits on any whitespace
+TEXT_DELIMITERS = {'.csv': ',', '.tsv': '\t', '.txt': None}
+
+CHUNK_ROWS = 65536
+
+ROWS_MUST_HAVE_SAME_WIDTH_MSG = 'Every row of the file should have the same number of values'
+BINARY_NEEDS_WIDTH_MSG = 'The number of values per row must be given for a binary file'
+TRUNCATED_BINARY_MSG = 'The size of the binary file is not a whole number of rows'
+NOT_A_MATRIX_MSG = 'The file should hold a 2 dimensional array'
+EMPTY_FILE_MSG = 'The file holds no rows'
+NOT_A_NUMBER_MSG = 'Every value in the file should be a number'
+
+
+# .npy files are read with numpy's own format, .csv/.tsv/.txt as delimited text and anything else
+# as a raw dump of rows of width values
+def file_kind(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.npy':
+        return NPY
+    if extension in TEXT_DELIMITERS:
+        return TEXT
+    return BINARY
+
+
+def _data_lines(lines, comments):
+    for line in lines:
+        if line.split(comments, 1)[0].strip():
+            yield line
+
+
+def _text_file(path, skip_rows):
+    f = open(path)
+    for _ in range(skip_rows):
+        f.readline()
+    return f
+
+
+# parses chunk_rows lines at a time, skipping blank lines and comments, into (k, width) float64 arrays
+def iter_text_chunks(path, delimiter=None, chunk_rows=CHUNK_ROWS, skip_rows=0, comments='#'):
+    if delimiter is None:
+        delimiter = TEXT_DELIMITERS.get(os.path.splitext(path)[1].lower())
+
+    width = None
+    with _text_file(path, skip_rows) as f:
+        lines = _data_lines(f, comments)
+        while True:
+            chunk = list(itertools.islice(lines, chunk_rows))
+            if not chunk:
+                return
+
+            try:
+                block = np.loadtxt(chunk, delimiter=delimiter, comments=comments, ndmin=2, dtype=np.float64)
+            except ValueError as e:
+                # numpy words this 'the number of columns changed', older releases 'wrong number of columns'
+                if 'number of columns' in str(e).lower():
+                    raise Exception(ROWS_MUST_HAVE_SAME_WIDTH_MSG) from e
+                raise Exception(NOT_A_NUMBER_MSG) from e
+
+            if width is not None and block.shape[1] != width:
+                raise Exception(ROWS_MUST_HAVE_SAME_WIDTH_MSG)
+            width = block.shape[1]
+
+            yield block
+
+
+def _binary_rows(path, width, dtype, offset):
+    if not width:
+        raise Exception(BINARY_NEEDS_WIDTH_MSG)
+
+    row_bytes = width * np.dtype(dtype).itemsize
+    size = os.path.getsize(path) - offset
+    if size % row_bytes:
+        raise Exception(TRUNCATED_BINARY_MSG)
+
+    return size // row_bytes
+
+
+# reads chunk_rows rows of width values of dtype at a time from a raw dump, after offset header bytes
+def iter_binary_chunks(path, width, dtype=np.float64, chunk_rows=CHUNK_ROWS, offset=0):
+    _binary_rows(path, width, dtype, offset)
+
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        while True:
+            block = np.fromfile(f, dtype=dtype, count=chunk_rows * width)
+            if block.size == 0:
+                return
+            yield block.reshape(-1, width).astype(np.float64, copy=False)
+
+
+def _open_npy(path, mmap_mode):
+    array = np.load(path, mmap_mode=mmap_mode)
+    if array.ndim != 2:
+        raise Exception(NOT_A_MATRIX_MSG)
+    return array
+
+
+# yields chunk_rows rows at a time of a memory mapped .npy file, so only the chunk in use is read
+def iter_npy_chunks(path, chunk_rows=CHUNK_ROWS):
+    array = _open_npy(path, 'r')
+    for start in range(0, len(array), chunk_rows):
+        yield np.asarray(array[start:start + chunk_rows], dtype=np.float64)
+
+
+def iter_chunks(path, width=None, delimiter=None, dtype=np.float64, chunk_rows=CHUNK_ROWS, skip_rows=0, offset=0):
+    kind = file_kind(path)
+    if kind == NPY:
+        return iter_npy_chunks(path, chunk_rows)
+    if kind == TEXT:
+        return iter_text_chunks(path, delimiter, chunk_rows, skip_rows)
+    return iter_binary_chunks(path, width, dtype, chunk_rows, offset)
+
+
+# the number of rows and values per row of a text file, counted without parsing any numbers
+def _text_shape(path, delimiter, skip_rows, comments='#'):
+    if delimiter is None:
+        delimiter = TEXT_DELIMITERS.get(os.path.splitext(path)[1].lower())
+
+    rows = 0
+    width = None
+    with _text_file(path, skip_rows) as f:
+        for line in _data_lines(f, comments):
+            if width is None:
+                width = len(line.split(comments, 1)[0].strip().split(delimiter))
+            rows += 1
+
+    if not rows:
+        raise Exception(EMPTY_FILE_MSG)
+
+    return rows, width
+
+
+def _fill(out, chunks):
+    n = 0
+    for chunk in chunks:
+        if chunk.shape[1] != out.shape[1] or n + len(chunk) > len(out):
+            raise Exception(ROWS_MUST_HAVE_SAME_WIDTH_MSG)
+        out[n:n + len(chunk)] = chunk
+        n += len(chunk)
+    return n
+
+
+# returns the whole file as an (N, width) array; .npy and raw float64 files are memory mapped
+# read-only when mmap is set, and other files are parsed chunk by chunk into an array allocated once
+# at its final size, so memory never holds more than the result and one chunk
+def load_array(path, width=None, delimiter=None, dtype=np.float64, mmap=True, chunk_rows=CHUNK_ROWS,
+               skip_rows=0, offset=0):
+    kind = file_kind(path)
+    if kind == NPY:
+        return _open_npy(path, 'r' if mmap else None)
+
+    if kind == BINARY:
+        rows = _binary_rows(path, width, dtype, offset)
+        if mmap and np.dtype(dtype) == np.float64:
+            return np.memmap(path, dtype=np.float64, mode='r', offset=offset, shape=(rows, width))
+    else:
+        rows, width = _text_shape(path, delimiter, skip_rows)
+
+    out = np.empty((rows, width), dtype=np.float64)
+    _fill(out, iter_chunks(path, width, delimiter, dtype, chunk_rows, skip_rows, offset))
+    return out
+
+
+# streams any supported file into a .npy file at destination and returns it memory mapped, so a
+# text dump too big for memory can be parsed once and then reopened instantly
+def convert_to_npy(path, destination, width=None, delimiter=None, dtype=np.float64, chunk_rows=CHUNK_ROWS,
+                   skip_rows=0, offset=0):
+    kind = file_kind(path)
+    if kind == NPY:
+        rows, width = _open_npy(path, 'r').shape
+    elif kind == BINARY:
+        rows = _binary_rows(path, width, dtype, offset)
+    else:
+        rows, width = _text_shape(path, delimiter, skip_rows)
+
+    out = np.lib.format.open_memmap(destination, mode='w+', dtype=np.float64, shape=(rows, width))
+    _fill(out, iter_chunks(path, width, delimiter, dtype, chunk_rows, skip_rows, offset))
+    out.flush()
+    del out
+
+    return _open_npy(destination, 'r')
+
+
+# each row holds the coefficients of one equation followed by its constant term, with no Plane per
+# row; the elimination works on its own copy of the matrix, so a memory mapped file is used as it
+# is and only read into memory, once, by that copy; calling the row operations directly needs
+# mmap=False, since the map is read-only
+def load_system(path, tolerance=1e-10, **kwargs):
+    return DenseLinearSystem.from_augmented(load_array(path, **kwargs), tolerance, copy=False)
+
+
+# each row holds the coordinates of one vector; a float64 .npy or raw file stays memory mapped
+def load_vectors(path, **kwargs):
+    return VectorBatch(load_array(path, **kwargs))
+
+
+# s = load_system('equations.csv', skip_rows=1)
+# print(s.characterise_results())
+# vectors = load_vectors('vectors.npy')
+# print(vectors.magnitude())
@@ -0,0 +1,89 @@
+import numpy as np
+
+
+class LeastSquaresResult(object):
+
+    def __init__(self, solution, residual_sum_of_squares, rank, num_equations):
+        self.solution = solution
+        self.residual_sum_of_squares = residual_sum_of_squares
+        self.rank = rank
+        self.num_equations = num_equations
+
+    def __str__(self):
+        return 'Least squares solution: {} (residual sum of squares {}, rank {}, {} equations)'.format(
+            [round(x, 3) for x in self.solution.tolist()], round(self.residual_sum_of_squares, 6),
+            self.rank, self.num_equations)
+
+
+class LeastSquaresSolver(object):
+
+    ROWS_MUST_MATCH_DIM_MSG = 'Every equation should have one coefficient per variable'
+    NO_EQUATIONS_MSG = 'At least one equation is needed for a least squares solution'
+
+    # fits x to minimise |A x - b| over equations streamed in chunks; only the triangular factor R of
+    # the augmented matrix [A | b] is kept, so memory is O(dimension^2) however many rows arrive
+    def __init__(self, dimension, tolerance=1e-10):
+        self.dimension = dimension
+        self.tolerance = tolerance
+        self.r = np.zeros((0, dimension + 1))
+        self.num_equations = 0
+
+    # folds a chunk of equations into R by re-factorizing [R; chunk], which is at most
+    # (dimension + 1 + chunk) rows, so the full matrix never has to exist at once
+    def add_rows(self, coefficients, constants):
+        coefficients = np.asarray(coefficients, dtype=np.float64)
+        constants = np.asarray(constants, dtype=np.float64)
+        if coefficients.ndim != 2 or coefficients.shape[1] != self.dimension:
+            raise Exception(self.ROWS_MUST_MATCH_DIM_MSG)
+
+        chunk = np.column_stack([coefficients, constants])
+        self.r = np.linalg.qr(np.vstack([self.r, chunk]), mode='r')
+        self.num_equations += len(chunk)
+
+    # takes any iterable of planes, including a generator, and converts chunk_size of them at a time
+    def add_planes(self, planes, chunk_size=4096):
+        coefficients = []
+        constants = []
+        for p in planes:
+            coefficients.append(list(p.normal_vector))
+            constants.append(p.constant_term)
+            if len(coefficients) == chunk_size:
+                self.add_rows(coefficients, constants)
+                coefficients = []
+                constants = []
+
+        if coefficients:
+            self.add_rows(coefficients, constants)
+
+    # R x = z is the triangular form of the normal equations; the last diagonal entry of the
+    # augmented factor is the norm of the residual, so it needs no second pass over the data
+    def solve(self):
+        if self.num_equations == 0:
+            raise Exception(self.NO_EQUATIONS_MSG)
+
+        n = self.dimension
+        r = np.zeros((n + 1, n + 1))
+        r[:len(self.r)] = self.r[:n + 1]
+
+        # lstsq on the small triangular factor gives the minimum norm solution when rank < n; its rank
+        # comes from the singular values, since without pivoting the diagonal of R does not show it
+        solution, _, rank, _ = np.linalg.lstsq(r[:n, :n], r[:n, n], rcond=self.tolerance)
+        residual = r[:n, :n].dot(solution) - r[:n, n]
+        residual_sum_of_squares = float(residual.dot(residual) + r[n, n] ** 2)
+
+        return LeastSquaresResult(solution, residual_sum_of_squares, int(rank), self.num_equations)
+
+    # returns A x - b for a chunk of equations, for inspecting individual residuals
+    @staticmethod
+    def residuals(solution, coefficients, constants):
+        return np.asarray(coefficients, dtype=np.float64).dot(solution) - np.asarray(constants, dtype=np.float64)
+
+
+# from plane import Plane
+# p1 = Plane(normal_vector=[5.262,2.739,-9.878], constant_term=-3.441)
+# p2 = Plane(normal_vector=[5.111,6.358,7.638], constant_term=-2.152)
+# p3 = Plane(normal_vector=[2.016,-9.924,-1.367], constant_term=-9.278)
+# p4 = Plane(normal_vector=[2.167,-13.543,-18.883], constant_term=-10.567)
+# solver = LeastSquaresSolver(3)
+# solver.add_planes([p1,p2,p3,p4])
+# print(solver.solve())
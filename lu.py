@@ -0,0 +1,115 @@
+from collections import OrderedDict
+
+import numpy as np
+
+
+class LUFactorization(object):
+
+    MATRIX_MUST_BE_SQUARE_MSG = 'Only square coefficient matrices can be factorized'
+    SINGULAR_MATRIX_MSG = 'The coefficient matrix is singular, the system has no unique solution'
+    CONSTANTS_MUST_MATCH_MSG = 'The constant terms must have one entry per equation'
+
+    # factorizes P A = L U once with partial pivoting; L (unit diagonal) and U share one array
+    def __init__(self, coefficients, tolerance=1e-10):
+        lu = np.array(coefficients, dtype=np.float64)
+        if lu.ndim != 2 or lu.shape[0] != lu.shape[1]:
+            raise Exception(self.MATRIX_MUST_BE_SQUARE_MSG)
+
+        n = lu.shape[0]
+        permutation = np.arange(n)
+
+        for j in range(n):
+            p = j + int(np.argmax(np.abs(lu[j:, j])))
+            if abs(lu[p, j]) < tolerance:
+                raise Exception(self.SINGULAR_MATRIX_MSG)
+
+            if p != j:
+                lu[[j, p]] = lu[[p, j]]
+                permutation[[j, p]] = permutation[[p, j]]
+
+            lu[j + 1:, j] /= lu[j, j]
+            lu[j + 1:, j + 1:] -= np.outer(lu[j + 1:, j], lu[j, j + 1:])
+
+        self.lu = lu
+        self.permutation = permutation
+        self.dimension = n
+
+    @classmethod
+    def from_planes(cls, planes, tolerance=1e-10):
+        return cls([list(p.normal_vector) for p in planes], tolerance)
+
+    # solves for one right-hand side of shape (n,) or several of shape (n, k) in O(n^2) each
+    def solve(self, constants):
+        b = np.asarray(constants, dtype=np.float64)
+        if b.shape[0] != self.dimension:
+            raise Exception(self.CONSTANTS_MUST_MATCH_MSG)
+
+        lu = self.lu
+        y = b[self.permutation].copy()
+
+        for i in range(1, self.dimension):
+            y[i] -= lu[i, :i].dot(y[:i])
+
+        for i in range(self.dimension - 1, -1, -1):
+            y[i] = (y[i] - lu[i, i + 1:].dot(y[i + 1:])) / lu[i, i]
+
+        return y
+
+
+class LUCache(object):
+
+    # keeps the factorizations of the maxsize most recently used coefficient matrices
+    def __init__(self, maxsize=128, tolerance=1e-10):
+        self.maxsize = maxsize
+        self.tolerance = tolerance
+        self.factorizations = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.factorizations)
+
+    # identical coefficient matrices share a key, so a repeated system is found without comparing arrays
+    @staticmethod
+    def key(coefficients):
+        return coefficients.shape, coefficients.tobytes()
+
+    def factorization(self, coefficients):
+        coefficients = np.ascontiguousarray(coefficients, dtype=np.float64)
+        key = self.key(coefficients)
+
+        factorization = self.factorizations.get(key)
+        if factorization is not None:
+            self.factorizations.move_to_end(key)
+            self.hits += 1
+        else:
+            factorization = LUFactorization(coefficients, self.tolerance)
+            self.factorizations[key] = factorization
+            self.misses += 1
+            if len(self.factorizations) > self.maxsize:
+                self.factorizations.popitem(last=False)
+
+        return factorization
+
+    def solve(self, coefficients, constants):
+        return self.factorization(coefficients).solve(constants)
+
+    def solve_planes(self, planes):
+        coefficients = [list(p.normal_vector) for p in planes]
+        constants = [p.constant_term for p in planes]
+        return self.solve(coefficients, constants)
+
+    def clear(self):
+        self.factorizations.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# from plane import Plane
+# cache = LUCache()
+# p1 = Plane(normal_vector=[0,1,1], constant_term=1)
+# p2 = Plane(normal_vector=[1,-1,1], constant_term=2)
+# p3 = Plane(normal_vector=[1,2,-5], constant_term=3)
+# print(cache.solve_planes([p1,p2,p3]))
+# print(cache.solve([[0,1,1], [1,-1,1], [1,2,-5]], [1, 1, 1]))
+# print(cache.hits, cache.misses)
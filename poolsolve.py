@@ -0,0 +1,192 @@
+import itertools
+import os
+import time
+from multiprocessing import Pool
+
+import numpy as np
+
+from hyperplane import Hyperplane, default_tolerance, DECIMAL_PRECISION
+from linsys import LinearSystem
+from solution import UniqueSolution, NoSolution, ParametricSolution, UNIQUE_SOLUTION, INFINITE_SOLUTIONS
+from vector import Vector
+
+SOLVE = 'solve'
+CHARACTERISE_RESULTS = 'characterise_results'
+
+
+# the rows of a LinearSystem or of a plain list of planes, each normal vector followed by the constant term
+def augmented_rows(system):
+    planes = system.planes if isinstance(system, LinearSystem) else system
+    return [[float(x) for x in p.normal_vector] + [float(p.constant_term)] for p in planes]
+
+
+# packs a chunk of systems into one float64 block of augmented rows and a (K, 2) array with the
+# number of equations and variables of each system, which pickles as two raw buffers instead of
+# an object graph of planes, vectors and Decimals
+def pack_systems(systems):
+    rows = [augmented_rows(s) for s in systems]
+    shapes = np.array([(len(r), len(r[0]) - 1) for r in rows], dtype=np.intp).reshape(-1, 2)
+    data = np.array([x for r in rows for row in r for x in row], dtype=np.float64)
+    return shapes, data
+
+
+# the inverse of pack_systems: yields the list of augmented rows of every system
+def unpack_systems(shapes, data):
+    offset = 0
+    for num_eqs, num_vars in shapes.tolist():
+        size = num_eqs * (num_vars + 1)
+        yield data[offset:offset + size].reshape(num_eqs, num_vars + 1).tolist()
+        offset += size
+
+
+# packs the results of solve() the same way, as arrays: the kind, number of variables and number of
+# parameters of each system, the free variables of the parametric ones, and one float64 block with
+# the point of every unique solution and the basepoint and direction vectors of every parametric one
+def pack_solutions(solutions, dimensions):
+    kinds = np.array([s.kind for s in solutions], dtype=np.int8)
+    num_parameters = np.array([s.num_parameters if s.kind == INFINITE_SOLUTIONS else 0 for s in solutions],
+                              dtype=np.intp)
+
+    free_variables = []
+    values = []
+    for s in solutions:
+        if s.kind == UNIQUE_SOLUTION:
+            values += [float(x) for x in s.point.coordinates]
+        elif s.kind == INFINITE_SOLUTIONS:
+            for v in [s.basepoint] + list(s.direction_vectors):
+                values += [float(x) for x in v.coordinates]
+            free_variables += s.free_variables if s.free_variables is not None else [-1] * s.num_parameters
+
+    return (kinds, np.array(dimensions, dtype=np.intp), num_parameters, np.array(free_variables, dtype=np.intp),
+            np.array(values, dtype=np.float64))
+
+
+# the inverse of pack_solutions: yields the Solution of every system
+def unpack_solutions(kinds, dimensions, num_parameters, free_variables, values):
+    offset = 0
+    free_offset = 0
+    for kind, d, k in zip(kinds.tolist(), dimensions.tolist(), num_parameters.tolist()):
+        if kind == UNIQUE_SOLUTION:
+            yield UniqueSolution(Vector(values[offset:offset + d].tolist()))
+            offset += d
+        elif kind == INFINITE_SOLUTIONS:
+            vectors = [Vector(values[offset + i * d:offset + (i + 1) * d].tolist()) for i in range(k + 1)]
+            free = free_variables[free_offset:free_offset + k].tolist()
+            yield ParametricSolution(vectors[0], vectors[1:], free if min(free + [0]) >= 0 else None)
+            offset += (k + 1) * d
+            free_offset += k
+        else:
+            yield NoSolution()
+
+
+# runs in the worker: rebuilds each system from its rows and returns the results of the chunk
+# with the time it took and the id of the process that ran it; solutions go back packed by
+# pack_solutions, so no object graph of solutions, vectors and Decimals is pickled on the way back
+# either, while the strings of characterise_results are sent as they are
+def solve_chunk(task):
+    index, shapes, data, method, precision, tolerance = task
+    start = time.perf_counter()
+    if tolerance is None:
+        tolerance = default_tolerance(precision)
+
+    results = []
+    for rows in unpack_systems(shapes, data):
+        planes = [Hyperplane(row[:-1], row[-1], precision=precision, tolerance=tolerance) for row in rows]
+        system = LinearSystem(planes, precision=precision, tolerance=tolerance)
+        results.append(getattr(system, method)())
+
+    if method == SOLVE:
+        results = pack_solutions(results, shapes[:, 1])
+
+    return index, results, time.perf_counter() - start, os.getpid()
+
+
+class ChunkTiming(object):
+
+    def __init__(self, index, start, size, seconds, pid):
+        self.index = index
+        self.start = start
+        self.size = size
+        self.seconds = seconds
+        self.pid = pid
+
+    def __str__(self):
+        return 'Chunk {}: systems {} to {} in {:.3f} s on process {}'.format(
+            self.index, self.start, self.start + self.size - 1, self.seconds, self.pid)
+
+
+class BatchSolver(object):
+
+    UNKNOWN_METHOD_MSG = 'The method must be one of {}'.format([SOLVE, CHARACTERISE_RESULTS])
+
+    # solves independent systems on a pool of processes, chunk_size systems per task; method is the
+    # LinearSystem method whose results are returned, and progress, when given, is called with the
+    # number of systems done and the total (None for an iterator) after every chunk; precision and
+    # tolerance are passed on to every LinearSystem
+    def __init__(self, processes=None, chunk_size=32, method=SOLVE, precision=DECIMAL_PRECISION,
+                 tolerance=None, progress=None):
+        if method not in (SOLVE, CHARACTERISE_RESULTS):
+            raise Exception(self.UNKNOWN_METHOD_MSG)
+
+        self.processes = processes
+        self.chunk_size = chunk_size
+        self.method = method
+        self.precision = precision
+        self.tolerance = tolerance
+        self.progress = progress
+        self.timings = []
+
+    # packs the systems chunk by chunk as they are read, so an iterator of systems is never held in full
+    def _tasks(self, systems):
+        systems = iter(systems)
+        for index in itertools.count():
+            chunk = list(itertools.islice(systems, self.chunk_size))
+            if not chunk:
+                return
+            shapes, data = pack_systems(chunk)
+            yield index, shapes, data, self.method, self.precision, self.tolerance
+
+    # yields the result of every system in input order; with processes=1 the chunks are solved
+    # in this process, which is useful for debugging and for small batches
+    def imap(self, systems):
+        total = len(systems) if hasattr(systems, '__len__') else None
+        self.timings = []
+
+        if self.processes == 1:
+            for chunk in map(solve_chunk, self._tasks(systems)):
+                for result in self._record(chunk, total):
+                    yield result
+            return
+
+        with Pool(self.processes) as pool:
+            for chunk in pool.imap(solve_chunk, self._tasks(systems)):
+                for result in self._record(chunk, total):
+                    yield result
+
+    def _record(self, chunk, total):
+        index, results, seconds, pid = chunk
+        if self.method == SOLVE:
+            results = list(unpack_solutions(*results))
+        start = index * self.chunk_size
+        self.timings.append(ChunkTiming(index, start, len(results), seconds, pid))
+
+        if self.progress is not None:
+            self.progress(start + len(results), total)
+
+        return results
+
+    def solve(self, systems):
+        return list(self.imap(systems))
+
+
+# from plane import Plane
+# p1 = Plane(normal_vector=[5.262,2.739,-9.878], constant_term=-3.441)
+# p2 = Plane(normal_vector=[5.111,6.358,7.638], constant_term=-2.152)
+# p3 = Plane(normal_vector=[2.016,-9.924,-1.367], constant_term=-9.278)
+# p4 = Plane(normal_vector=[2.167,-13.543,-18.883], constant_term=-10.567)
+# if __name__ == '__main__':
+#     solver = BatchSolver(chunk_size=2, progress=lambda done, total: print('{}/{}'.format(done, total)))
+#     for result in solver.solve([[p1,p2,p3], [p1,p2,p3,p4], LinearSystem([p2,p3,p4])]):
+#         print(result)
+#     for timing in solver.timings:
+#         print(timing)
@@ -0,0 +1,167 @@
+import threading
+import time
+
+from hyperplane import Hyperplane
+from linsys import LinearSystem
+from vector import Vector
+
+ELIMINATION_STAGES = ('compute_triangular_form', 'compute_rref', 'characterise_results', 'solve',
+                      'swap_for_nonzero_coefficient_eq', 'clear_coefficients_below',
+                      'clear_coefficients_above', 'scale_leading_term_coeff_to_1')
+ROW_OPERATIONS = ('swap_rows', 'multiply_coefficient_and_row', 'add_multiple_times_row_to_row')
+PLANE_ALLOCATIONS = ('Hyperplane.__init__', 'Hyperplane.copy')
+VECTOR_OPERATIONS = ('plus', 'minus', 'multiply', 'magnitude', 'direction', 'dot_product', 'angle',
+                     'is_zero', 'is_parallel', 'is_orthogonal', 'projection', 'orthogonal', 'cross_product')
+
+
+class Profile(object):
+
+    ALREADY_PROFILING_MSG = 'Another profile is already recording'
+    NOT_PROFILING_MSG = 'This profile is not recording'
+
+    # the wrappers are set on the classes themselves, so profiling is process-global and meant for
+    # single-threaded code: one profile records at a time, calls made from other threads while it
+    # records are mixed into its counts and timings, and worker processes (such as the pool of
+    # BatchSolver) are not patched at all
+    active = None
+    _lock = threading.Lock()
+
+    # records calls and wall time of the elimination stages, row operations and copy of LinearSystem
+    # and of plane construction and copies, and with vectors=True of Vector operations and constructions,
+    # plus the magnitude of every pivot clear_coefficients_below eliminates with; the methods are
+    # only wrapped between start() and stop(), so when no profile is recording nothing is added
+    # to any call; times are inclusive, so a stage counts the stages it calls
+    def __init__(self, vectors=True):
+        self.vectors = vectors
+        self.calls = {}
+        self.seconds = {}
+        self.pivots = []
+        self._originals = []
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _timed(self, name, func):
+        calls = self.calls
+        seconds = self.seconds
+        perf_counter = time.perf_counter
+
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                seconds[name] = seconds.get(name, 0.0) + (perf_counter() - start)
+                calls[name] = calls.get(name, 0) + 1
+
+        return wrapper
+
+    def _pivot_recorded(self, func):
+        pivots = self.pivots
+
+        def wrapper(system, row, col):
+            pivots.append(abs(float(system[row].normal_vector[col])))
+            return func(system, row, col)
+
+        return wrapper
+
+    def _patch(self, owner, name, label):
+        original = owner.__dict__[name]
+        self._originals.append((owner, name, original))
+
+        if isinstance(original, classmethod):
+            setattr(owner, name, classmethod(self._timed(label, original.__func__)))
+            return
+
+        wrapper = self._timed(label, original)
+        if name == 'clear_coefficients_below':
+            wrapper = self._pivot_recorded(wrapper)
+        setattr(owner, name, wrapper)
+
+    def start(self):
+        with Profile._lock:
+            if Profile.active is not None:
+                raise Exception(self.ALREADY_PROFILING_MSG)
+            Profile.active = self
+
+        for name in ELIMINATION_STAGES + ROW_OPERATIONS + ('copy',):
+            self._patch(LinearSystem, name, 'LinearSystem.' + name)
+        for name in ('__init__', 'copy'):
+            self._patch(Hyperplane, name, 'Hyperplane.' + name)
+
+        if self.vectors:
+            for name in VECTOR_OPERATIONS + ('__init__', '_from_coordinates'):
+                self._patch(Vector, name, 'Vector.' + name)
+
+    # only the recording profile may restore the methods, so a stray stop() cannot undo its wrappers
+    def stop(self):
+        with Profile._lock:
+            if Profile.active is not self:
+                raise Exception(self.NOT_PROFILING_MSG)
+
+            for owner, name, original in reversed(self._originals):
+                setattr(owner, name, original)
+            self._originals = []
+            Profile.active = None
+
+    def _calls(self, *names):
+        return sum([self.calls.get(name, 0) for name in names])
+
+    # the profile as plain dicts, lists and numbers, ready for json.dumps
+    def report(self):
+        stages = dict([(name, {'calls': self.calls[name], 'seconds': self.seconds[name]}) for name in self.calls])
+        pivots = self.pivots
+
+        return {
+            'stages': stages,
+            'row_operations': self._calls(*['LinearSystem.' + name for name in ROW_OPERATIONS]),
+            'swaps': self._calls('LinearSystem.swap_rows'),
+            'system_copies': self._calls('LinearSystem.copy'),
+            'plane_allocations': self._calls(*PLANE_ALLOCATIONS),
+            'vector_allocations': self._calls('Vector.__init__', 'Vector._from_coordinates'),
+            'pivots': {
+                'count': len(pivots),
+                'min': min(pivots) if pivots else None,
+                'max': max(pivots) if pivots else None,
+                'magnitudes': list(pivots),
+            },
+        }
+
+    def __str__(self):
+        report = self.report()
+
+        ret = '{:<50}{:>10}{:>14}\n'.format('stage', 'calls', 'seconds')
+        for name, stage in sorted(report['stages'].items(), key=lambda item: -item[1]['seconds']):
+            ret += '{:<50}{:>10}{:>14.6f}\n'.format(name, stage['calls'], stage['seconds'])
+
+        ret += 'row operations {}, swaps {}, system copies {}, planes allocated {}, vectors allocated {}\n'.format(
+            report['row_operations'], report['swaps'], report['system_copies'],
+            report['plane_allocations'], report['vector_allocations'])
+
+        pivots = report['pivots']
+        if pivots['count']:
+            ret += 'pivots {}, smallest magnitude {:.6g}, largest magnitude {:.6g}'.format(
+                pivots['count'], pivots['min'], pivots['max'])
+        else:
+            ret += 'no pivots'
+        return ret
+
+
+# records while used as `with profile() as p:`; print(p) or p.report() afterwards
+def profile(vectors=True):
+    return Profile(vectors)
+
+
+# from plane import Plane
+# p1 = Plane(normal_vector=[5.262,2.739,-9.878], constant_term=-3.441)
+# p2 = Plane(normal_vector=[5.111,6.358,7.638], constant_term=-2.152)
+# p3 = Plane(normal_vector=[2.016,-9.924,-1.367], constant_term=-9.278)
+# p4 = Plane(normal_vector=[2.167,-13.543,-18.883], constant_term=-10.567)
+# s = LinearSystem([p1,p2,p3,p4])
+# with profile() as p:
+#     s.characterise_results()
+# print(p)
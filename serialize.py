@@ -0,0 +1,236 @@
+import struct
+
+import numpy as np
+
+from densesys import DenseLinearSystem
+from hyperplane import Hyperplane
+from linsys import LinearSystem
+from solution import UNIQUE_SOLUTION
+from vectorbatch import VectorBatch
+
+# layout, all little endian:
+#   header, HEADER_SIZE bytes: magic, version, content, flags, dtype, count, equations, dimension
+#   coefficient block: VECTORS (count, dimension) or SYSTEMS (count, equations, dimension + 1) of dtype,
+#       each system as its augmented matrix with the constant terms in the last column
+#   solution block, when flags has HAS_SOLUTIONS: (count,) int8 kinds padded to BLOCK_ALIGNMENT,
+#       then (count, dimension) float64 solutions, NaN for every system without a unique one
+# every block starts at a multiple of BLOCK_ALIGNMENT so it can be mapped straight into an array
+MAGIC = b'LSYS'
+VERSION = 1
+HEADER = struct.Struct('<4sHHH8sQQQ')
+HEADER_SIZE = 64
+BLOCK_ALIGNMENT = 16
+
+VECTORS = 1
+SYSTEMS = 2
+
+HAS_SOLUTIONS = 1
+
+DTYPES = ('<f8', '<f4')
+
+NOT_A_SERIALIZED_FILE_MSG = 'The data does not start with the serialized format header'
+UNSUPPORTED_VERSION_MSG = 'The data was written by a newer version of the format'
+UNSUPPORTED_DTYPE_MSG = 'The coefficients must be stored as one of {}'.format(list(DTYPES))
+TRUNCATED_DATA_MSG = 'The data is shorter than its header says'
+ALL_SYSTEMS_MUST_HAVE_SAME_SHAPE_MSG = 'All systems should have the same number of equations and variables'
+SOLUTIONS_MUST_MATCH_MSG = 'There must be one kind and one solution per system'
+
+
+def _aligned(size):
+    return -(-size // BLOCK_ALIGNMENT) * BLOCK_ALIGNMENT
+
+
+class SerializedData(object):
+
+    # the arrays of one file or buffer; they are views or maps of it, not copies
+    def __init__(self, content, coefficients, kinds=None, solutions=None):
+        self.content = content
+        self.coefficients = coefficients
+        self.kinds = kinds
+        self.solutions = solutions
+
+    @property
+    def count(self):
+        return len(self.coefficients)
+
+    @property
+    def dimension(self):
+        if self.content == VECTORS:
+            return self.coefficients.shape[1]
+        return self.coefficients.shape[2] - 1
+
+    def to_vector_batch(self):
+        return VectorBatch(self.coefficients)
+
+    def to_dense_systems(self, tolerance=1e-10):
+        return [DenseLinearSystem.from_augmented(m, tolerance) for m in self.coefficients]
+
+    def to_linear_systems(self, plane_class=Hyperplane):
+        return [LinearSystem([plane_class(row[:-1], row[-1]) for row in m]) for m in self.coefficients.tolist()]
+
+
+def _header_fields(content, flags, dtype, shape):
+    count = shape[0]
+    equations = shape[1] if content == SYSTEMS else 0
+    dimension = shape[-1] - 1 if content == SYSTEMS else shape[1]
+    return HEADER.pack(MAGIC, VERSION, content, flags, dtype.encode('ascii'), count, equations, dimension)
+
+
+def _coerce_solutions(solutions, count, dimension):
+    kinds, points = solutions
+    kinds = np.asarray(kinds, dtype=np.int8)
+    points = np.asarray(points, dtype=np.float64)
+    if kinds.shape != (count,) or points.shape != (count, dimension):
+        raise Exception(SOLUTIONS_MUST_MATCH_MSG)
+    return kinds, points
+
+
+# accepts the (kinds, solutions) pair returned by batchsolve.solve_batch or a list of Solution
+# objects; a ParametricSolution is stored by its kind only, like solve_batch does
+def solution_arrays(solutions, dimension):
+    if isinstance(solutions, tuple):
+        return solutions
+
+    kinds = [s.kind for s in solutions]
+    points = [list(s.point.coordinates) if s.kind == UNIQUE_SOLUTION else [np.nan] * dimension
+              for s in solutions]
+    return kinds, np.array(points, dtype=np.float64).reshape(len(solutions), dimension)
+
+
+def _to_bytes(content, block, solutions, dtype):
+    if dtype not in DTYPES:
+        raise Exception(UNSUPPORTED_DTYPE_MSG)
+
+    block = np.ascontiguousarray(block, dtype=dtype)
+    flags = HAS_SOLUTIONS if solutions is not None else 0
+
+    header = _header_fields(content, flags, dtype, block.shape)
+    parts = [header, b'\0' * (HEADER_SIZE - len(header)), block.tobytes()]
+    parts.append(b'\0' * (_aligned(block.nbytes) - block.nbytes))
+
+    if solutions is not None:
+        dimension = block.shape[-1] - (1 if content == SYSTEMS else 0)
+        kinds, points = _coerce_solutions(solution_arrays(solutions, dimension), len(block), dimension)
+        parts += [kinds.tobytes(), b'\0' * (_aligned(kinds.nbytes) - kinds.nbytes), points.tobytes()]
+
+    return b''.join(parts)
+
+
+def _system_rows(system):
+    if isinstance(system, DenseLinearSystem):
+        return system.matrix
+    planes = system.planes if isinstance(system, LinearSystem) else system
+    return [[float(x) for x in p.normal_vector] + [float(p.constant_term)] for p in planes]
+
+
+# systems is a (K, m, d + 1) array of augmented matrices or a list of LinearSystem,
+# DenseLinearSystem or lists of planes, all with the same number of equations and variables
+def systems_to_bytes(systems, solutions=None, dtype='<f8'):
+    if not isinstance(systems, np.ndarray):
+        try:
+            systems = np.array([_system_rows(s) for s in systems], dtype=np.float64)
+        except ValueError:
+            raise Exception(ALL_SYSTEMS_MUST_HAVE_SAME_SHAPE_MSG)
+
+    if systems.ndim != 3:
+        raise Exception(ALL_SYSTEMS_MUST_HAVE_SAME_SHAPE_MSG)
+
+    return _to_bytes(SYSTEMS, systems, solutions, dtype)
+
+
+# vectors is a VectorBatch, a list of Vector or an (N, d) array
+def vectors_to_bytes(vectors, dtype='<f8'):
+    if isinstance(vectors, VectorBatch):
+        vectors = vectors.coordinates
+    elif not isinstance(vectors, np.ndarray):
+        vectors = [v.coordinates for v in vectors]
+
+    return _to_bytes(VECTORS, np.asarray(vectors, dtype=np.float64), None, dtype)
+
+
+def _read_header(header):
+    if len(header) < HEADER_SIZE:
+        raise Exception(NOT_A_SERIALIZED_FILE_MSG)
+
+    magic, version, content, flags, dtype, count, equations, dimension = HEADER.unpack_from(header)
+    if magic != MAGIC:
+        raise Exception(NOT_A_SERIALIZED_FILE_MSG)
+    if version > VERSION:
+        raise Exception(UNSUPPORTED_VERSION_MSG)
+
+    dtype = dtype.rstrip(b'\0').decode('ascii')
+    if dtype not in DTYPES:
+        raise Exception(UNSUPPORTED_DTYPE_MSG)
+
+    if content == SYSTEMS:
+        shape = (count, equations, dimension + 1)
+    else:
+        shape = (count, dimension)
+
+    return content, flags, np.dtype(dtype), shape, count, dimension
+
+
+# returns (offset, dtype, shape) of every block after the header
+def _blocks(content, flags, dtype, shape, count, dimension):
+    size = int(np.prod(shape)) * dtype.itemsize
+    blocks = [(HEADER_SIZE, dtype, shape)]
+
+    if flags & HAS_SOLUTIONS:
+        kinds_offset = HEADER_SIZE + _aligned(size)
+        blocks.append((kinds_offset, np.dtype(np.int8), (count,)))
+        blocks.append((kinds_offset + _aligned(count), np.dtype('<f8'), (count, dimension)))
+
+    return blocks
+
+
+def _end(blocks):
+    offset, dtype, shape = blocks[-1]
+    return offset + int(np.prod(shape)) * dtype.itemsize
+
+
+# reads bytes, a bytearray or any other buffer without copying the arrays out of it
+def from_bytes(buffer):
+    content, flags, dtype, shape, count, dimension = _read_header(bytes(memoryview(buffer)[:HEADER_SIZE]))
+    blocks = _blocks(content, flags, dtype, shape, count, dimension)
+    if len(buffer) < _end(blocks):
+        raise Exception(TRUNCATED_DATA_MSG)
+
+    arrays = [np.frombuffer(buffer, dtype=d, count=int(np.prod(s)), offset=o).reshape(s) for o, d, s in blocks]
+    return SerializedData(content, *arrays)
+
+
+def save(path, data):
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+# with mmap the arrays are read-only maps of the file, so only the rows that are used are read
+def load(path, mmap=True):
+    with open(path, 'rb') as f:
+        header = f.read(HEADER_SIZE)
+        content, flags, dtype, shape, count, dimension = _read_header(header)
+
+        # an empty block cannot be mapped
+        if not mmap or count == 0:
+            return from_bytes(header + f.read())
+
+    blocks = _blocks(content, flags, dtype, shape, count, dimension)
+
+    try:
+        arrays = [np.memmap(path, dtype=d, mode='r', offset=o, shape=s) for o, d, s in blocks]
+    except ValueError:
+        raise Exception(TRUNCATED_DATA_MSG)
+
+    return SerializedData(content, *arrays)
+
+
+# from plane import Plane
+# from batchsolve import solve_planes
+# p1 = Plane(normal_vector=[5.262,2.739,-9.878], constant_term=-3.441)
+# p2 = Plane(normal_vector=[5.111,6.358,7.638], constant_term=-2.152)
+# p3 = Plane(normal_vector=[2.016,-9.924,-1.367], constant_term=-9.278)
+# systems = [[p1,p2,p3], [p2,p3,p1]]
+# save('systems.lsys', systems_to_bytes(systems, solve_planes(systems)))
+# data = load('systems.lsys')
+# print(data.kinds, data.solutions)
+# print(data.to_linear_systems(Plane)[0].characterise_results())
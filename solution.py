@@ -0,0 +1,113 @@
+from vector import Vector
+
+UNIQUE_SOLUTION = 0
+NO_SOLUTION = 1
+INFINITE_SOLUTIONS = 2
+
+KIND_NAMES = {
+    UNIQUE_SOLUTION: 'unique',
+    NO_SOLUTION: 'none',
+    INFINITE_SOLUTIONS: 'infinite',
+}
+
+
+# base class of every solve() result; kind is one of the constants above, so consumers can
+# branch on an int instead of parsing strings
+class Solution(object):
+
+    kind = None
+
+    @property
+    def kind_name(self):
+        return KIND_NAMES[self.kind]
+
+
+class UniqueSolution(Solution):
+
+    kind = UNIQUE_SOLUTION
+
+    def __init__(self, point):
+        self.point = point
+
+    def __str__(self):
+        return 'Unique solution: {}'.format(self.point)
+
+
+class NoSolution(Solution):
+
+    kind = NO_SOLUTION
+
+    def __str__(self):
+        return 'No solution'
+
+
+# the solution set basepoint + t_1 * direction_vectors[0] + ... + t_k * direction_vectors[k-1];
+# free_variables, when known, gives the variable each parameter t_i stands for
+class ParametricSolution(Solution):
+
+    kind = INFINITE_SOLUTIONS
+
+    def __init__(self, basepoint, direction_vectors, free_variables=None):
+        self.basepoint = basepoint
+        self.direction_vectors = direction_vectors
+        self.free_variables = free_variables
+        self.num_parameters = len(direction_vectors)
+
+    def point(self, parameters):
+        result = self.basepoint
+        for t, direction in zip(parameters, self.direction_vectors):
+            result = result.plus(direction.multiply(t))
+        return result
+
+    # vectorized point(): parameters is an (N, num_parameters) array, one row of t values per point,
+    # and the result is the (N, d) array of the corresponding points
+    def evaluate(self, parameters):
+        import numpy as np
+
+        basepoint = np.array(self.basepoint.coordinates, dtype=np.float64)
+        basis = np.array([v.coordinates for v in self.direction_vectors], dtype=np.float64)
+        parameters = np.asarray(parameters, dtype=np.float64).reshape(-1, self.num_parameters)
+
+        return basepoint + parameters.dot(basis)
+
+    # returns count points of the solution set, with parameters drawn from a normal distribution
+    def sample(self, count, scale=1.0, seed=None):
+        import numpy as np
+
+        rng = np.random.default_rng(seed)
+        return self.evaluate(rng.normal(scale=scale, size=(count, self.num_parameters)))
+
+    def __str__(self):
+        terms = ['{}'.format(self.basepoint)]
+        terms += ['t_{} * {}'.format(i+1, v) for i, v in enumerate(self.direction_vectors)]
+        return 'Parametric solution: ' + ' + '.join(terms)
+
+
+# builds the result from a system in reduced row echelon form, given as rows of coefficients
+# and constants with the pivot column of each row (-1 for zero rows); free variables are set
+# to 0 in the basepoint and each one gets a direction vector with a 1 in its own column
+def solution_from_rref(coefficients, constants, pivot_columns, dimension, tolerance=1e-10):
+    for row_constant, j in zip(constants, pivot_columns):
+        if j < 0 and abs(row_constant) >= tolerance:
+            return NoSolution()
+
+    pivots = [(i, j) for i, j in enumerate(pivot_columns) if j >= 0]
+
+    basepoint = [0.0] * dimension
+    for i, j in pivots:
+        basepoint[j] = float(constants[i])
+
+    if len(pivots) == dimension:
+        return UniqueSolution(Vector(basepoint))
+
+    pivot_set = set([j for i, j in pivots])
+    free_variables = [j for j in range(dimension) if j not in pivot_set]
+    direction_vectors = []
+    for free in free_variables:
+        direction = [0.0] * dimension
+        direction[free] = 1.0
+        for i, j in pivots:
+            direction[j] = -float(coefficients[i][free])
+        direction_vectors.append(Vector(direction))
+
+    return ParametricSolution(Vector(basepoint), direction_vectors, free_variables)
@@ -0,0 +1,165 @@
+import heapq
+from decimal import Decimal
+
+
+class SparseEquation(object):
+
+    # coefficients maps variable index to value; zero coefficients are not stored
+    def __init__(self, coefficients, constant_term=0):
+        self.coefficients = dict((int(j), float(x)) for j, x in coefficients.items() if x)
+        self.constant_term = float(constant_term)
+
+    @classmethod
+    def from_plane(cls, plane):
+        return cls(dict(enumerate(plane.normal_vector)), plane.constant_term)
+
+    def __len__(self):
+        return len(self.coefficients)
+
+    def __str__(self):
+        terms = ['{}x_{}'.format(round(x, 3), j+1) for j, x in sorted(self.coefficients.items())]
+        return '{} = {}'.format(' + '.join(terms) or '0', round(self.constant_term, 3))
+
+
+class SparseLinearSystem(object):
+
+    EQUATION_OUT_OF_RANGE_MSG = 'Every variable index should be smaller than the dimension of the system'
+    NO_SOLUTIONS_MSG = 'No solutions'
+    INF_SOLUTIONS_MSG = 'Infinitely many solutions'
+
+    # a pivot is only accepted if it is at least this fraction of the largest entry in its row
+    PIVOT_THRESHOLD = 0.1
+
+    def __init__(self, equations, dimension, tolerance=1e-10):
+        for e in equations:
+            if any(j < 0 or j >= dimension for j in e.coefficients):
+                raise Exception(self.EQUATION_OUT_OF_RANGE_MSG)
+
+        self.equations = equations
+        self.dimension = dimension
+        self.tolerance = tolerance
+
+    @classmethod
+    def from_planes(cls, planes, tolerance=1e-10):
+        return cls([SparseEquation.from_plane(p) for p in planes], planes[0].dimension, tolerance)
+
+    def nonzeros(self):
+        return sum([len(e) for e in self.equations])
+
+    # sparse Gaussian elimination; the pivot row is always the active row with the fewest
+    # nonzeros and, within it, the column shared with the fewest other rows, which keeps
+    # fill-in low (a Markowitz-style ordering); returns the pivot rows as (column, row, constant)
+    # in elimination order and the number of zero rows left with a nonzero constant
+    def eliminate(self):
+        rows = [dict(e.coefficients) for e in self.equations]
+        constants = [e.constant_term for e in self.equations]
+
+        column_rows = {}
+        for i, row in enumerate(rows):
+            for j in row:
+                column_rows.setdefault(j, set()).add(i)
+
+        heap = [(len(row), i) for i, row in enumerate(rows)]
+        heapq.heapify(heap)
+        active = set(range(len(rows)))
+
+        pivots = []
+        inconsistent = 0
+
+        while heap:
+            count, r = heapq.heappop(heap)
+            if r not in active or count != len(rows[r]):
+                continue
+            active.discard(r)
+            row = rows[r]
+
+            if not row:
+                if abs(constants[r]) >= self.tolerance:
+                    inconsistent += 1
+                continue
+
+            largest = max([abs(x) for x in row.values()])
+            candidates = [j for j, x in row.items() if abs(x) >= self.PIVOT_THRESHOLD * largest]
+            c = min(candidates, key=lambda j: len(column_rows[j]))
+            pivot = row[c]
+
+            for j in row:
+                column_rows[j].discard(r)
+
+            for i in list(column_rows[c]):
+                target = rows[i]
+                factor = target[c] / pivot
+
+                for j, x in row.items():
+                    if j == c:
+                        continue
+                    value = target.get(j, 0.0) - factor * x
+                    if abs(value) < self.tolerance:
+                        if j in target:
+                            del target[j]
+                            column_rows[j].discard(i)
+                    else:
+                        if j not in target:
+                            column_rows[j].add(i)
+                        target[j] = value
+
+                # the pivot column is eliminated exactly rather than left to rounding, which could
+                # keep a residue above tolerance in a row that must no longer use it
+                del target[c]
+                column_rows[c].discard(i)
+
+                constants[i] -= factor * constants[r]
+                heapq.heappush(heap, (len(target), i))
+
+            pivots.append((c, row, constants[r]))
+
+        return pivots, inconsistent
+
+    # returns the solution as a list of floats, or a message when it is not unique
+    def solution(self):
+        pivots, inconsistent = self.eliminate()
+
+        if inconsistent:
+            return self.NO_SOLUTIONS_MSG
+        if len(pivots) < self.dimension:
+            return self.INF_SOLUTIONS_MSG
+
+        # every pivot row only involves its own column and columns pivoted after it
+        x = [0.0] * self.dimension
+        for c, row, constant in reversed(pivots):
+            rest = sum([v * x[j] for j, v in row.items() if j != c])
+            x[c] = (constant - rest) / row[c]
+
+        return x
+
+    # same strings as LinearSystem.characterise_results
+    def characterise_results(self):
+        solution = self.solution()
+
+        if solution == self.NO_SOLUTIONS_MSG:
+            return 'No Solution'
+        if solution == self.INF_SOLUTIONS_MSG:
+            return 'Infinite solutions'
+
+        return str([round(Decimal(x if abs(x) >= self.tolerance else 0.0), 3) for x in solution])
+
+
+    def __len__(self):
+        return len(self.equations)
+
+
+    def __getitem__(self, i):
+        return self.equations[i]
+
+
+    def __str__(self):
+        ret = 'Linear System:\n'
+        temp = ['Equation {}: {}'.format(i+1,e) for i,e in enumerate(self.equations)]
+        ret += '\n'.join(temp)
+        return ret
+
+
+# e1 = SparseEquation({0: 1, 999: 2}, 3)
+# e2 = SparseEquation({999: 1}, 1)
+# s = SparseLinearSystem([e1, e2] + [SparseEquation({j: 1}, j) for j in range(1, 999)], 1000)
+# print(s.solution()[:3], s.nonzeros())
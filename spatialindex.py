@@ -0,0 +1,155 @@
+import itertools
+import math
+from bisect import bisect_left, bisect_right, insort
+
+from grouping import canonical_form, cell_key, neighbour_cells, CANNOT_CANONICALIZE_ZERO_NORMAL_MSG
+from vector import Vector
+
+
+class HyperplaneIndex(object):
+
+    CANNOT_INDEX_ZERO_NORMAL_MSG = 'Cannot index a line or plane with a zero normal vector'
+    ALL_MEMBERS_MUST_BE_IN_SAME_DIM_MSG = 'All lines or planes in the index should live in the same dimension'
+    UNKNOWN_HANDLE_MSG = 'No line or plane with this handle is in the index'
+
+    # indexes Line or Plane objects (anything with normal_vector, constant_term and dimension)
+    # by the direction of their unit normal, quantized to cells of direction_resolution,
+    # and within each direction by their signed offset from the origin kept in sorted order
+    def __init__(self, dimension, direction_resolution=0.05, tolerance=1e-10):
+        self.dimension = dimension
+        self.direction_resolution = direction_resolution
+        self.tolerance = tolerance
+
+        # a unit normal differs from the centre of its cell by at most this much
+        self.max_direction_error = direction_resolution * math.sqrt(dimension) / 2
+
+        self.members = {}
+        self.buckets = {}
+        self.handles = itertools.count()
+
+    def __len__(self):
+        return len(self.members)
+
+    def __iter__(self):
+        return iter([m[0] for m in self.members.values()])
+
+    def canonical_form(self, hyperplane):
+        if hyperplane.dimension != self.dimension:
+            raise Exception(self.ALL_MEMBERS_MUST_BE_IN_SAME_DIM_MSG)
+
+        try:
+            return canonical_form(hyperplane, self.tolerance)
+
+        except Exception as e:
+            if str(e) == CANNOT_CANONICALIZE_ZERO_NORMAL_MSG:
+                raise Exception(self.CANNOT_INDEX_ZERO_NORMAL_MSG)
+            else:
+                raise e
+
+    def direction_key(self, unit):
+        return cell_key(unit, self.direction_resolution)
+
+    def _key_centre(self, key):
+        return [k * self.direction_resolution for k in key]
+
+    # adds a hyperplane and returns the handle used to remove it again
+    def insert(self, hyperplane):
+        unit, offset = self.canonical_form(hyperplane)
+        key = self.direction_key(unit)
+        handle = next(self.handles)
+
+        self.members[handle] = (hyperplane, unit, offset, key)
+        insort(self.buckets.setdefault(key, []), (offset, handle))
+
+        return handle
+
+    def remove(self, handle):
+        try:
+            hyperplane, unit, offset, key = self.members.pop(handle)
+
+        except KeyError:
+            raise Exception(self.UNKNOWN_HANDLE_MSG)
+
+        bucket = self.buckets[key]
+        del bucket[bisect_left(bucket, (offset, handle))]
+        if not bucket:
+            del self.buckets[key]
+
+        return hyperplane
+
+    # yields the handles in a bucket whose offsets lie in [low, high]
+    def _offset_range(self, bucket, low, high):
+        start = bisect_left(bucket, (low, -1))
+        stop = bisect_right(bucket, (high, math.inf))
+        for offset, handle in bucket[start:stop]:
+            yield handle
+
+    # returns every member whose distance to point is at most distance
+    def within_distance(self, point, distance):
+        if isinstance(point, Vector):
+            point = point.coordinates
+        point = [float(x) for x in point]
+        slack = self.max_direction_error * math.sqrt(sum([x * x for x in point]))
+
+        result = []
+        for key, bucket in self.buckets.items():
+            centre = sum([c * x for c, x in zip(self._key_centre(key), point)])
+            for handle in self._offset_range(bucket, centre - distance - slack, centre + distance + slack):
+                hyperplane, unit, offset, key = self.members[handle]
+                if abs(sum([u * x for u, x in zip(unit, point)]) - offset) <= distance:
+                    result.append(hyperplane)
+
+        return result
+
+    # returns every member parallel to hyperplane (including those equal to it)
+    def parallel_to(self, hyperplane):
+        unit, offset = self.canonical_form(hyperplane)
+
+        # a unit normal near a cell boundary may have its parallel partners in the next cell; one
+        # near the boundaries in too many components is compared with every member instead
+        cells = neighbour_cells(unit, self.direction_resolution, self.tolerance)
+        if cells is None:
+            candidates = self.members.values()
+        else:
+            candidates = [self.members[handle] for cell in cells for offset_1, handle in self.buckets.get(cell, [])]
+
+        result = []
+        for member, unit_1, offset_1, key_1 in candidates:
+            if all(abs(u - u_1) < self.tolerance for u, u_1 in zip(unit, unit_1)):
+                result.append(member)
+
+        return result
+
+    # returns every member that passes through the axis-aligned box [lower, upper]
+    def intersecting_box(self, lower, upper):
+        lower = [float(x) for x in lower]
+        upper = [float(x) for x in upper]
+        radius = math.sqrt(sum([max(lo * lo, hi * hi) for lo, hi in zip(lower, upper)]))
+        slack = self.max_direction_error * radius
+
+        result = []
+        for key, bucket in self.buckets.items():
+            low, high = self._box_range(self._key_centre(key), lower, upper)
+            for handle in self._offset_range(bucket, low - slack, high + slack):
+                hyperplane, unit, offset, key = self.members[handle]
+                low_1, high_1 = self._box_range(unit, lower, upper)
+                if low_1 - self.tolerance <= offset <= high_1 + self.tolerance:
+                    result.append(hyperplane)
+
+        return result
+
+    # returns the smallest and largest value of normal . x over the corners of the box
+    @staticmethod
+    def _box_range(normal, lower, upper):
+        low = sum([min(n * lo, n * hi) for n, lo, hi in zip(normal, lower, upper)])
+        high = sum([max(n * lo, n * hi) for n, lo, hi in zip(normal, lower, upper)])
+        return low, high
+
+
+# from line import Line
+# index = HyperplaneIndex(2)
+# for line in [Line([4.046, 2.836], 1.21), Line([10.115, 7.09], 3.025), Line([7.204, 3.182], 8.68)]:
+#     index.insert(line)
+# print([str(l) for l in index.within_distance([0, 0], 0.5)])
+# print([str(l) for l in index.parallel_to(Line([1.182, 5.562], 6.744))])
+# print([str(l) for l in index.intersecting_box([0, 0], [1, 1])])
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from batchsolve import solve_batch, solve_planes
+from hyperplane import Hyperplane
+from linsys import LinearSystem
+from plane import Plane
+from solution import UNIQUE_SOLUTION, NO_SOLUTION, INFINITE_SOLUTIONS
+
+p1 = Plane(normal_vector=[5.262, 2.739, -9.878], constant_term=-3.441)
+p2 = Plane(normal_vector=[5.111, 6.358, 7.638], constant_term=-2.152)
+p3 = Plane(normal_vector=[2.016, -9.924, -1.367], constant_term=-9.278)
+p4 = Plane(normal_vector=[2.167, -13.543, -18.883], constant_term=-10.567)
+
+
+def test_square_system():
+    kinds, solutions = solve_planes([[p1, p2, p3]])
+
+    assert kinds.tolist() == [UNIQUE_SOLUTION]
+    assert solutions[0] == pytest.approx([-1.177, 0.707, -0.083], abs=1e-3)
+
+
+def test_overdetermined_systems():
+    inconsistent = Plane(normal_vector=[5.262, 2.739, -9.878], constant_term=1)
+    kinds, solutions = solve_planes([[p1, p2, p3, p4], [p1, p2, p3, inconsistent]])
+
+    assert kinds.tolist() == [UNIQUE_SOLUTION, NO_SOLUTION]
+    assert solutions[0] == pytest.approx([-1.177, 0.707, -0.083], abs=1e-3)
+    assert np.isnan(solutions[1]).all()
+
+
+def test_fewer_equations_than_variables():
+    parallel = Plane(normal_vector=[10.524, 5.478, -19.756], constant_term=0)
+    kinds, solutions = solve_planes([[p1, p2], [p1, parallel]])
+
+    assert kinds.tolist() == [INFINITE_SOLUTIONS, NO_SOLUTION]
+    assert solutions.shape == (2, 3)
+    assert np.isnan(solutions).all()
+
+
+def test_agrees_with_linear_system_on_random_shapes():
+    rng = np.random.default_rng(0)
+    for num_eqs, num_vars in [(1, 2), (2, 4), (3, 3), (5, 3)]:
+        coefficients = rng.integers(-3, 4, size=(50, num_eqs, num_vars)).astype(float)
+        constants = rng.integers(-3, 4, size=(50, num_eqs)).astype(float)
+        kinds, solutions = solve_batch(coefficients, constants)
+
+        for k in range(50):
+            planes = [Hyperplane(n, c) for n, c in zip(coefficients[k].tolist(), constants[k].tolist())]
+            expected = LinearSystem(planes).solve()
+            assert kinds[k] == expected.kind
+            if expected.kind == UNIQUE_SOLUTION:
+                assert solutions[k] == pytest.approx(list(expected.point.coordinates), abs=1e-9)
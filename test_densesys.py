@@ -0,0 +1,131 @@
+import numpy as np
+import pytest
+
+from densesys import DenseLinearSystem
+from linsys import LinearSystem
+from plane import Plane
+from solution import INFINITE_SOLUTIONS, NO_SOLUTION, UNIQUE_SOLUTION
+
+p1 = Plane(normal_vector=[5.262, 2.739, -9.878], constant_term=-3.441)
+p2 = Plane(normal_vector=[5.111, 6.358, 7.638], constant_term=-2.152)
+p3 = Plane(normal_vector=[2.016, -9.924, -1.367], constant_term=-9.278)
+p4 = Plane(normal_vector=[2.167, -13.543, -18.883], constant_term=-10.567)
+
+CASES = [
+    ([p1, p2, p3], UNIQUE_SOLUTION),
+    ([p1, p2, p3, p4], UNIQUE_SOLUTION),
+    ([Plane(normal_vector=[5.862, 1.178, -10.366], constant_term=-8.15),
+      Plane(normal_vector=[-2.931, -0.589, 5.183], constant_term=-4.075)], NO_SOLUTION),
+    ([Plane(normal_vector=[8.631, 5.112, -1.816], constant_term=-5.113),
+      Plane(normal_vector=[4.315, 11.132, -5.27], constant_term=-6.775),
+      Plane(normal_vector=[-2.158, 3.01, -1.727], constant_term=-0.831)], INFINITE_SOLUTIONS),
+    ([Plane(normal_vector=[0.935, 1.76, -9.365], constant_term=-9.955),
+      Plane(normal_vector=[0.187, 0.352, -1.873], constant_term=-1.991),
+      Plane(normal_vector=[0.374, 0.704, -3.746], constant_term=-3.982),
+      Plane(normal_vector=[-0.561, -1.056, 5.619], constant_term=5.973)], INFINITE_SOLUTIONS),
+    ([Plane(normal_vector=[1, 1, 1], constant_term=1), Plane(normal_vector=[0, 1, 0], constant_term=2),
+      Plane(normal_vector=[1, 1, -1], constant_term=3), Plane(normal_vector=[1, 0, -2], constant_term=2)],
+     UNIQUE_SOLUTION),
+    ([Plane(normal_vector=[1, 1, 1], constant_term=1), Plane(normal_vector=[1, 1, 1], constant_term=2)],
+     NO_SOLUTION),
+]
+
+
+def coordinates(vector):
+    return [float(x) for x in vector.coordinates]
+
+
+@pytest.mark.parametrize('planes, kind', CASES)
+@pytest.mark.parametrize('pivoting', [True, False])
+def test_matches_linear_system(planes, kind, pivoting):
+    dense = DenseLinearSystem(planes)
+    expected = LinearSystem(planes).solve()
+
+    assert dense.characterise_results() == LinearSystem(planes).characterise_results()
+
+    rref = dense.compute_rref(pivoting)
+    result = dense.solve()
+    assert result.kind == expected.kind == kind
+
+    pivot_columns = rref.indices_of_first_nonzero_terms_in_each_row()
+    assert pivot_columns[pivot_columns >= 0].tolist() == sorted(set(pivot_columns.tolist()) - set([-1]))
+
+    if kind == UNIQUE_SOLUTION:
+        assert coordinates(result.point) == pytest.approx(coordinates(expected.point), abs=1e-9)
+        assert pivot_columns[:3].tolist() == [0, 1, 2]
+        assert rref.constants[:3].tolist() == pytest.approx(coordinates(expected.point), abs=1e-9)
+
+    if kind == INFINITE_SOLUTIONS:
+        assert (pivot_columns >= 0).sum() == dense.dimension - expected.num_parameters
+        assert result.free_variables == expected.free_variables
+        assert coordinates(result.basepoint) == pytest.approx(coordinates(expected.basepoint), abs=1e-9)
+        for direction, expected_direction in zip(result.direction_vectors, expected.direction_vectors):
+            assert coordinates(direction) == pytest.approx(coordinates(expected_direction), abs=1e-9)
+
+
+@pytest.mark.parametrize('planes, kind', [c for c in CASES if c[1] == INFINITE_SOLUTIONS])
+def test_parametric_basis_spans_the_solutions(planes, kind):
+    dense = DenseLinearSystem(planes)
+    result = dense.solve()
+
+    basepoint = np.array(coordinates(result.basepoint))
+    basis = np.array([coordinates(v) for v in result.direction_vectors])
+
+    assert result.num_parameters == len(basis) == dense.dimension - np.linalg.matrix_rank(dense.coefficients)
+    assert np.allclose(dense.coefficients.dot(basepoint), dense.constants, atol=1e-9)
+    assert np.allclose(dense.coefficients.dot(basis.T), 0, atol=1e-9)
+    assert np.allclose(result.sample(5, seed=0).dot(dense.coefficients.T), dense.constants, atol=1e-9)
+
+
+def test_without_pivoting_reproduces_linear_system_triangular_form():
+    planes = [p1, p2, p3, p4]
+
+    dense = DenseLinearSystem(planes).compute_triangular_form(pivoting=False)
+    expected = LinearSystem(planes).compute_triangular_form()
+
+    for row, plane in zip(dense.matrix.tolist(), expected.planes):
+        assert row == pytest.approx([float(x) for x in plane.normal_vector] + [float(plane.constant_term)], abs=1e-9)
+
+
+def test_pivoting_uses_the_largest_pivot():
+    coefficients = [[1e-8, 1.0], [1.0, 1.0]]
+    dense = DenseLinearSystem.from_matrix(coefficients, [1.0, 2.0])
+
+    assert dense.compute_triangular_form(pivoting=True).matrix[0].tolist() == [1.0, 1.0, 2.0]
+    assert dense.compute_triangular_form(pivoting=False).matrix[0].tolist() == [1e-8, 1.0, 1.0]
+
+    expected = np.linalg.solve(coefficients, [1.0, 2.0])
+    assert coordinates(dense.solve().point) == pytest.approx(expected.tolist(), abs=1e-15)
+
+
+def test_from_augmented_aliases_without_copy():
+    matrix = np.array([[1.0, 1.0, 3.0], [1.0, -1.0, 1.0]])
+
+    aliased = DenseLinearSystem.from_augmented(matrix, copy=False)
+    copied = DenseLinearSystem.from_augmented(matrix)
+
+    assert aliased.matrix is matrix
+    assert not np.shares_memory(copied.matrix, matrix)
+
+    assert coordinates(aliased.solve().point) == [2.0, 1.0]
+    assert matrix.tolist() == [[1.0, 1.0, 3.0], [1.0, -1.0, 1.0]]
+
+    aliased.swap_rows(0, 1)
+    assert matrix.tolist() == [[1.0, -1.0, 1.0], [1.0, 1.0, 3.0]]
+    assert copied.matrix.tolist() == [[1.0, 1.0, 3.0], [1.0, -1.0, 1.0]]
+
+
+def test_from_augmented_converts_other_dtypes():
+    matrix = np.array([[1, 1, 3], [1, -1, 1]])
+
+    system = DenseLinearSystem.from_augmented(matrix, copy=False)
+
+    assert system.matrix.dtype == np.float64
+    assert not np.shares_memory(system.matrix, matrix)
+
+
+def test_planes_must_share_a_dimension():
+    from line import Line
+
+    with pytest.raises(Exception, match=DenseLinearSystem.ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG):
+        DenseLinearSystem([p1, Line([1, 2], 3)])
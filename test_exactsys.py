@@ -0,0 +1,95 @@
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+
+from exactsys import ExactLinearSystem, to_fraction
+from hyperplane import Hyperplane
+from linsys import LinearSystem
+from plane import Plane
+from solution import INFINITE_SOLUTIONS, NO_SOLUTION, UNIQUE_SOLUTION
+
+
+def planes(equations):
+    return [Plane(normal_vector=list(n), constant_term=k) for n, k in equations]
+
+
+def test_to_fraction_reads_floats_by_their_repr():
+    assert to_fraction(0.1) == Fraction(1, 10)
+    assert to_fraction(5.862) == Fraction(2931, 500)
+    assert to_fraction(Decimal('-3.441')) == Fraction(-3441, 1000)
+    assert to_fraction(7) == 7
+    assert to_fraction(Fraction(2, 3)) == Fraction(2, 3)
+
+
+def test_integer_system_has_an_exact_fraction_solution():
+    s = ExactLinearSystem(planes([([0, 1, 1], 1), ([1, -1, 1], 2), ([1, 2, -5], 3)]))
+
+    solution = s.exact_solution()
+
+    assert solution == [Fraction(23, 9), Fraction(7, 9), Fraction(2, 9)]
+    assert all(isinstance(x, Fraction) for x in solution)
+    assert s.characterise_results() == str([Decimal('2.556'), Decimal('0.778'), Decimal('0.222')])
+    assert s.rank() == 3
+
+
+def test_short_decimals_match_linear_system():
+    equations = [([5.262, 2.739, -9.878], -3.441), ([5.111, 6.358, 7.638], -2.152),
+                 ([2.016, -9.924, -1.367], -9.278), ([2.167, -13.543, -18.883], -10.567)]
+
+    assert ExactLinearSystem(planes(equations)).characterise_results() == \
+        LinearSystem(planes(equations)).characterise_results()
+
+
+def test_singular_system():
+    s = ExactLinearSystem(planes([([1, 1, 1], 1), ([0, 1, 0], 2), ([1, 2, 1], 3)]))
+
+    assert s.exact_solution() == ExactLinearSystem.INF_SOLUTIONS_MSG
+    assert s.characterise_results() == 'Infinite solutions'
+    assert s.rank() == 2
+
+
+def test_inconsistent_system():
+    s = ExactLinearSystem(planes([([1, 1, 1], 1), ([1, 1, 1], 2)]))
+
+    assert s.exact_solution() == ExactLinearSystem.NO_SOLUTIONS_MSG
+    assert s.characterise_results() == 'No Solution'
+
+
+# the multiples of 0.1 are only dependent when read exactly, which the float elimination
+# makes up for with its tolerance
+@pytest.mark.parametrize('equations, kind', [
+    ([([3, 1, 1], 1), ([6, 2, 2], 2), ([0, 1, 2], 1)], INFINITE_SOLUTIONS),
+    ([([0.1, 0.2, 0.3], Decimal('0.6')), ([0.3, 0.6, 0.9], Decimal('1.8'))], INFINITE_SOLUTIONS),
+    ([([1, 1, 1], 1), ([0, 1, 1], 2)], INFINITE_SOLUTIONS),
+    ([([1, 2, 0, 1], 1), ([0, 0, 1, 1], 2), ([1, 2, 1, 2], 3)], INFINITE_SOLUTIONS),
+    ([([0.1, 0.2, 0.3], Decimal('0.6')), ([0.3, 0.6, 0.9], Decimal('1.9'))], NO_SOLUTION),
+    ([([1, 2, 3], 4), ([2, 0, 1], 1), ([0, 1, 0], 5)], UNIQUE_SOLUTION),
+])
+def test_agrees_with_linear_system_solve(equations, kind):
+    hyperplanes = [Hyperplane(list(n), k) for n, k in equations]
+    result = LinearSystem(hyperplanes).solve()
+    exact = ExactLinearSystem(hyperplanes)
+
+    assert result.kind == kind
+    if kind == NO_SOLUTION:
+        assert exact.exact_solution() == ExactLinearSystem.NO_SOLUTIONS_MSG
+    if kind == INFINITE_SOLUTIONS:
+        assert exact.exact_solution() == ExactLinearSystem.INF_SOLUTIONS_MSG
+
+    rref = exact.compute_rref()
+    expected = LinearSystem(hyperplanes).compute_rref()
+    for row, expected_row in zip(rref.rows, expected.planes):
+        assert [float(x) for x in row[:-1]] == pytest.approx([float(x) for x in expected_row.normal_vector], abs=1e-9)
+        if kind != NO_SOLUTION:
+            assert float(row[-1]) == pytest.approx(float(expected_row.constant_term), abs=1e-9)
+
+    if kind == UNIQUE_SOLUTION:
+        assert [float(x) for x in exact.exact_solution()] == pytest.approx(list(result.point.coordinates))
+    if kind == INFINITE_SOLUTIONS:
+        assert exact.rank() == len(hyperplanes[0].normal_vector) - result.num_parameters
+
+
+def test_planes_must_share_a_dimension():
+    with pytest.raises(Exception, match=ExactLinearSystem.ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG):
+        ExactLinearSystem([Hyperplane([1, 2], 1), Hyperplane([1, 2, 3], 1)])
@@ -0,0 +1,65 @@
+import grouping
+from grouping import cluster, group_equal, group_parallel, neighbour_cells
+from hyperplane import Hyperplane
+from plane import Plane
+
+
+def test_neighbour_cells_only_cross_near_boundaries():
+    assert neighbour_cells((0.0, 1.0, -2.0), 1.0, 0.1) == [(0, 1, -2)]
+    assert neighbour_cells((0.45, 1.0, -2.46), 1.0, 0.1) == [(0, 1, -2), (1, 1, -2), (0, 1, -3), (1, 1, -3)]
+    assert neighbour_cells((0.49,) * 10, 1.0, 0.1, max_boundary_components=8) is None
+
+
+def test_cluster_matches_across_cell_boundaries():
+    tolerance = 1e-10
+    cell = 64 * tolerance
+    boundary = 10.5 * cell
+
+    entries = [((boundary - tolerance / 4, boundary + tolerance / 4), 'a'),
+               ((boundary + tolerance / 4, boundary - tolerance / 4), 'b'),
+               ((boundary + 2 * tolerance, boundary), 'c')]
+
+    assert cluster(entries, tolerance) == [['a', 'b'], ['c']]
+
+
+def test_cluster_falls_back_to_scan_near_many_boundaries():
+    tolerance = 1e-10
+    boundary = 10.5 * 64 * tolerance
+
+    entries = [(tuple([boundary + (-1) ** (i + j) * tolerance / 4 for j in range(12)]), i) for i in range(4)]
+    entries.append((tuple([boundary + 2 * tolerance] * 12), 'far'))
+
+    assert cluster(entries, tolerance) == [[0, 1, 2, 3], ['far']]
+
+
+def test_groups_planes():
+    planes = [Plane([-0.412, 3.806, 0.728], -3.46), Plane([1.03, -9.515, -1.82], 8.65),
+              Plane([-7.926, 8.625, -7.212], -7.952), Plane([-2.642, 2.875, -2.404], -2.443)]
+
+    assert group_parallel(planes) == [[planes[0], planes[1]], [planes[2], planes[3]]]
+    assert group_equal(planes) == [[planes[0], planes[1]], [planes[2]], [planes[3]]]
+
+
+# values on no cell boundary probe only their own cell, however many dimensions they have
+def test_axis_aligned_hyperplanes_in_many_dimensions(monkeypatch):
+    probes = []
+
+    def counted_neighbour_cells(*args, **kwargs):
+        cells = neighbour_cells(*args, **kwargs)
+        probes.append(cells)
+        return cells
+
+    monkeypatch.setattr(grouping, 'neighbour_cells', counted_neighbour_cells)
+
+    dimension = 20
+    hyperplanes = []
+    for i in range(dimension):
+        normal = [0.0] * dimension
+        normal[i] = 1.0
+        hyperplanes += [Hyperplane(normal, 1.0), Hyperplane([2 * x for x in normal], 2.0)]
+
+    groups = group_equal(hyperplanes)
+
+    assert groups == [hyperplanes[i:i + 2] for i in range(0, len(hyperplanes), 2)]
+    assert len(probes) == len(hyperplanes)
+    assert all(cells is not None and len(cells) == 1 for cells in probes)
@@ -0,0 +1,41 @@
+import numpy as np
+
+from hyperplane import Hyperplane, are_equal, are_parallel, hyperplanes_to_arrays
+
+HYPERPLANES = [Hyperplane([1, 2, 3], 4), Hyperplane([-2, -4, -6], -8), Hyperplane([2, 4, 6], 1),
+               Hyperplane([1, 2, 3.1], 4), Hyperplane([1e-12, 0, 0], 1), Hyperplane([0, 0, 0], 0)]
+
+
+def pairs(method):
+    return np.array([[getattr(h, method)(h_1) for h_1 in HYPERPLANES] for h in HYPERPLANES[:-1]])
+
+
+def test_are_parallel_matches_is_parallel():
+    normals, constants = hyperplanes_to_arrays(HYPERPLANES)
+
+    result = are_parallel(normals[:-1, np.newaxis], normals[np.newaxis])
+
+    assert np.array_equal(result, pairs('is_parallel'))
+
+
+def test_are_parallel_treats_short_normals_as_zero():
+    assert are_parallel([[1, 2]], [[1e-11, 0]]).tolist() == [True]
+    assert are_parallel([[1, 2]], [[1e-9, 0]]).tolist() == [False]
+    assert are_parallel([[1, 2]], [[1e-9, 0]], tolerance=1e-8).tolist() == [True]
+
+
+def test_are_equal():
+    normals, constants = hyperplanes_to_arrays(HYPERPLANES[:4])
+
+    result = are_equal(normals[:, np.newaxis], constants[:, np.newaxis], normals[np.newaxis], constants[np.newaxis])
+
+    assert result.tolist() == [[True, True, False, False], [True, True, False, False],
+                               [False, False, True, False], [False, False, False, True]]
+
+
+def test_my_decimal_is_still_importable_from_line_and_plane():
+    from hyperplane import MyDecimal
+    from line import MyDecimal as LineMyDecimal
+    from plane import MyDecimal as PlaneMyDecimal
+
+    assert LineMyDecimal is MyDecimal and PlaneMyDecimal is MyDecimal
@@ -0,0 +1,41 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from benchmark import IMPORT_MODULES, check_imports
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+# only the numpy backed and pool modules may load these, never the core classes
+HEAVY_MODULES = ('numpy', 'multiprocessing', 'concurrent', 'fractions', 'vectorbatch', 'densesys', 'lu',
+                 'exactsys', 'poolsolve', 'lineintersect', 'spatialindex', 'profiling')
+
+
+# imports module in a fresh interpreter and returns the names of every module loaded afterwards
+def loaded_modules(module):
+    script = 'import json, sys; import {}; print(json.dumps(sorted(sys.modules)))'.format(module)
+    return json.loads(subprocess.check_output([sys.executable, '-c', script], cwd=DIRECTORY))
+
+
+@pytest.mark.parametrize('module', IMPORT_MODULES)
+def test_import_does_not_load_heavy_modules(module):
+    loaded = loaded_modules(module)
+
+    assert module in loaded
+    assert [name for name in loaded if name.split('.')[0] in HEAVY_MODULES] == []
+
+
+def test_check_imports_finds_no_problems():
+    seconds, problems = check_imports(repeat=2)
+
+    assert problems == []
+    assert seconds > 0
+
+
+def test_check_imports_reports_numpy():
+    seconds, problems = check_imports(('vector', 'numpy'), repeat=2)
+
+    assert problems == ['importing loads numpy']
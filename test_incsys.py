@@ -0,0 +1,127 @@
+import random
+
+import numpy as np
+import pytest
+
+from hyperplane import Hyperplane
+from incsys import IncrementalLinearSystem, INCONSISTENT, PIVOT, REDUNDANT
+from linsys import LinearSystem
+from plane import Plane
+from solution import NO_SOLUTION
+
+
+def nonzero_rows(system):
+    rows = [[float(x) for x in p.normal_vector] + [float(p.constant_term)] for p in system.planes]
+    return [row for row in rows if any(abs(x) >= 1e-10 for x in row[:-1])]
+
+
+# the basis kept by s against the RREF of its planes computed from scratch; the basis has a 1 in
+# each of its pivot columns and 0 in the others, but its pivots are the largest entries rather
+# than the leftmost, so it is brought to the same canonical form first; when the equations are
+# inconsistent the RREF of the augmented matrix has a pivot in the constant column, which clears
+# the other constants, so only the coefficients are compared then
+def assert_matches_from_scratch(s):
+    if not len(s):
+        assert s.rank() == 0 and s.is_consistent()
+        return
+
+    system = LinearSystem(list(s.planes))
+    expected = nonzero_rows(system.compute_rref())
+    consistent = system.solve().kind != NO_SOLUTION
+
+    assert s.rank() == len(expected)
+    assert s.is_consistent() == consistent
+    if not expected:
+        return
+
+    assert s.basis[:, s.pivot_columns].tolist() == np.eye(s.rank()).tolist()
+    basis = LinearSystem([Hyperplane(row[:-1], row[-1]) for row in s.basis.tolist()])
+
+    columns = slice(None) if consistent else slice(None, -1)
+    assert [row[columns] for row in nonzero_rows(basis.compute_rref())] == \
+        [pytest.approx(row[columns], abs=1e-9) for row in expected]
+
+
+def test_adding_an_equation_that_makes_the_system_inconsistent():
+    s = IncrementalLinearSystem(3)
+    p1 = Plane(normal_vector=[1, 1, 1], constant_term=1)
+    p2 = Plane(normal_vector=[0, 1, 0], constant_term=2)
+    p3 = Plane(normal_vector=[1, 2, 1], constant_term=3)
+    p4 = Plane(normal_vector=[2, 3, 2], constant_term=5)
+
+    for p in (p1, p2):
+        s.append(p)
+        assert_matches_from_scratch(s)
+    assert s.characterise_results() == 'Infinite solutions'
+
+    s.append(p3)
+    assert s.statuses[-1] == REDUNDANT
+    assert_matches_from_scratch(s)
+    assert s.is_consistent()
+
+    s.append(p4)
+    assert s.statuses[-1] == INCONSISTENT
+    assert_matches_from_scratch(s)
+    assert not s.is_consistent()
+    assert s.characterise_results() == 'No Solution'
+
+    del s[3]
+    assert_matches_from_scratch(s)
+    assert s.is_consistent()
+
+    s[2] = Plane(normal_vector=[1, 0, -1], constant_term=0)
+    assert s.statuses[-1] == PIVOT
+    assert_matches_from_scratch(s)
+    assert s.solution() == pytest.approx(LinearSystem(list(s.planes)).solve().point.coordinates)
+
+
+def test_removing_a_pivot_rebuilds_the_basis():
+    planes = [Plane(normal_vector=[5.262, 2.739, -9.878], constant_term=-3.441),
+              Plane(normal_vector=[5.111, 6.358, 7.638], constant_term=-2.152),
+              Plane(normal_vector=[2.016, -9.924, -1.367], constant_term=-9.278),
+              Plane(normal_vector=[2.167, -13.543, -18.883], constant_term=-10.567)]
+    s = IncrementalLinearSystem(3, planes)
+
+    assert s.statuses == [PIVOT, PIVOT, PIVOT, REDUNDANT]
+    assert s.characterise_results() == LinearSystem(planes).characterise_results()
+
+    del s[0]
+    assert s.dirty
+    s.append(planes[0])
+    assert_matches_from_scratch(s)
+    assert not s.dirty
+    assert s.characterise_results() == LinearSystem(planes).characterise_results()
+
+
+def test_random_adds_removes_and_replacements():
+    rng = random.Random(13)
+    dimension = 4
+    s = IncrementalLinearSystem(dimension)
+
+    # small integer coefficients make redundant and inconsistent equations common
+    def random_plane():
+        return Hyperplane([rng.randint(-2, 2) for _ in range(dimension)], rng.randint(-2, 2))
+
+    seen = set()
+    for _ in range(400):
+        action = rng.random()
+        if action < 0.5 or len(s) < 2:
+            s.append(random_plane())
+        elif action < 0.8:
+            del s[rng.randrange(len(s))]
+        else:
+            s[rng.randrange(len(s))] = random_plane()
+        if len(s) > 8:
+            del s[0]
+
+        assert_matches_from_scratch(s)
+        seen.update(s.statuses)
+
+    assert set([PIVOT, REDUNDANT, INCONSISTENT]) <= seen
+
+
+def test_planes_must_share_the_dimension():
+    s = IncrementalLinearSystem(3)
+
+    with pytest.raises(Exception, match=IncrementalLinearSystem.ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG):
+        s.append(Hyperplane([1, 2], 3))
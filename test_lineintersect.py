@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from line import Line
+from lineintersect import ALL_LINES_MUST_BE_2D_MSG, intersect_all_pairs, intersect_pairs, lines_to_arrays
+from plane import Plane
+from solution import INFINITE_SOLUTIONS, NO_SOLUTION, UNIQUE_SOLUTION
+
+# intersecting, coincident and parallel pairs, including scaled and flipped normals
+PAIRS = [(Line([4.046, 2.836], 1.21), Line([10.115, 7.09], 3.025)),
+         (Line([7.204, 3.182], 8.68), Line([8.172, 4.114], 9.883)),
+         (Line([1.182, 5.562], 6.744), Line([1.773, 8.343], 9.525)),
+         (Line([1, 2], 3), Line([-2, -4], -6)),
+         (Line([1, 2], 3), Line([-2, -4], 6)),
+         (Line([0, 3], 3), Line([5, 0], 10)),
+         (Line([1, 1], 0), Line([1, -1], 0))]
+
+
+def test_pairs_match_line_intersection():
+    lines, lines_1 = zip(*PAIRS)
+    normals, constants = lines_to_arrays(lines)
+    normals_1, constants_1 = lines_to_arrays(lines_1)
+
+    kinds, points = intersect_pairs(normals, constants, normals_1, constants_1)
+
+    expected = [l.intersection(l_1) for l, l_1 in PAIRS]
+    assert kinds.tolist() == [e.kind for e in expected]
+    assert set(kinds.tolist()) == set([UNIQUE_SOLUTION, NO_SOLUTION, INFINITE_SOLUTIONS])
+
+    for kind, point, e in zip(kinds, points, expected):
+        if kind == UNIQUE_SOLUTION:
+            assert point.tolist() == pytest.approx(list(e.point.coordinates))
+        else:
+            assert np.isnan(point).all()
+
+
+def test_all_pairs_match_line_intersection():
+    lines = [l for pair in PAIRS for l in pair]
+    normals, constants = lines_to_arrays(lines)
+
+    for block_size in (1, 3, 1024):
+        i, j, kinds, points = intersect_all_pairs(normals, constants, block_size=block_size)
+
+        assert list(zip(i.tolist(), j.tolist())) == [(i, j) for i in range(len(lines)) for j in range(i + 1, len(lines))]
+        for a, b, kind, point in zip(i, j, kinds, points):
+            expected = lines[a].intersection(lines[b])
+            assert kind == expected.kind
+            if kind == UNIQUE_SOLUTION:
+                assert point.tolist() == pytest.approx(list(expected.point.coordinates))
+
+
+def test_fewer_than_two_lines():
+    normals, constants = lines_to_arrays([Line([1, 2], 3)])
+
+    i, j, kinds, points = intersect_all_pairs(normals, constants)
+
+    assert len(i) == len(j) == len(kinds) == 0 and points.shape == (0, 2)
+
+
+def test_lines_must_be_2d():
+    with pytest.raises(Exception, match=ALL_LINES_MUST_BE_2D_MSG):
+        lines_to_arrays([Plane(normal_vector=[1, 2, 3], constant_term=4)])
@@ -0,0 +1,95 @@
+import random
+from decimal import Decimal
+
+import pytest
+
+from hyperplane import Hyperplane
+from linsys import LinearSystem
+from plane import Plane
+from profiling import Profile
+from solution import INFINITE_SOLUTIONS, UNIQUE_SOLUTION
+
+EQUATIONS = [([5.262, 2.739, -9.878], -3.441),
+             ([5.111, 6.358, 7.638], -2.152),
+             ([2.016, -9.924, -1.367], -9.278)]
+SOLUTION = [-1.177, 0.707, -0.083]
+
+
+def make_system(**kwargs):
+    return LinearSystem([Plane(normal_vector=list(n), constant_term=k) for n, k in EQUATIONS], **kwargs)
+
+
+@pytest.mark.parametrize('precision', [5, 8, 10, 16, 30])
+@pytest.mark.parametrize('in_place', [False, True])
+def test_reduced_precision_solves_well_conditioned_system(precision, in_place):
+    s = make_system(precision=precision, in_place=in_place)
+
+    assert s.characterise_results() == str([Decimal(str(x)) for x in SOLUTION])
+
+    result = s.solve()
+    assert result.kind == UNIQUE_SOLUTION
+    assert list(result.point.coordinates) == pytest.approx(SOLUTION, abs=1e-3)
+
+
+@pytest.mark.parametrize('precision', [4, 5, 8, 10, 16, 30])
+@pytest.mark.parametrize('in_place', [None, False])
+def test_reduced_precision_keeps_rank_deficient_system_parametric(precision, in_place):
+    s = LinearSystem([Hyperplane([3, 1, 1], 1), Hyperplane([1, 1 / 3, 1 / 3], 1 / 3), Hyperplane([0, 1, 2], 1)],
+                     precision=precision, in_place=in_place)
+
+    assert s.solve().kind == INFINITE_SOLUTIONS
+    assert s.characterise_results() == 'Infinite solutions'
+
+
+def test_tolerance_follows_precision_unless_given():
+    assert make_system().tolerance == 1e-10
+    assert make_system(precision=5).tolerance == 1e-3
+    assert make_system(precision=5, tolerance=1e-6).tolerance == 1e-6
+    assert all(p.tolerance == 1e-3 for p in make_system(precision=5).copy().planes)
+
+
+def test_rref_has_exact_pivots_at_reduced_precision():
+    rref = make_system(precision=5).compute_rref()
+
+    for i, p in enumerate(rref.planes):
+        assert p.normal_vector == [1.0 if j == i else 0.0 for j in range(3)]
+
+
+def random_system(num_eqs, num_vars, seed=0, **kwargs):
+    rng = random.Random(seed)
+    planes = [Hyperplane([rng.uniform(-10, 10) for _ in range(num_vars)], rng.uniform(-10, 10))
+              for _ in range(num_eqs)]
+    return LinearSystem(planes, **kwargs)
+
+
+def profiled(system, method):
+    with Profile() as p:
+        result = getattr(system, method)()
+    return result, p.report()
+
+
+@pytest.mark.parametrize('method', ['characterise_results', 'solve', 'compute_rref'])
+@pytest.mark.parametrize('make', [make_system, lambda **kwargs: random_system(8, 8, **kwargs)])
+def test_in_place_elimination_allocates_less_with_the_same_result(method, make):
+    in_place, in_place_report = profiled(make(in_place=True), method)
+    replacing, replacing_report = profiled(make(in_place=False), method)
+
+    assert str(in_place) == str(replacing)
+    assert in_place_report['row_operations'] == replacing_report['row_operations']
+    assert in_place_report['plane_allocations'] < replacing_report['plane_allocations']
+    assert in_place_report['vector_allocations'] < replacing_report['vector_allocations']
+
+    by_default, by_default_report = profiled(make(), method)
+    assert str(by_default) == str(in_place)
+    assert by_default_report['plane_allocations'] == in_place_report['plane_allocations']
+
+
+def test_elimination_leaves_the_planes_of_the_system_alone():
+    s = make_system()
+    planes = list(s.planes)
+    coefficients = [list(p.normal_vector) + [p.constant_term] for p in planes]
+
+    s.compute_rref()
+
+    assert s.planes == planes
+    assert [list(p.normal_vector) + [p.constant_term] for p in planes] == coefficients
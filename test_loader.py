@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+import loader
+
+MATRIX = np.array([[1.0, 1.0, 3.0], [1.0, -1.0, 1.0]])
+
+
+def write(tmp_path, name, text):
+    path = str(tmp_path / name)
+    with open(path, 'w') as f:
+        f.write(text)
+    return path
+
+
+def test_text_rows_of_different_width(tmp_path):
+    path = write(tmp_path, 'rows.csv', '1,2,3\n4,5\n')
+
+    with pytest.raises(Exception, match=loader.ROWS_MUST_HAVE_SAME_WIDTH_MSG) as error:
+        list(loader.iter_text_chunks(path))
+    assert isinstance(error.value.__cause__, ValueError)
+
+
+def test_text_value_that_is_not_a_number(tmp_path):
+    path = write(tmp_path, 'values.csv', '1,2,3\n4,x,6\n')
+
+    with pytest.raises(Exception, match=loader.NOT_A_NUMBER_MSG) as error:
+        list(loader.iter_text_chunks(path))
+    assert 'x' in str(error.value.__cause__)
+
+
+def test_text_chunks_with_comments_and_blank_lines(tmp_path):
+    path = write(tmp_path, 'system.txt', '# x y k\n1 1 3\n\n1 -1 1  # second\n')
+
+    chunks = list(loader.iter_text_chunks(path, chunk_rows=1))
+
+    assert [c.tolist() for c in chunks] == [[row] for row in MATRIX.tolist()]
+    assert np.array_equal(loader.load_array(path), MATRIX)
+
+
+@pytest.mark.parametrize('name', ['system.npy', 'system.bin'])
+def test_load_system_uses_the_memory_map_as_it_is(tmp_path, name):
+    path = str(tmp_path / name)
+    if name.endswith('.npy'):
+        np.save(path, MATRIX)
+    else:
+        MATRIX.tofile(path)
+
+    mapped = loader.load_array(path, width=3)
+    system = loader.load_system(path, width=3)
+
+    assert isinstance(mapped, np.memmap)
+    assert not system.matrix.flags.writeable
+    assert list(system.solve().point.coordinates) == [2.0, 1.0]
+    assert np.array_equal(system.matrix, MATRIX)
+
+    writable = loader.load_system(path, width=3, mmap=False)
+    writable.swap_rows(0, 1)
+    assert np.array_equal(writable.matrix, MATRIX[::-1])
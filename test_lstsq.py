@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from lstsq import LeastSquaresSolver
+
+
+def solve(coefficients, constants, chunk_size=None):
+    coefficients = np.asarray(coefficients, dtype=np.float64)
+    solver = LeastSquaresSolver(coefficients.shape[1])
+    chunk_size = chunk_size or len(coefficients)
+    for start in range(0, len(coefficients), chunk_size):
+        solver.add_rows(coefficients[start:start + chunk_size], constants[start:start + chunk_size])
+    return solver.solve()
+
+
+@pytest.mark.parametrize('coefficients, rank', [
+    ([[0, 1], [0, 0], [0, 0]], 1),
+    ([[1, 1, 0], [0, 0, 1]], 2),
+    ([[1, 2], [2, 4], [3, 6]], 1),
+    ([[0, 0], [0, 0]], 0),
+])
+def test_rank_of_rank_deficient_systems(coefficients, rank):
+    result = solve(coefficients, np.ones(len(coefficients)))
+
+    assert result.rank == rank
+    assert result.rank == np.linalg.matrix_rank(np.asarray(coefficients, dtype=np.float64))
+
+
+def test_matches_numpy_over_chunks():
+    rng = np.random.default_rng(0)
+    a = rng.standard_normal((50, 4))
+    b = rng.standard_normal(50)
+
+    result = solve(a, b, chunk_size=7)
+    expected, residuals, rank, _ = np.linalg.lstsq(a, b, rcond=None)
+
+    assert result.rank == rank == 4
+    assert result.num_equations == 50
+    assert result.solution == pytest.approx(expected)
+    assert result.residual_sum_of_squares == pytest.approx(float(residuals[0]))
@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+from hyperplane import Hyperplane
+from linsys import LinearSystem
+from lu import LUCache, LUFactorization
+from plane import Plane
+
+PLANES = [[Plane(normal_vector=[0, 1, 1], constant_term=1), Plane(normal_vector=[1, -1, 1], constant_term=2),
+           Plane(normal_vector=[1, 2, -5], constant_term=3)],
+          [Plane(normal_vector=[5.262, 2.739, -9.878], constant_term=-3.441),
+           Plane(normal_vector=[5.111, 6.358, 7.638], constant_term=-2.152),
+           Plane(normal_vector=[2.016, -9.924, -1.367], constant_term=-9.278)]]
+
+
+def coefficients(planes):
+    return [list(p.normal_vector) for p in planes]
+
+
+@pytest.mark.parametrize('planes', PLANES)
+def test_solve_matches_linear_system(planes):
+    expected = list(LinearSystem(planes).solve().point.coordinates)
+
+    assert LUFactorization.from_planes(planes).solve([p.constant_term for p in planes]).tolist() == \
+        pytest.approx(expected)
+    assert LUCache().solve_planes(planes).tolist() == pytest.approx(expected)
+
+
+def test_solve_several_right_hand_sides():
+    rng = np.random.default_rng(0)
+    a = rng.standard_normal((6, 6))
+    b = rng.standard_normal((6, 4))
+
+    factorization = LUFactorization(a)
+
+    assert np.allclose(factorization.solve(b), np.linalg.solve(a, b))
+    for k in range(4):
+        planes = [Hyperplane(row, constant) for row, constant in zip(a.tolist(), b[:, k].tolist())]
+        assert factorization.solve(b[:, k]).tolist() == \
+            pytest.approx(list(LinearSystem(planes).solve().point.coordinates))
+
+
+def test_singular_matrix_raises():
+    with pytest.raises(Exception, match=LUFactorization.SINGULAR_MATRIX_MSG):
+        LUFactorization([[1, 2], [2, 4]])
+
+    cache = LUCache()
+    with pytest.raises(Exception, match=LUFactorization.SINGULAR_MATRIX_MSG):
+        cache.solve([[1, 1, 1], [0, 1, 0], [1, 2, 1]], [1, 2, 3])
+    assert len(cache) == 0
+
+
+def test_shape_errors():
+    with pytest.raises(Exception, match=LUFactorization.MATRIX_MUST_BE_SQUARE_MSG):
+        LUFactorization([[1, 2, 3], [4, 5, 6]])
+    with pytest.raises(Exception, match=LUFactorization.CONSTANTS_MUST_MATCH_MSG):
+        LUFactorization([[1, 2], [3, 4]]).solve([1, 2, 3])
+
+
+def test_cache_hits_misses_and_evictions_follow_maxsize():
+    cache = LUCache(maxsize=2)
+    a, b, c = [np.eye(3) * k for k in (1.0, 2.0, 3.0)]
+
+    cache.solve(a, [1, 2, 3])
+    cache.solve(b, [1, 2, 3])
+    assert (cache.hits, cache.misses, len(cache)) == (0, 2, 2)
+
+    assert cache.solve(a.tolist(), [2, 4, 6]).tolist() == [2, 4, 6]
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    # b is now the least recently used, so it is evicted for c
+    cache.solve(c, [3, 3, 3])
+    assert (cache.hits, cache.misses, len(cache)) == (1, 3, 2)
+    assert cache.factorization(a) is cache.factorization(a)
+    assert (cache.hits, cache.misses) == (3, 3)
+
+    cache.solve(b, [2, 2, 2])
+    assert (cache.hits, cache.misses, len(cache)) == (3, 4, 2)
+    cache.solve(c, [3, 3, 3])
+    assert cache.misses == 5
+
+    cache.clear()
+    assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
+
+
+def test_keys_are_shape_and_values():
+    cache = LUCache()
+
+    cache.factorization(np.eye(4))
+    cache.factorization(np.eye(4).copy())
+    cache.factorization(np.diag([1.0, 1.0]))
+
+    assert (cache.hits, cache.misses) == (1, 2)
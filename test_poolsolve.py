@@ -0,0 +1,74 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from hyperplane import Hyperplane
+from linsys import LinearSystem
+from plane import Plane
+from poolsolve import BatchSolver, CHARACTERISE_RESULTS, pack_systems, solve_chunk, SOLVE
+
+p1 = Plane(normal_vector=[5.262, 2.739, -9.878], constant_term=-3.441)
+p2 = Plane(normal_vector=[5.111, 6.358, 7.638], constant_term=-2.152)
+p3 = Plane(normal_vector=[2.016, -9.924, -1.367], constant_term=-9.278)
+p4 = Plane(normal_vector=[2.167, -13.543, -18.883], constant_term=-10.567)
+
+# unique, no and infinite solutions, in 3 and 4 dimensions, as lists of planes and as systems
+SYSTEMS = [[p1, p2, p3], [p1, p2, p3, p4], LinearSystem([p2, p3, p4]), [p1, p2],
+           [p1, Plane(normal_vector=[10.524, 5.478, -19.756], constant_term=0)],
+           [Hyperplane([1, 2, 0, 1], 1), Hyperplane([0, 0, 1, 1], 2)],
+           [Hyperplane([1, 0, 0, 0], 1), Hyperplane([0, 1, 0, 0], 2), Hyperplane([0, 0, 1, 0], 3),
+            Hyperplane([0, 0, 0, 1], 4)]]
+
+
+def sequential(method):
+    return [getattr(s if isinstance(s, LinearSystem) else LinearSystem(list(s)), method)() for s in SYSTEMS]
+
+
+@pytest.mark.parametrize('processes', [1, 2])
+@pytest.mark.parametrize('chunk_size', [1, 3, 32])
+def test_solve_matches_sequential_solve_in_order(processes, chunk_size):
+    results = BatchSolver(processes=processes, chunk_size=chunk_size).solve(SYSTEMS)
+    expected = sequential(SOLVE)
+
+    assert [type(r) for r in results] == [type(e) for e in expected]
+    assert [str(r) for r in results] == [str(e) for e in expected]
+    for r, e in zip(results, expected):
+        assert getattr(r, 'free_variables', None) == getattr(e, 'free_variables', None)
+
+
+def test_characterise_results_matches_sequential():
+    results = BatchSolver(processes=1, chunk_size=2, method=CHARACTERISE_RESULTS).solve(SYSTEMS)
+
+    assert results == sequential(CHARACTERISE_RESULTS)
+
+
+def test_solutions_come_back_as_arrays():
+    shapes, data = pack_systems(SYSTEMS)
+    index, results, seconds, pid = solve_chunk((0, shapes, data, SOLVE, 30, None))
+
+    assert all(isinstance(a, np.ndarray) for a in results)
+    assert b'solution' not in pickle.dumps(results)
+
+
+def test_progress_is_called_once_per_chunk():
+    calls = []
+    solver = BatchSolver(processes=1, chunk_size=3, progress=lambda done, total: calls.append((done, total)))
+
+    solver.solve(SYSTEMS)
+
+    assert calls == [(3, 7), (6, 7), (7, 7)]
+    assert [(t.index, t.start, t.size) for t in solver.timings] == [(0, 0, 3), (1, 3, 3), (2, 6, 1)]
+
+
+def test_progress_of_an_iterator_has_no_total():
+    calls = []
+    BatchSolver(processes=1, chunk_size=4, progress=lambda done, total: calls.append((done, total))).solve(
+        iter(SYSTEMS))
+
+    assert calls == [(4, None), (7, None)]
+
+
+def test_unknown_method():
+    with pytest.raises(Exception, match='The method must be one of'):
+        BatchSolver(method='compute_rref')
@@ -0,0 +1,129 @@
+import threading
+
+import pytest
+
+from hyperplane import Hyperplane
+from linsys import LinearSystem
+from plane import Plane
+from profiling import ELIMINATION_STAGES, ROW_OPERATIONS, VECTOR_OPERATIONS, Profile, profile
+from vector import Vector
+
+
+def make_system():
+    p1 = Plane(normal_vector=[5.262, 2.739, -9.878], constant_term=-3.441)
+    p2 = Plane(normal_vector=[5.111, 6.358, 7.638], constant_term=-2.152)
+    p3 = Plane(normal_vector=[2.016, -9.924, -1.367], constant_term=-9.278)
+    return LinearSystem([p1, p2, p3])
+
+
+def class_attributes():
+    attributes = {}
+    for owner, names in ((LinearSystem, ELIMINATION_STAGES + ROW_OPERATIONS + ('copy',)),
+                         (Hyperplane, ('__init__', 'copy')),
+                         (Vector, VECTOR_OPERATIONS + ('__init__', '_from_coordinates'))):
+        for name in names:
+            attributes[(owner, name)] = owner.__dict__[name]
+    return attributes
+
+
+def test_records_while_active():
+    system = make_system()
+
+    with profile() as p:
+        assert Profile.active is p
+        system.solve()
+
+    report = p.report()
+    assert report['stages']['LinearSystem.solve']['calls'] == 1
+    assert report['stages']['LinearSystem.compute_rref']['calls'] == 1
+    assert all(stage['seconds'] >= 0 for stage in report['stages'].values())
+    assert report['stages']['LinearSystem.solve']['seconds'] >= report['stages']['LinearSystem.compute_rref']['seconds']
+    assert report['row_operations'] > 0
+    assert report['plane_allocations'] > 0
+    assert report['vector_allocations'] > 0
+    assert report['pivots']['count'] == 3
+    assert report['pivots']['min'] > 0
+
+
+def test_nothing_is_recorded_outside_start_and_stop():
+    system = make_system()
+    p = Profile()
+
+    system.solve()
+    p.start()
+    p.stop()
+    system.solve()
+
+    assert p.calls == {} and p.seconds == {} and p.pivots == []
+
+
+def test_without_vectors():
+    with profile(vectors=False) as p:
+        make_system().solve()
+
+    assert p.report()['vector_allocations'] == 0
+    assert not any(name.startswith('Vector.') for name in p.calls)
+
+
+def test_original_methods_are_restored():
+    before = class_attributes()
+
+    with profile():
+        assert all(owner.__dict__[name] is not original for (owner, name), original in before.items())
+        make_system().solve()
+
+    assert all(owner.__dict__[name] is original for (owner, name), original in before.items())
+    assert Profile.active is None
+
+
+def test_original_methods_are_restored_after_an_error():
+    before = class_attributes()
+
+    with pytest.raises(ZeroDivisionError):
+        with profile():
+            1 / 0
+
+    assert all(owner.__dict__[name] is original for (owner, name), original in before.items())
+    assert Profile.active is None
+
+
+def test_second_profile_cannot_start():
+    before = class_attributes()
+
+    with profile() as p:
+        q = Profile()
+        with pytest.raises(Exception, match=Profile.ALREADY_PROFILING_MSG):
+            q.start()
+        with pytest.raises(Exception, match=Profile.NOT_PROFILING_MSG):
+            q.stop()
+        assert Profile.active is p
+
+    assert all(owner.__dict__[name] is original for (owner, name), original in before.items())
+
+
+def test_stop_without_start():
+    with pytest.raises(Exception, match=Profile.NOT_PROFILING_MSG):
+        Profile().stop()
+
+
+def test_only_one_of_many_threads_starts():
+    profiles = [Profile() for _ in range(8)]
+    started = []
+    barrier = threading.Barrier(len(profiles))
+
+    def start(p):
+        barrier.wait()
+        try:
+            p.start()
+            started.append(p)
+        except Exception:
+            pass
+
+    threads = [threading.Thread(target=start, args=(p,)) for p in profiles]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(started) == 1 and Profile.active is started[0]
+    started[0].stop()
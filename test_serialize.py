@@ -0,0 +1,195 @@
+import numpy as np
+import pytest
+
+import serialize
+from batchsolve import solve_planes
+from densesys import DenseLinearSystem
+from linsys import LinearSystem
+from plane import Plane
+from solution import INFINITE_SOLUTIONS, NO_SOLUTION, UNIQUE_SOLUTION
+from vector import Vector
+from vectorbatch import VectorBatch
+
+p1 = Plane(normal_vector=[5.262, 2.739, -9.878], constant_term=-3.441)
+p2 = Plane(normal_vector=[5.111, 6.358, 7.638], constant_term=-2.152)
+p3 = Plane(normal_vector=[2.016, -9.924, -1.367], constant_term=-9.278)
+
+# one system of each solution kind
+SYSTEMS = [[p1, p2, p3],
+           [p1, p2, Plane(normal_vector=[10.373, 9.097, -2.24], constant_term=-5.0)],
+           [p1, p2, Plane(normal_vector=[10.373, 9.097, -2.24], constant_term=-5.593)]]
+KINDS = [UNIQUE_SOLUTION, NO_SOLUTION, INFINITE_SOLUTIONS]
+
+
+def augmented(systems):
+    return np.array([[list(p.normal_vector) + [p.constant_term] for p in s] for s in systems], dtype=np.float64)
+
+
+def roundtrip(data, tmp_path, how):
+    if how == 'bytes':
+        return serialize.from_bytes(data)
+    path = str(tmp_path / 'data.lsys')
+    serialize.save(path, data)
+    return serialize.load(path, mmap=how == 'mmap')
+
+
+@pytest.mark.parametrize('how', ['bytes', 'file', 'mmap'])
+def test_systems_with_each_solution_kind(tmp_path, how):
+    solutions = [LinearSystem(list(s)).solve() for s in SYSTEMS]
+    assert [s.kind for s in solutions] == KINDS
+
+    data = roundtrip(serialize.systems_to_bytes(SYSTEMS, solutions), tmp_path, how)
+
+    assert data.content == serialize.SYSTEMS
+    assert (data.count, data.dimension) == (3, 3)
+    assert np.array_equal(data.coefficients, augmented(SYSTEMS))
+    assert data.kinds.tolist() == KINDS
+    assert data.solutions[0] == pytest.approx(list(solutions[0].point.coordinates))
+    assert np.isnan(data.solutions[1:]).all()
+
+    assert [s.solve().kind for s in data.to_linear_systems(Plane)] == KINDS
+    assert [s.solve().kind for s in data.to_dense_systems()] == KINDS
+
+
+def test_solve_batch_solutions_and_system_types():
+    systems = [LinearSystem(list(SYSTEMS[0])), DenseLinearSystem.from_augmented(augmented(SYSTEMS[1:2])[0]),
+               SYSTEMS[2]]
+    kinds, points = solve_planes(SYSTEMS)
+
+    data = serialize.from_bytes(serialize.systems_to_bytes(systems, (kinds, points)))
+
+    assert np.array_equal(data.coefficients, augmented(SYSTEMS))
+    assert np.array_equal(data.kinds, kinds)
+    assert np.array_equal(data.solutions, points, equal_nan=True)
+
+
+def test_systems_without_solutions():
+    data = serialize.from_bytes(serialize.systems_to_bytes(augmented(SYSTEMS)))
+
+    assert data.kinds is None and data.solutions is None
+    assert np.array_equal(data.coefficients, augmented(SYSTEMS))
+
+
+@pytest.mark.parametrize('how', ['bytes', 'file', 'mmap'])
+def test_vectors(tmp_path, how):
+    vectors = [Vector([1, 2, 3]), Vector([-0.5, 0, 1e-300])]
+
+    data = roundtrip(serialize.vectors_to_bytes(vectors), tmp_path, how)
+
+    assert data.content == serialize.VECTORS
+    assert (data.count, data.dimension) == (2, 3)
+    assert data.to_vector_batch() == VectorBatch.from_vectors(vectors)
+    assert serialize.from_bytes(serialize.vectors_to_bytes(data.to_vector_batch())).coefficients.tolist() == \
+        data.coefficients.tolist()
+
+
+@pytest.mark.parametrize('dtype, numpy_dtype', [('<f8', np.float64), ('<f4', np.float32)])
+def test_dtypes(dtype, numpy_dtype):
+    coefficients = augmented(SYSTEMS)
+    solutions = solve_planes(SYSTEMS)
+
+    data = serialize.systems_to_bytes(coefficients, solutions, dtype=dtype)
+    loaded = serialize.from_bytes(data)
+
+    assert loaded.coefficients.dtype == numpy_dtype
+    assert np.array_equal(loaded.coefficients, coefficients.astype(numpy_dtype))
+    assert loaded.solutions.dtype == np.float64
+    assert np.array_equal(loaded.solutions, solutions[1], equal_nan=True)
+    assert len(data) == len(serialize.systems_to_bytes(coefficients, solutions, dtype='<f8')) - \
+        (0 if dtype == '<f8' else coefficients.size * 4)
+
+
+def test_blocks_are_aligned():
+    data = serialize.systems_to_bytes(augmented(SYSTEMS[:1]), solve_planes(SYSTEMS[:1]), dtype='<f4')
+    loaded = serialize.from_bytes(data)
+
+    for array in (loaded.coefficients, loaded.kinds, loaded.solutions):
+        offset = array.__array_interface__['data'][0] - loaded.coefficients.__array_interface__['data'][0]
+        assert (offset + serialize.HEADER_SIZE) % serialize.BLOCK_ALIGNMENT == 0
+
+
+def test_unsupported_dtype():
+    with pytest.raises(Exception, match=serialize.UNSUPPORTED_DTYPE_MSG.replace('[', r'\[')):
+        serialize.systems_to_bytes(augmented(SYSTEMS), dtype='<i4')
+
+
+@pytest.mark.parametrize('how', ['bytes', 'file', 'mmap'])
+def test_empty(tmp_path, how):
+    systems = roundtrip(serialize.systems_to_bytes(np.zeros((0, 2, 4)), (np.zeros(0), np.zeros((0, 3)))),
+                        tmp_path, how)
+    assert systems.coefficients.shape == (0, 2, 4)
+    assert systems.kinds.shape == (0,) and systems.solutions.shape == (0, 3)
+    assert systems.to_linear_systems() == []
+
+    vectors = roundtrip(serialize.vectors_to_bytes(np.zeros((0, 3))), tmp_path, how)
+    assert vectors.coefficients.shape == (0, 3)
+
+
+def test_mmap_load_maps_the_file(tmp_path):
+    path = str(tmp_path / 'systems.lsys')
+    serialize.save(path, serialize.systems_to_bytes(SYSTEMS, solve_planes(SYSTEMS)))
+
+    mapped = serialize.load(path)
+    read = serialize.load(path, mmap=False)
+
+    for array in (mapped.coefficients, mapped.kinds, mapped.solutions):
+        assert isinstance(array, np.memmap)
+        assert not array.flags.writeable
+    assert not isinstance(read.coefficients, np.memmap)
+    assert np.array_equal(mapped.coefficients, read.coefficients)
+    assert np.array_equal(mapped.solutions, read.solutions, equal_nan=True)
+
+
+def test_mismatched_systems_and_solutions():
+    with pytest.raises(Exception, match=serialize.ALL_SYSTEMS_MUST_HAVE_SAME_SHAPE_MSG):
+        serialize.systems_to_bytes([[p1, p2], [p1, p2, p3]])
+
+    with pytest.raises(Exception, match=serialize.SOLUTIONS_MUST_MATCH_MSG):
+        serialize.systems_to_bytes(SYSTEMS, (np.zeros(2), np.zeros((2, 3))))
+
+
+@pytest.mark.parametrize('with_solutions', [False, True])
+def test_truncated(tmp_path, with_solutions):
+    data = serialize.systems_to_bytes(SYSTEMS, solve_planes(SYSTEMS) if with_solutions else None)
+    path = str(tmp_path / 'truncated.lsys')
+    serialize.save(path, data[:-1])
+
+    with pytest.raises(Exception, match=serialize.TRUNCATED_DATA_MSG):
+        serialize.from_bytes(data[:-1])
+    for mmap in (True, False):
+        with pytest.raises(Exception, match=serialize.TRUNCATED_DATA_MSG):
+            serialize.load(path, mmap=mmap)
+
+
+def test_header_shorter_than_header_size(tmp_path):
+    data = serialize.vectors_to_bytes([Vector([1, 2])])
+    path = str(tmp_path / 'short.lsys')
+    serialize.save(path, data[:serialize.HEADER_SIZE - 1])
+
+    with pytest.raises(Exception, match=serialize.NOT_A_SERIALIZED_FILE_MSG):
+        serialize.from_bytes(data[:serialize.HEADER_SIZE - 1])
+    with pytest.raises(Exception, match=serialize.NOT_A_SERIALIZED_FILE_MSG):
+        serialize.load(path)
+
+
+def test_bad_magic(tmp_path):
+    data = b'NOPE' + serialize.vectors_to_bytes([Vector([1, 2])])[4:]
+    path = str(tmp_path / 'magic.lsys')
+    serialize.save(path, data)
+
+    with pytest.raises(Exception, match=serialize.NOT_A_SERIALIZED_FILE_MSG):
+        serialize.from_bytes(data)
+    with pytest.raises(Exception, match=serialize.NOT_A_SERIALIZED_FILE_MSG):
+        serialize.load(path)
+
+
+def test_newer_version(tmp_path):
+    data = bytearray(serialize.vectors_to_bytes([Vector([1, 2])]))
+    data[4:6] = (serialize.VERSION + 1).to_bytes(2, 'little')
+    path = str(tmp_path / 'version.lsys')
+    serialize.save(path, bytes(data))
+
+    with pytest.raises(Exception, match=serialize.UNSUPPORTED_VERSION_MSG):
+        serialize.from_bytes(data)
+    with pytest.raises(Exception, match=serialize.UNSUPPORTED_VERSION_MSG):
+        serialize.load(path)
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from linsys import LinearSystem
+from plane import Plane
+from solution import INFINITE_SOLUTIONS, NO_SOLUTION, UNIQUE_SOLUTION, solution_from_rref
+
+
+def test_parametric_solution_of_a_line_in_space():
+    s = LinearSystem([Plane(normal_vector=[1, 1, 1], constant_term=1),
+                      Plane(normal_vector=[0, 1, 1], constant_term=2)])
+
+    result = s.solve()
+
+    assert result.kind == INFINITE_SOLUTIONS and result.kind_name == 'infinite'
+    assert result.num_parameters == 1
+    assert result.free_variables == [2]
+    assert len(result.basepoint.coordinates) == 3
+
+
+def test_evaluate_and_sample_take_one_value_per_parameter():
+    result = solution_from_rref([[1, 0, 2, 0], [0, 1, -1, 0]], [1, 2], [0, 1], 4)
+
+    assert result.num_parameters == 2
+    assert result.free_variables == [2, 3]
+
+    points = result.evaluate([[0, 0], [1, 0], [0, 1], [2, -3]])
+    assert points.shape == (4, 4)
+    assert points.tolist() == [list(result.point(t).coordinates) for t in [[0, 0], [1, 0], [0, 1], [2, -3]]]
+
+    samples = result.sample(50, seed=1)
+    assert samples.shape == (50, 4)
+    assert np.allclose(samples[:, :2] + samples[:, 2:3] * [[2, -1]], [1, 2])
+
+
+@pytest.mark.parametrize('constants, kind', [([1, 2, 0], UNIQUE_SOLUTION), ([1, 2, 3], NO_SOLUTION)])
+def test_unique_and_no_solution(constants, kind):
+    result = solution_from_rref([[1, 0], [0, 1], [0, 0]], constants, [0, 1, -1], 2)
+
+    assert result.kind == kind
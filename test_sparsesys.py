@@ -0,0 +1,59 @@
+import random
+
+import numpy as np
+import pytest
+
+from linsys import LinearSystem
+from plane import Plane
+from sparsesys import SparseEquation, SparseLinearSystem
+
+
+# equations with some zero coefficients and magnitudes from 1e-3 to 1e9, where eliminating a
+# column by rounding alone leaves residues above the tolerance
+def random_equations(seed, dimension=4):
+    rng = random.Random(seed)
+    return [SparseEquation(dict((j, rng.choice([0, rng.uniform(-1, 1) * 10 ** rng.randint(-3, 9)]))
+                                for j in range(dimension)), rng.uniform(-10, 10))
+            for _ in range(dimension)]
+
+
+@pytest.mark.parametrize('seed', range(0, 2000, 7))
+def test_pivot_columns_are_eliminated_from_the_other_rows(seed):
+    pivots, inconsistent = SparseLinearSystem(random_equations(seed), 4).eliminate()
+
+    columns = [c for c, row, constant in pivots]
+    assert len(set(columns)) == len(columns)
+    for k, (c, row, constant) in enumerate(pivots):
+        assert all(c not in later for c_1, later, constant_1 in pivots[k + 1:])
+
+
+def test_solution_matches_dense_elimination():
+    planes = [Plane(normal_vector=[5.262, 2.739, -9.878], constant_term=-3.441),
+              Plane(normal_vector=[5.111, 6.358, 7.638], constant_term=-2.152),
+              Plane(normal_vector=[2.016, -9.924, -1.367], constant_term=-9.278),
+              Plane(normal_vector=[2.167, -13.543, -18.883], constant_term=-10.567)]
+
+    sparse = SparseLinearSystem.from_planes(planes)
+
+    assert sparse.solution() == pytest.approx([-1.177, 0.707, -0.083], abs=1e-3)
+    assert sparse.characterise_results() == LinearSystem(planes).characterise_results()
+
+
+def test_no_and_infinite_solutions():
+    parallel = [SparseEquation({0: 1, 1: 1}, 1), SparseEquation({0: 2, 1: 2}, 3)]
+    same = [SparseEquation({0: 1, 1: 1}, 1), SparseEquation({0: 2, 1: 2}, 2)]
+
+    assert SparseLinearSystem(parallel, 2).solution() == SparseLinearSystem.NO_SOLUTIONS_MSG
+    assert SparseLinearSystem(same, 2).solution() == SparseLinearSystem.INF_SOLUTIONS_MSG
+
+
+def test_large_sparse_system():
+    rng = np.random.default_rng(0)
+    dimension = 200
+    a = np.diag(rng.uniform(1, 2, dimension)) + np.diag(rng.uniform(-0.5, 0.5, dimension - 1), 1)
+    a[rng.integers(dimension, size=50), rng.integers(dimension, size=50)] += rng.uniform(-0.1, 0.1, 50)
+    b = rng.uniform(-1, 1, dimension)
+
+    equations = [SparseEquation(dict(enumerate(row)), constant) for row, constant in zip(a, b)]
+
+    assert SparseLinearSystem(equations, dimension).solution() == pytest.approx(np.linalg.solve(a, b).tolist())
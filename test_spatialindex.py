@@ -0,0 +1,49 @@
+import math
+
+from hyperplane import Hyperplane
+from line import Line
+from spatialindex import HyperplaneIndex
+
+
+def test_queries():
+    index = HyperplaneIndex(2)
+    lines = [Line([4.046, 2.836], 1.21), Line([10.115, 7.09], 3.025), Line([7.204, 3.182], 8.68)]
+    for line in lines:
+        index.insert(line)
+
+    assert index.parallel_to(Line([-2.023, -1.418], 5)) == lines[:2]
+    assert index.within_distance([0, 0], 0.5) == lines[:2]
+    assert index.intersecting_box([0, 0], [1, 1]) == lines
+
+
+def test_parallel_to_across_direction_cells():
+    index = HyperplaneIndex(2, direction_resolution=0.05, tolerance=1e-6)
+    angle = math.asin(0.025)
+    members = [Line([math.cos(angle + d), math.sin(angle + d)], 1.0) for d in (-1e-7, 1e-7, 1e-3)]
+    handles = [index.insert(m) for m in members]
+
+    assert index.direction_key(members[0].normal_vector) != \
+        index.direction_key(members[1].normal_vector)
+    assert index.parallel_to(members[0]) == members[:2]
+
+    index.remove(handles[0])
+    assert index.parallel_to(members[0]) == members[1:2]
+
+
+def test_parallel_to_in_many_dimensions():
+    dimension = 24
+    index = HyperplaneIndex(dimension)
+    hyperplanes = []
+    for i in range(dimension):
+        normal = [0.0] * dimension
+        normal[i] = 1.0
+        hyperplanes.append(Hyperplane(normal, float(i)))
+        index.insert(hyperplanes[-1])
+
+    normal = [0.0] * dimension
+    normal[3] = -2.0
+    assert index.parallel_to(Hyperplane(normal, 1.0)) == [hyperplanes[3]]
+
+    diagonal = Hyperplane([1.0] * dimension, 0.0)
+    index.insert(diagonal)
+    assert index.parallel_to(Hyperplane([-3.0] * dimension, 1.0)) == [diagonal]
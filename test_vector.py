@@ -0,0 +1,146 @@
+import copy
+import pickle
+import re
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from vector import DECIMAL, FLOAT, Vector
+
+
+@pytest.mark.parametrize('coordinates', [['x'], [1, 'y'], [None], [[1]]])
+@pytest.mark.parametrize('mode', [FLOAT, DECIMAL])
+def test_non_numeric_coordinates(coordinates, mode):
+    with pytest.raises(ValueError, match=Vector.COORDINATES_MUST_BE_NUMBERS_MSG):
+        Vector(coordinates, mode)
+
+
+@pytest.mark.parametrize('coordinates', [[], (), np.array([])])
+def test_empty_coordinates(coordinates):
+    with pytest.raises(ValueError, match=Vector.COORDINATES_MUST_BE_NONEMPTY_MSG):
+        Vector(coordinates)
+
+
+def test_non_iterable_coordinates():
+    with pytest.raises(TypeError, match=Vector.COORDINATES_MUST_BE_ITERABLE_MSG):
+        Vector(3)
+
+
+def test_unknown_mode():
+    with pytest.raises(ValueError, match=re.escape(Vector.UNKNOWN_NUMERIC_MODE_MSG)):
+        Vector([1, 2], 'complex')
+
+
+def test_iterables_and_arrays_are_accepted():
+    assert Vector(x for x in [1, 2]) == Vector([1, 2])
+    assert Vector(np.array([1.5, 2.5])) == Vector([1.5, 2.5])
+
+
+def test_float_mode():
+    v = Vector([1, '2', Decimal('0.5')])
+
+    assert v.mode == FLOAT
+    assert v.coordinates == (1.0, 2.0, 0.5)
+    assert all(type(x) is float for x in v.coordinates)
+    assert v.plus(Vector([0.1, 0.2, 0.3])).coordinates == (1.1, 2.2, 0.8)
+
+
+def test_decimal_mode_is_exact():
+    v = Vector([0.1, '0.2', 3], DECIMAL)
+
+    assert v.coordinates == (Decimal('0.1'), Decimal('0.2'), Decimal('3'))
+    assert v.plus(Vector([0.2, 0.1, 0], DECIMAL)).coordinates == (Decimal('0.3'), Decimal('0.3'), Decimal('3'))
+    assert v.multiply(0.1).coordinates == (Decimal('0.01'), Decimal('0.02'), Decimal('0.3'))
+    assert Vector([3, 4], DECIMAL).magnitude() == Decimal(5)
+
+
+def test_mixed_modes_take_the_left_operand_mode():
+    d = Vector([0.1, 0.2], DECIMAL)
+    f = Vector([0.1, 0.2])
+
+    assert d.plus(f).mode == DECIMAL
+    assert d.plus(f).coordinates == (Decimal('0.2'), Decimal('0.4'))
+    assert f.plus(d).mode == FLOAT
+    assert d.dot_product(f) == Decimal('0.05')
+
+
+def test_vectors_are_immutable():
+    v = Vector([1, 2])
+
+    with pytest.raises(AttributeError, match=Vector.IMMUTABLE_MSG):
+        v.coordinates = (3, 4)
+    with pytest.raises(AttributeError, match=Vector.IMMUTABLE_MSG):
+        v.extra = 1
+    with pytest.raises(AttributeError, match=Vector.IMMUTABLE_MSG):
+        del v.coordinates
+    assert v.coordinates == (1.0, 2.0)
+
+
+def test_equal_vectors_hash_alike():
+    assert Vector([1, 2]) == Vector([1.0, 2.0])
+    assert hash(Vector([1, 2])) == hash(Vector([1.0, 2.0]))
+    assert len({Vector([1, 2]), Vector([1, 2]), Vector([2, 1])}) == 2
+    assert Vector([1, 2]) != (1.0, 2.0)
+
+
+def test_copies_and_pickles():
+    v = Vector([3, 4], DECIMAL)
+    v.direction()
+
+    assert copy.copy(v) is v and copy.deepcopy(v) is v
+    w = pickle.loads(pickle.dumps(v))
+    assert w == v and w.mode == DECIMAL
+    assert not hasattr(w, '_magnitude') and not hasattr(w, '_direction')
+
+
+@pytest.mark.parametrize('mode', [FLOAT, DECIMAL])
+def test_magnitude_and_direction_are_cached(mode):
+    v = Vector([3, 4], mode)
+
+    assert not hasattr(v, '_magnitude') and not hasattr(v, '_direction')
+    assert v.magnitude() == 5
+    assert v._magnitude == 5
+    direction = v.direction()
+    assert direction.coordinates == pytest.approx(Vector([0.6, 0.8], mode).coordinates)
+    assert v.direction() is direction
+
+
+def test_cached_magnitude_is_not_shared_between_results():
+    v = Vector([3, 4])
+    v.magnitude()
+
+    assert v.multiply(2).magnitude() == 10
+    assert v.plus(v).magnitude() == 10
+
+
+def test_zero_vector_direction_is_not_cached():
+    v = Vector([0, 0])
+
+    for _ in range(2):
+        with pytest.raises(Exception, match=Vector.CANNOT_NORMALIZE_ZERO_VECTOR_MSG):
+            v.direction()
+    assert not hasattr(v, '_direction')
+
+
+def test_projection_onto_zero_vector():
+    with pytest.raises(Exception, match=Vector.NO_UNIQUE_PARALLEL_COMPONENT_MSG):
+        Vector([1, 2]).projection(Vector([0, 0]))
+
+
+@pytest.mark.parametrize('mode', [FLOAT, DECIMAL])
+def test_orthogonal_to_zero_vector(mode):
+    with pytest.raises(Exception, match=Vector.NO_UNIQUE_ORTHOGONAL_COMPONENT_MSG):
+        Vector([1, 2], mode).orthogonal(Vector([0, 0], mode))
+
+
+def test_projection_and_orthogonal_components():
+    v = Vector([3.039, 1.879])
+    b = Vector([0.825, 2.036])
+
+    parallel = v.projection(b)
+    orthogonal = v.orthogonal(b)
+
+    assert parallel.is_parallel(b)
+    assert orthogonal.is_orthogonal(b)
+    assert parallel.plus(orthogonal).coordinates == pytest.approx(v.coordinates)
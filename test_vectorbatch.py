@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+
+from vector import Vector
+from vectorbatch import VectorBatch
+
+VECTORS = [Vector([8.462, 7.893, -8.187]), Vector([-8.987, -9.838, 5.031]), Vector([3.039, 1.879, 0.825])]
+VECTORS_1 = [Vector([6.984, -5.975, 4.778]), Vector([-4.268, -1.861, -8.866]), Vector([1.0, -2.0, 3.0])]
+SINGLE = Vector([0.5, -1.5, 2.0])
+
+
+def floats(values):
+    if isinstance(values, Vector):
+        return [float(x) for x in values.coordinates]
+    return float(values)
+
+
+def assert_close(result, expected):
+    if isinstance(result, VectorBatch):
+        result = result.coordinates
+    assert result.shape == np.shape(expected)
+    assert np.allclose(result, expected, rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize('op', ['plus', 'minus', 'dot_product', 'angle', 'projection', 'orthogonal',
+                                'cross_product', 'parallelogram_area', 'triangle_area'])
+def test_binary_ops_match_vector(op):
+    batch = VectorBatch.from_vectors(VECTORS)
+    batch_1 = VectorBatch.from_vectors(VECTORS_1)
+
+    expected = [floats(getattr(v, op)(w)) for v, w in zip(VECTORS, VECTORS_1)]
+    assert_close(getattr(batch, op)(batch_1), expected)
+
+    broadcast = [floats(getattr(v, op)(SINGLE)) for v in VECTORS]
+    assert_close(getattr(batch, op)(SINGLE), broadcast)
+
+
+def test_angle_in_degrees_matches_vector():
+    batch = VectorBatch.from_vectors(VECTORS)
+
+    expected = [v.angle(w, in_degrees=True) for v, w in zip(VECTORS, VECTORS_1)]
+    assert batch.angle(VectorBatch.from_vectors(VECTORS_1), in_degrees=True).tolist() == pytest.approx(expected)
+
+
+def test_unary_ops_match_vector():
+    batch = VectorBatch.from_vectors(VECTORS)
+
+    assert batch.magnitude().tolist() == pytest.approx([v.magnitude() for v in VECTORS])
+    assert_close(batch.direction(), [floats(v.direction()) for v in VECTORS])
+
+
+def test_multiply_by_one_scalar_or_one_per_vector():
+    batch = VectorBatch.from_vectors(VECTORS)
+
+    assert_close(batch.multiply(2.5), [floats(v.multiply(2.5)) for v in VECTORS])
+    assert_close(batch.multiply([1, -2, 0.5]), [floats(v.multiply(k)) for v, k in zip(VECTORS, [1, -2, 0.5])])
+
+
+def test_round_trip_and_indexing():
+    batch = VectorBatch.from_vectors(VECTORS)
+
+    assert batch.to_vectors() == VECTORS
+    assert batch[1] == VECTORS[1]
+    assert batch[1:] == VectorBatch.from_vectors(VECTORS[1:])
+    assert len(batch) == 3 and batch.dimension == 3
+
+
+def test_equality_with_other_types():
+    batch = VectorBatch.from_vectors(VECTORS)
+
+    assert batch == VectorBatch(batch.coordinates.copy())
+    assert batch != VectorBatch.from_vectors(VECTORS_1)
+    assert not batch == 3
+    assert batch != None  # noqa: E711
+    assert batch != VECTORS[0]
+    assert batch.__eq__(3) is NotImplemented
+
+
+def test_errors():
+    batch = VectorBatch.from_vectors(VECTORS)
+    zero = VectorBatch([[1.0, 2.0, 3.0], [0.0, 0.0, 0.0]])
+
+    with pytest.raises(Exception, match=VectorBatch.ALL_VECTORS_MUST_BE_IN_SAME_DIM_MSG):
+        batch.plus(Vector([1, 2]))
+    with pytest.raises(Exception, match=VectorBatch.ALL_VECTORS_MUST_BE_IN_SAME_DIM_MSG):
+        VectorBatch.from_vectors([Vector([1, 2]), Vector([1, 2, 3])])
+    with pytest.raises(Exception, match=VectorBatch.CANNOT_NORMALIZE_ZERO_VECTOR_MSG):
+        zero.direction()
+    with pytest.raises(Exception, match=VectorBatch.NO_UNIQUE_ORTHOGONAL_COMPONENT_MSG):
+        batch[:2].orthogonal(zero)
+    with pytest.raises(Exception, match=VectorBatch.CROSS_PRODUCT_NEEDS_3D_MSG):
+        VectorBatch([[1.0, 2.0]]).cross_product(Vector([1, 2]))
+    with pytest.raises(ValueError):
+        VectorBatch(np.zeros((0, 3)))
@@ -1,85 +1,159 @@
 import math
 from decimal import Decimal
 
+FLOAT = 'float'
+DECIMAL = 'decimal'
+
+
+# floats go through repr so that 0.1 becomes Decimal('0.1') rather than its binary expansion
+def to_decimal(x):
+    if isinstance(x, float):
+        return Decimal(repr(x))
+    return Decimal(x)
+
+
+NUMERIC_TYPES = {FLOAT: float, DECIMAL: to_decimal}
+
+
 class Vector(object):
-    def __init__(self, coordinates):
-        try:
-            if not coordinates:
-                raise ValueError
-            self.coordinates = tuple(coordinates)
-            self.dimension = len(coordinates)
 
-        except ValueError:
-            raise ValueError('The coordinates must be nonempty')
+    # no instance __dict__; _magnitude and _direction are filled in on first use
+    __slots__ = ('coordinates', 'mode', '_magnitude', '_direction')
 
+    CANNOT_NORMALIZE_ZERO_VECTOR_MSG = 'Cannot normalize the zero vector'
+    NO_UNIQUE_PARALLEL_COMPONENT_MSG = 'No unique parallel component'
+    NO_UNIQUE_ORTHOGONAL_COMPONENT_MSG = 'No unique orthogonal component'
+    UNKNOWN_NUMERIC_MODE_MSG = 'The numeric mode must be one of {}'.format(sorted(NUMERIC_TYPES))
+    IMMUTABLE_MSG = 'Vectors are immutable'
+    COORDINATES_MUST_BE_ITERABLE_MSG = 'The coordinates must be an iterable'
+    COORDINATES_MUST_BE_NONEMPTY_MSG = 'The coordinates must be nonempty'
+    COORDINATES_MUST_BE_NUMBERS_MSG = 'The coordinates must be numbers'
+
+    NUM_DECIMAL_PLACES = 3
+
+    # mode selects the coordinate type: FLOAT (float64) or DECIMAL (exact Decimal)
+    def __init__(self, coordinates, mode=FLOAT):
+        try:
+            coordinates = tuple(coordinates)
         except TypeError:
-            raise TypeError('The coordinates must be an iterable')
+            raise TypeError(self.COORDINATES_MUST_BE_ITERABLE_MSG)
+
+        if not coordinates:
+            raise ValueError(self.COORDINATES_MUST_BE_NONEMPTY_MSG)
+        if mode not in NUMERIC_TYPES:
+            raise ValueError(self.UNKNOWN_NUMERIC_MODE_MSG)
+
+        # Decimal reports a malformed string as InvalidOperation, an ArithmeticError
+        try:
+            object.__setattr__(self, 'coordinates', tuple(map(NUMERIC_TYPES[mode], coordinates)))
+        except (TypeError, ValueError, ArithmeticError):
+            raise ValueError(self.COORDINATES_MUST_BE_NUMBERS_MSG)
+        object.__setattr__(self, 'mode', mode)
 
+    # builds a result from coordinates that are already of the right numeric type
+    @classmethod
+    def _from_coordinates(cls, coordinates, mode):
+        v = cls.__new__(cls)
+        object.__setattr__(v, 'coordinates', coordinates)
+        object.__setattr__(v, 'mode', mode)
+        return v
 
+    def __setattr__(self, name, value):
+        raise AttributeError(self.IMMUTABLE_MSG)
+
+    def __delattr__(self, name):
+        raise AttributeError(self.IMMUTABLE_MSG)
+
+    # pickling and copying rebuild from the coordinates, the caches are not carried over
+    def __reduce__(self):
+        return (Vector._from_coordinates, (self.coordinates, self.mode))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    @property
+    def dimension(self):
+        return len(self.coordinates)
+
+    # returns the other vector's coordinates in this vector's numeric type
+    def _coordinates_of(self, vector):
+        if vector.mode == self.mode:
+            return vector.coordinates
+        return tuple(map(NUMERIC_TYPES[self.mode], vector.coordinates))
+
+    # rounding only happens here, arithmetic keeps full precision
     def __str__(self):
-        return 'Vector: {}'.format(self.coordinates)
+        return 'Vector: {}'.format(tuple(round(float(x), self.NUM_DECIMAL_PLACES) for x in self.coordinates))
 
 
     def __eq__(self, v):
+        if not isinstance(v, Vector):
+            return NotImplemented
         return self.coordinates == v.coordinates
-        
+
+    def __hash__(self):
+        return hash(self.coordinates)
+
     def plus(self, vector):
-        result = []
-        
-        for x in range(self.dimension):
-            result.append(float("%.3f" % (Decimal(self.coordinates[x]) + Decimal(vector.coordinates[x]))))
-            
-        return Vector(result)
+        other = self._coordinates_of(vector)
+        return Vector._from_coordinates(tuple([x + y for x, y in zip(self.coordinates, other)]), self.mode)
         
     def minus(self, vector):
-        result = []
-        
-        for x in range(self.dimension):
-            result.append(float("%.3f" % (self.coordinates[x] - vector.coordinates[x])))
-            
-        return Vector(result)
+        other = self._coordinates_of(vector)
+        return Vector._from_coordinates(tuple([x - y for x, y in zip(self.coordinates, other)]), self.mode)
     
     
     def multiply(self, scalar):
-        result = []
-        for x in range(self.dimension):
-            result.append(round(Decimal(self.coordinates[x]) * scalar, 3))
-            
-        return Vector(result)
+        scalar = NUMERIC_TYPES[self.mode](scalar)
+        return Vector._from_coordinates(tuple([x * scalar for x in self.coordinates]), self.mode)
        
     # refers to how much movement a vector quantifies
     def magnitude(self):
-        result = []
-        
-        for x in range(self.dimension):
-            result.append(self.coordinates[x]**2)
-        
-        return math.sqrt(sum(result))
+        try:
+            return self._magnitude
+
+        except AttributeError:
+            result = sum([x * x for x in self.coordinates])
+            result = result.sqrt() if self.mode == DECIMAL else math.sqrt(result)
+
+            object.__setattr__(self, '_magnitude', result)
+            return result
         
     # refers to where a vector's movement is pointed
     # returns Normalised vector (process of finding a unit vector in the same direction as a given vector)
     def direction(self):
-        magnitude_result = self.magnitude()
-        normalised_unit = 1.0 / magnitude_result
-            
-        return self.multiply(normalised_unit)
+        try:
+            return self._direction
+
+        except AttributeError:
+            magnitude_result = self.magnitude()
+            if not magnitude_result:
+                raise Exception(self.CANNOT_NORMALIZE_ZERO_VECTOR_MSG)
+
+            normalised_unit = 1 / magnitude_result
+            result = self.multiply(normalised_unit)
+
+            object.__setattr__(self, '_direction', result)
+            return result
        
     # allows us to find the angle between two vectors
     def dot_product(self, vector):
-        result = []
-        
-        for x in range(self.dimension):
-            result.append((self.coordinates[x] * vector.coordinates[x]))
-            
-        return sum(result)
+        other = self._coordinates_of(vector)
+        return sum([x * y for x, y in zip(self.coordinates, other)])
        
     # returns the angle between two vectors
     def angle(self, vector, in_degrees=False):
         try:
             magnitude_result = self.magnitude()
             magnitude_result_1 = vector.magnitude()
+            if not magnitude_result or not magnitude_result_1:
+                raise Exception(self.CANNOT_NORMALIZE_ZERO_VECTOR_MSG)
             
-            result = math.acos(self.dot_product(vector) / (magnitude_result * magnitude_result_1))
+            cosine = float(self.dot_product(vector)) / float(magnitude_result * magnitude_result_1)
+            result = math.acos(max(-1.0, min(1.0, cosine)))
             
             degrees_per_radions = 180 / math.pi
             if in_degrees:
@@ -92,37 +166,27 @@ class Vector(object):
                 raise Exception('Cannot compute an angle with 0 vector')
             else:
                 raise e
+
+    def is_zero(self, tolerance=1e-10):
+        return self.magnitude() < tolerance
     
     # Checks if vector is scalar multiple of other vector
-    def is_parallel(self, vector):
-        zero_vector = self.multiply(0)
-        
-        if vector == zero_vector:
+    def is_parallel(self, vector, tolerance=1e-10):
+        if vector.is_zero(tolerance):
             return True
         
-        normalised_vector = self.direction()
-        normalised_vector_1 = vector.direction()
-        inverted_vector = normalised_vector.multiply(-1)
+        normalised_vector = self.direction().coordinates
+        normalised_vector_1 = self._coordinates_of(vector.direction())
         
-        if normalised_vector_1 == normalised_vector or normalised_vector_1 == inverted_vector:
-            return True
-        else:
-            return False
+        same_direction = all(abs(x - y) < tolerance for x, y in zip(normalised_vector, normalised_vector_1))
+        opposite_direction = all(abs(x + y) < tolerance for x, y in zip(normalised_vector, normalised_vector_1))
+        
+        return same_direction or opposite_direction
     
     # Vectors are orthogonal is their dot product is 0
     # Note: 0 vector is orthogonal to all vectors
-    def is_orthogonal(self, vector):
-        dot_result = self.dot_product(vector)
-        
-        if dot_result == 0:
-            return True
-            
-        angle_degrees = self.angle(vector, True)
-        
-        if angle_degrees == 90:
-            return True    
-        else:
-            return False
+    def is_orthogonal(self, vector, tolerance=1e-10):
+        return abs(self.dot_product(vector)) < tolerance
     
     # returns projection one vector onto another
     def projection(self, vector):
@@ -138,30 +202,27 @@ class Vector(object):
             else:
                 raise e
         
-    # Component of first vector orthogonal to second vector
+    # Component of first vector orthogonal to second vector; projection has already turned
+    # the zero vector error into its own parallel component message
     def orthogonal(self, vector):
         try:
             projection_result = self.projection(vector)
             return self.minus(projection_result)
         
         except Exception as e:
-            if str(e) == self.CANNOT_NORMALIZE_ZERO_VECTOR_MSG:
+            if str(e) == self.NO_UNIQUE_PARALLEL_COMPONENT_MSG:
                 raise Exception(self.NO_UNIQUE_ORTHOGONAL_COMPONENT_MSG)
             else:
                 raise e
         
     # returns vector that is orthogonal to both vectors
     def cross_product(self, vector):
-        cp_result = []
-        
         x_1, y_1, z_1 = self.coordinates
-        x_2, y_2, z_2 = vector.coordinates
+        x_2, y_2, z_2 = self._coordinates_of(vector)
         
-        cp_result.append(float("%.3f" % (y_1*z_2 - y_2*z_1)))
-        cp_result.append(float("%.3f" % -(x_1*z_2 - x_2*z_1)))
-        cp_result.append(float("%.3f" % (x_1*y_2 - x_2*y_1)))
+        cp_result = (y_1*z_2 - y_2*z_1, -(x_1*z_2 - x_2*z_1), x_1*y_2 - x_2*y_1)
         
-        return Vector(cp_result)
+        return Vector._from_coordinates(cp_result, self.mode)
         
     def parallelogram_area(self, vector):
         cp_result = self.cross_product(vector)
@@ -169,7 +230,7 @@ class Vector(object):
         
     def triangle_area(self, vector):
         cp_result = self.cross_product(vector)
-        return 0.5 * cp_result.magnitude()
+        return cp_result.magnitude() / 2
 
 
 ##################################
@@ -0,0 +1,159 @@
+import numpy as np
+
+from vector import Vector
+
+
+class VectorBatch(object):
+
+    CANNOT_NORMALIZE_ZERO_VECTOR_MSG = 'Cannot normalize the zero vector'
+    NO_UNIQUE_PARALLEL_COMPONENT_MSG = 'No unique parallel component'
+    NO_UNIQUE_ORTHOGONAL_COMPONENT_MSG = 'No unique orthogonal component'
+    ALL_VECTORS_MUST_BE_IN_SAME_DIM_MSG = 'All vectors in the batch should live in the same dimension'
+    CROSS_PRODUCT_NEEDS_3D_MSG = 'Cross product is only defined for 3 dimensional vectors'
+
+    # stores N vectors of dimension d as one contiguous (N, d) float64 array
+    def __init__(self, coordinates):
+        try:
+            coordinates = np.ascontiguousarray(coordinates, dtype=np.float64)
+            if coordinates.ndim != 2 or coordinates.size == 0:
+                raise ValueError
+            self.coordinates = coordinates
+            self.count, self.dimension = coordinates.shape
+
+        except ValueError:
+            raise ValueError('The coordinates must be a nonempty (N, d) array')
+
+        except TypeError:
+            raise TypeError('The coordinates must be an iterable')
+
+    @classmethod
+    def from_vectors(cls, vectors):
+        try:
+            d = vectors[0].dimension
+            for v in vectors:
+                assert v.dimension == d
+
+        except AssertionError:
+            raise Exception(cls.ALL_VECTORS_MUST_BE_IN_SAME_DIM_MSG)
+
+        return cls([v.coordinates for v in vectors])
+
+    def to_vectors(self):
+        return [Vector(row) for row in self.coordinates.tolist()]
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return VectorBatch(self.coordinates[i])
+        return Vector(self.coordinates[i].tolist())
+
+    def __str__(self):
+        return 'VectorBatch: {} vectors of dimension {}'.format(self.count, self.dimension)
+
+    def __eq__(self, batch):
+        if not isinstance(batch, VectorBatch):
+            return NotImplemented
+        return np.array_equal(self.coordinates, batch.coordinates)
+
+    # accepts another batch of the same length or a single Vector to broadcast
+    def _operand(self, vector):
+        if isinstance(vector, VectorBatch):
+            other = vector.coordinates
+        elif isinstance(vector, Vector):
+            other = np.asarray(vector.coordinates, dtype=np.float64)[np.newaxis, :]
+        else:
+            other = np.asarray(vector, dtype=np.float64)
+
+        if other.shape[-1] != self.dimension:
+            raise Exception(self.ALL_VECTORS_MUST_BE_IN_SAME_DIM_MSG)
+
+        return other
+
+    # accepts a single scalar or one scalar per vector
+    def _scalars(self, scalar):
+        scalar = np.asarray(scalar, dtype=np.float64)
+        if scalar.ndim == 1:
+            scalar = scalar[:, np.newaxis]
+        return scalar
+
+    def plus(self, vector):
+        return VectorBatch(self.coordinates + self._operand(vector))
+
+    def minus(self, vector):
+        return VectorBatch(self.coordinates - self._operand(vector))
+
+    def multiply(self, scalar):
+        return VectorBatch(self.coordinates * self._scalars(scalar))
+
+    # returns the magnitude of every vector as an (N,) array
+    def magnitude(self):
+        return np.sqrt(np.einsum('ij,ij->i', self.coordinates, self.coordinates))
+
+    # returns the normalised batch, raising if any vector is the zero vector
+    def direction(self):
+        magnitudes = self.magnitude()
+        if not magnitudes.all():
+            raise Exception(self.CANNOT_NORMALIZE_ZERO_VECTOR_MSG)
+
+        return VectorBatch(self.coordinates / magnitudes[:, np.newaxis])
+
+    def dot_product(self, vector):
+        other = self._operand(vector)
+        return (self.coordinates * other).sum(axis=1)
+
+    def angle(self, vector, in_degrees=False):
+        other = self._operand(vector)
+        magnitudes = self.magnitude() * np.sqrt((other * other).sum(axis=1))
+        if not magnitudes.all():
+            raise Exception('Cannot compute an angle with 0 vector')
+
+        cosines = np.clip(self.dot_product(other) / magnitudes, -1.0, 1.0)
+        result = np.arccos(cosines)
+
+        if in_degrees:
+            return np.degrees(result)
+        else:
+            return result
+
+    # returns the projection of every vector onto the matching vector of the other batch
+    def projection(self, vector):
+        other = self._operand(vector)
+        squared_magnitudes = (other * other).sum(axis=1)
+        if not squared_magnitudes.all():
+            raise Exception(self.NO_UNIQUE_PARALLEL_COMPONENT_MSG)
+
+        weights = self.dot_product(other) / squared_magnitudes
+        return VectorBatch(other * weights[:, np.newaxis])
+
+    def orthogonal(self, vector):
+        try:
+            return self.minus(self.projection(vector))
+
+        except Exception as e:
+            if str(e) == self.NO_UNIQUE_PARALLEL_COMPONENT_MSG:
+                raise Exception(self.NO_UNIQUE_ORTHOGONAL_COMPONENT_MSG)
+            else:
+                raise e
+
+    def cross_product(self, vector):
+        if self.dimension != 3:
+            raise Exception(self.CROSS_PRODUCT_NEEDS_3D_MSG)
+
+        other = self._operand(vector)
+        return VectorBatch(np.cross(self.coordinates, other))
+
+    def parallelogram_area(self, vector):
+        return self.cross_product(vector).magnitude()
+
+    def triangle_area(self, vector):
+        return 0.5 * self.cross_product(vector).magnitude()
+
+
+##################################
+# batch = VectorBatch.from_vectors([Vector([8.462, 7.893, -8.187]), Vector([-8.987, -9.838, 5.031])])
+# batch_1 = VectorBatch.from_vectors([Vector([6.984, -5.975, 4.778]), Vector([-4.268, -1.861, -8.866])])
+# print(batch.cross_product(batch_1).to_vectors()[0])
+# print(batch.parallelogram_area(batch_1))
+# print(batch.magnitude())